@@ -0,0 +1,178 @@
+"""
+Query Service Benchmark
+Sentetik takvim ve rapor geçmişiyle sorgu servisini (python src/main.py --serve)
+ayrı bir süreçte başlatır ve keep-alive bağlantılarla uç noktalara istek
+gönderir. İlk istekler önbelleği doldurur (takvim bir kez okunur); ölçüm bu
+ısınmadan sonraki istekleri kapsar. --touch verilirse ölçüm ortasında rapora
+bir kayıt eklenir ve yanıtların yenilendiği kontrol edilir.
+
+Kullanım:
+    python benchmarks/bench_query_service.py --rows 10000 --requests 5000 --clients 4
+"""
+
+import argparse
+import http.client
+import json
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+BENCH_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(BENCH_DIR))
+
+from generate_calendar import generate_calendar, generate_report_history
+
+ENDPOINTS = ["/health", "/plan", "/stats", "/failed?limit=20", "/forecast?days=60"]
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _wait_ready(port: int, timeout: float = 30.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.5):
+                return
+        except OSError:
+            time.sleep(0.05)
+    raise RuntimeError("Sorgu servisi başlamadı")
+
+
+def _get(conn: http.client.HTTPConnection, path: str) -> tuple:
+    conn.request("GET", path)
+    response = conn.getresponse()
+    return response.status, response.read()
+
+
+def _client(port: int, count: int, latencies: list, errors: list):
+    conn = http.client.HTTPConnection("127.0.0.1", port)
+    try:
+        for i in range(count):
+            started = time.perf_counter()
+            status, _ = _get(conn, ENDPOINTS[i % len(ENDPOINTS)])
+            latencies.append(time.perf_counter() - started)
+            if status != 200:
+                errors.append(status)
+    finally:
+        conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sorgu servisi benchmark'ı")
+    parser.add_argument("--rows", type=int, default=10000, help="Takvim satır sayısı")
+    parser.add_argument("--history-rows", type=int, default=50000, help="Rapor geçmişi kayıt sayısı")
+    parser.add_argument("--requests", type=int, default=5000, help="Toplam istek sayısı")
+    parser.add_argument("--clients", type=int, default=4, help="Eşzamanlı keep-alive bağlantı sayısı")
+    parser.add_argument("--touch", action="store_true", help="Ölçüm sonrası rapora kayıt ekleyip yenilenmeyi doğrula")
+    parser.add_argument("--json", dest="json_output", help="Sonucu JSON dosyasına yaz")
+    parser.add_argument("--verbose", action="store_true", help="Servis loglarını göster")
+    args = parser.parse_args()
+
+    workspace = Path(tempfile.mkdtemp(prefix="bench_query_"))
+    port = _free_port()
+    process = None
+    try:
+        (workspace / "logs").mkdir()
+        generate_calendar(str(workspace / "data" / "Merkezi_Takvimi.xlsx"), args.rows)
+        if args.history_rows:
+            generate_report_history(str(workspace / "data" / "mail_raporu"), args.history_rows)
+
+        env = dict(os.environ, LOG_FILE="", QUERY_SERVICE_PORT=str(port))
+        output = None if args.verbose else subprocess.DEVNULL
+        process = subprocess.Popen(
+            [sys.executable, str(ROOT / "src" / "main.py"), "--serve"],
+            cwd=workspace, env=env, stdout=output, stderr=output
+        )
+        _wait_ready(port)
+
+        # Isınma: her uç noktanın ilk isteği önbelleği doldurur
+        conn = http.client.HTTPConnection("127.0.0.1", port, timeout=300)
+        warmup = {}
+        for path in ENDPOINTS:
+            started = time.perf_counter()
+            status, _ = _get(conn, path)
+            warmup[path] = round(time.perf_counter() - started, 4)
+            if status != 200:
+                raise RuntimeError(f"{path}: HTTP {status}")
+
+        latencies, errors = [], []
+        per_client = args.requests // args.clients
+        threads = [
+            threading.Thread(target=_client, args=(port, per_client, latencies, errors))
+            for _ in range(args.clients)
+        ]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+
+        refreshed = None
+        if args.touch:
+            from report_store import ReportStore
+            _, before = _get(conn, "/stats")
+            store = ReportStore(str(workspace / "data" / "mail_raporu"))
+            store.append({
+                "Gönderim Tarihi": time.strftime("%Y-%m-%d"), "Gönderim Saati": time.strftime("%H:%M:%S"),
+                "İhale No": 1, "İhale Adı": "Benchmark", "Yönetici": "Benchmark",
+                "Yönetici Mail": "benchmark@example.com", "Hatırlatma Tipi": "1_gun", "Kalan Gün": 1,
+                "Başlangıç Tarihi": time.strftime("%Y-%m-%d"), "Durum": "Başarılı",
+                "Hata Mesajı": None, "Retry Sayısı": 0
+            })
+            store.close()
+            _, after = _get(conn, "/stats")
+            refreshed = json.loads(after)["toplam_gonderim"] == json.loads(before)["toplam_gonderim"] + 1
+        conn.close()
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+        shutil.rmtree(workspace, ignore_errors=True)
+
+    latencies.sort()
+    result = {
+        "rows": args.rows,
+        "history_rows": args.history_rows,
+        "requests": len(latencies),
+        "clients": args.clients,
+        "elapsed_seconds": round(elapsed, 3),
+        "requests_per_second": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": round(latencies[len(latencies) // 2] * 1000, 3) if latencies else None,
+        "p99_ms": round(latencies[int(len(latencies) * 0.99)] * 1000, 3) if latencies else None,
+        "errors": len(errors),
+        "warmup_seconds": warmup,
+        "refreshed_after_report_change": refreshed
+    }
+
+    print(f"\n🌐 Sorgu Servisi ({args.rows} satırlık takvim, {args.history_rows} rapor kaydı)")
+    print("-" * 60)
+    for path, seconds in warmup.items():
+        print(f"  İlk istek {path:<22} {seconds * 1000:>10.1f} ms")
+    print(f"  {result['requests']} istek, {args.clients} bağlantı: {result['requests_per_second']:.0f} istek/s "
+          f"(p50 {result['p50_ms']} ms, p99 {result['p99_ms']} ms)")
+    if refreshed is not None:
+        print(f"  Rapor değişince yenilendi: {'evet' if refreshed else 'HAYIR'}")
+
+    if args.json_output:
+        Path(args.json_output).write_text(json.dumps(result, indent=2), encoding="utf-8")
+
+    if errors or refreshed is False:
+        print(f"\n❌ {len(errors)} hatalı yanıt" if errors else "\n❌ Yanıtlar rapor değişikliğinden sonra yenilenmedi")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""
+Send Throughput Benchmark
+EmailSender.send_reminders'ı yerel sahte SMTP sunucusuna karşı çalıştırır ve
+mesaj/saniye, p50/p95/p99 gecikme ve retry sayılarını raporlar.
+
+Kullanım:
+    python benchmarks/bench_send.py --count 200 --accounts 2 --latency 0.02
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from fake_smtp import FakeSMTPServer
+
+
+def percentile(values: list, pct: float) -> float:
+    """Nearest-rank yüzdelik"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, int(round(pct / 100.0 * len(ordered))))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def make_reminders(count: int, recipients: int = 50) -> list:
+    """Sentetik hatırlatma listesi üret"""
+    types = [("60_gun", 60), ("30_gun", 30), ("1_gun", 1)]
+    today = datetime.now()
+    reminders = []
+    for i in range(count):
+        tipi, kalan = types[i % len(types)]
+        reminders.append({
+            "ihale_no": i + 1,
+            "ihale_adi": f"Benchmark İhalesi {i + 1}",
+            "yonetici": f"Yönetici {i % recipients}",
+            "yonetici_mail": f"yonetici{i % recipients}@example.com",
+            "baslangic_tarihi": today + timedelta(days=kalan),
+            "kalan_gun": kalan,
+            "hatirlatma_tipi": tipi,
+            "oncelik": "acil" if kalan == 1 else "normal"
+        })
+    return reminders
+
+
+def run_benchmark(args) -> dict:
+    accounts = [
+        {"email": f"sender{i}@example.com", "password": "benchmark"}
+        for i in range(args.accounts)
+    ]
+    users = {acc["email"]: acc["password"] for acc in accounts}
+
+    server = FakeSMTPServer(
+        users=users, tls=not args.no_tls, latency=args.latency, jitter=args.jitter,
+        throttle_rate=args.throttle_rate, throttle_code=args.throttle_code,
+        failure_rate=args.failure_rate, eight_bit_mime=not args.no_8bitmime,
+        bandwidth=args.bandwidth * 1024
+    ).start()
+
+    try:
+        os.environ.update({
+            "SMTP_SERVER": "127.0.0.1",
+            "SMTP_PORT": str(server.port),
+            "SMTP_ACCOUNTS": json.dumps(accounts),
+            "SMTP_RATE_PER_MINUTE": str(args.rate_per_minute),
+            "SMTP_POOL_SIZE": str(args.pool_size),
+            "SMTP_RETRY_DELAYS": args.retry_delays,
+            "TEST_MODE": "False",
+            "MAIL_COMPACT": str(not args.no_compact)
+        })
+
+        # Şablon yolu göreli olduğu için repo kökünden çalış
+        os.chdir(ROOT)
+        from email_sender import EmailSender
+
+        sender = EmailSender()
+        reminders = make_reminders(args.count)
+
+        started = time.perf_counter()
+        result = sender.send_reminders(reminders)
+        elapsed = time.perf_counter() - started
+    finally:
+        server_stats = server.stats.as_dict()
+        server.stop()
+
+    results = result["results"]
+    latencies = [r["latency"] for r in results if r and r.get("latency") is not None]
+    retries = sum(r["retry_count"] for r in results if r)
+
+    return {
+        "count": args.count,
+        "accounts": args.accounts,
+        "elapsed_seconds": round(elapsed, 4),
+        "messages_per_second": round(result["sent_count"] / elapsed, 2) if elapsed else 0.0,
+        "sent": result["sent_count"],
+        "failed": result["failed_count"],
+        "retries": retries,
+        "latency_p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "latency_p95_ms": round(percentile(latencies, 95) * 1000, 2),
+        "latency_p99_ms": round(percentile(latencies, 99) * 1000, 2),
+        "avg_message_bytes": round(server_stats["bytes_received"] / server_stats["messages"]) if server_stats["messages"] else 0,
+        "server": server_stats
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="EmailSender gönderim benchmark'ı")
+    parser.add_argument("--count", type=int, default=100, help="Sentetik hatırlatma sayısı")
+    parser.add_argument("--accounts", type=int, default=1, help="Gönderici hesap sayısı")
+    parser.add_argument("--rate-per-minute", type=int, default=0, help="Hesap başına dakikalık limit (0 = limitsiz)")
+    parser.add_argument("--pool-size", type=int, default=1, help="Hesap başına bağlantı sayısı")
+    parser.add_argument("--retry-delays", default="0.05,0.1,0.2", help="Retry bekleme süreleri (saniye)")
+    parser.add_argument("--latency", type=float, default=0.0, help="Sunucu mesaj kabul gecikmesi (saniye)")
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--bandwidth", type=float, default=0.0, help="Bağlantı hızı (KB/s, 0 = sınırsız)")
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--throttle-code", type=int, default=451)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--no-tls", action="store_true")
+    parser.add_argument("--no-8bitmime", action="store_true", help="Sunucu 8BITMIME ilan etmesin (quoted-printable)")
+    parser.add_argument("--no-compact", action="store_true", help="Eski mesaj biçimi (base64 HTML, MAIL_COMPACT=false)")
+    parser.add_argument("--json", dest="json_output", help="Sonucu JSON dosyasına yaz")
+    parser.add_argument("--verbose", action="store_true", help="Gönderim loglarını göster")
+    args = parser.parse_args()
+
+    if not args.verbose:
+        logging.disable(logging.CRITICAL)
+
+    summary = run_benchmark(args)
+
+    print("\n📊 Gönderim Benchmark Sonucu")
+    print("-" * 50)
+    print(f"  Mesaj: {summary['count']} ({summary['accounts']} hesap)")
+    print(f"  Süre: {summary['elapsed_seconds']} s")
+    print(f"  Hız: {summary['messages_per_second']} mesaj/s")
+    print(f"  Başarılı / Başarısız: {summary['sent']} / {summary['failed']}")
+    print(f"  Retry: {summary['retries']}")
+    print(f"  Ortalama mesaj boyutu: {summary['avg_message_bytes']} byte")
+    print(f"  Gecikme p50/p95/p99: {summary['latency_p50_ms']} / {summary['latency_p95_ms']} / {summary['latency_p99_ms']} ms")
+    print(f"  Sunucu: {summary['server']}")
+
+    if args.json_output:
+        Path(args.json_output).write_text(json.dumps(summary, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""
+Worker Scaling Benchmark
+Sentetik hatırlatmaları paylaşılan iş kuyruğuna ekler, N ayrı worker süreci
+(python src/main.py --worker) başlatır ve yerel sahte SMTP sunucusuna karşı
+toplam throughput'u ölçer. Her çalıştırmada kayıp ve çift gönderim kontrol
+edilir (sahte sunucu aynı Message-ID ile gelen mesajları sayar).
+
+--kill-after verilirse ilk worker o kadar saniye sonra SIGKILL ile
+öldürülür; kalan worker'lar lease süresi dolunca onun işlerini devralır.
+
+Kullanım:
+    python benchmarks/bench_workers.py --count 400 --workers 1,2,4 --latency 0.02
+    python benchmarks/bench_workers.py --count 200 --workers 3 --kill-after 0.5 --lease 2
+"""
+
+import argparse
+import json
+import logging
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+BENCH_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(BENCH_DIR))
+
+from fake_smtp import FakeSMTPServer
+from bench_send import make_reminders
+
+
+def run_workers(worker_count: int, args) -> dict:
+    """Tek bir worker sayısı için kuyruğu doldur, worker'ları çalıştır ve sonucu doğrula"""
+    from work_queue import WorkQueue
+    from scheduler import Scheduler
+
+    workspace = Path(tempfile.mkdtemp(prefix=f"bench_workers_{worker_count}_"))
+    accounts = [{"email": f"sender{i}@example.com", "password": "benchmark"} for i in range(args.accounts)]
+    server = FakeSMTPServer(latency=args.latency, jitter=args.jitter).start()
+
+    try:
+        shutil.copytree(ROOT / "config", workspace / "config")
+        (workspace / "logs").mkdir()
+        queue_db = workspace / "data" / "gonderim_kuyrugu.db"
+
+        queue = WorkQueue(str(queue_db), lease_seconds=args.lease)
+        # Worker'lar yalnızca zamanlayıcının bugününe ait işleri alır
+        queue.enqueue(make_reminders(args.count), Scheduler().today)
+        queue.close()
+
+        env = dict(os.environ)
+        env.update({
+            "SMTP_SERVER": "127.0.0.1",
+            "SMTP_PORT": str(server.port),
+            "SMTP_ACCOUNTS": json.dumps(accounts),
+            "SMTP_RATE_PER_MINUTE": "0",
+            "SMTP_RETRY_DELAYS": "0.05,0.1,0.2",
+            "TEST_MODE": "False",
+            "WORK_QUEUE_DB": str(queue_db),
+            "WORK_LEASE_SECONDS": str(args.lease),
+            "WORK_CLAIM_BATCH": str(args.batch),
+            "LOG_FILE": "",
+            "METRICS_DIR": str(workspace / "logs")
+        })
+        output = None if args.verbose else subprocess.DEVNULL
+
+        started = time.perf_counter()
+        processes = [
+            subprocess.Popen(
+                [sys.executable, str(ROOT / "src" / "main.py"), "--worker", "--worker-id", f"w{i}"],
+                cwd=workspace, env=env, stdout=output, stderr=output
+            )
+            for i in range(worker_count)
+        ]
+        if args.kill_after is not None:
+            time.sleep(args.kill_after)
+            processes[0].kill()
+        for process in processes:
+            process.wait()
+        elapsed = time.perf_counter() - started
+
+        queue = WorkQueue(str(queue_db))
+        counts = queue.counts()
+        queue.close()
+    finally:
+        server_stats = server.stats.as_dict()
+        server.stop()
+        shutil.rmtree(workspace, ignore_errors=True)
+
+    return {
+        "workers": worker_count,
+        "elapsed_seconds": round(elapsed, 3),
+        "messages_per_second": round(counts["gonderildi"] / elapsed, 2) if elapsed else 0.0,
+        "queue": counts,
+        "server_messages": server_stats["messages"],
+        "duplicates": server_stats["duplicates"],
+        "lost": args.count - counts["gonderildi"] - counts["basarisiz"]
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Kuyruk worker ölçeklenme benchmark'ı")
+    parser.add_argument("--count", type=int, default=400, help="Sentetik hatırlatma sayısı")
+    parser.add_argument("--workers", default="1,2,4", help="Denenecek worker sayıları")
+    parser.add_argument("--accounts", type=int, default=1, help="Gönderici hesap sayısı")
+    parser.add_argument("--latency", type=float, default=0.02, help="Sunucu mesaj kabul gecikmesi (saniye)")
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--lease", type=float, default=30.0, help="Lease süresi (saniye)")
+    parser.add_argument("--batch", type=int, default=5, help="Worker başına tek seferde sahiplenilen iş")
+    parser.add_argument("--kill-after", type=float, help="İlk worker'ı bu kadar saniye sonra öldür")
+    parser.add_argument("--json", dest="json_output", help="Sonucu JSON dosyasına yaz")
+    parser.add_argument("--verbose", action="store_true", help="Worker loglarını göster")
+    args = parser.parse_args()
+
+    if not args.verbose:
+        logging.disable(logging.CRITICAL)
+
+    results = [run_workers(int(n), args) for n in args.workers.split(",")]
+
+    print(f"\n👷 Worker Ölçeklenme ({args.count} mesaj, gecikme {args.latency * 1000:.0f} ms)")
+    print("-" * 78)
+    print(f"{'Worker':>7} {'Süre (s)':>10} {'mesaj/s':>9} {'Hızlanma':>9} {'Gönderildi':>11} {'Başarısız':>10} {'Çift':>5} {'Kayıp':>6}")
+    base = results[0]["messages_per_second"] or None
+    failures = []
+    for result in results:
+        speedup = f"{result['messages_per_second'] / base:.2f}x" if base else "-"
+        print(
+            f"{result['workers']:>7} {result['elapsed_seconds']:>10.3f} {result['messages_per_second']:>9.1f} "
+            f"{speedup:>9} {result['queue']['gonderildi']:>11} {result['queue']['basarisiz']:>10} "
+            f"{result['duplicates']:>5} {result['lost']:>6}"
+        )
+        if result["lost"]:
+            failures.append(f"{result['workers']} worker: {result['lost']} iş tamamlanmadı")
+        # Worker'lar sırayla gönderir: öldürülen worker'ın SMTP kabulünden sonra
+        # yazamadığı en fazla bir sonuç tekrar gönderilebilir
+        allowed = 1 if args.kill_after is not None else 0
+        if result["duplicates"] > allowed:
+            failures.append(f"{result['workers']} worker: {result['duplicates']} çift gönderim")
+
+    if args.json_output:
+        Path(args.json_output).write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+    if failures:
+        print()
+        for failure in failures:
+            print(f"❌ {failure}")
+        sys.exit(1)
+    print("\n✅ Kayıp veya beklenmeyen çift gönderim yok")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+"""
+Startup Time Check
+`python -X importtime src/main.py` çıktısını hatırlatma olmayan bir gün
+(hızlı yol) için ölçer. Ağır bağımlılıkların (pandas, openpyxl, smtplib, email)
+bu yolda hiç import edilmediğini doğrular ve toplam import süresini baseline
+ile karşılaştırır.
+
+Kullanım:
+    python benchmarks/check_startup.py
+    python benchmarks/check_startup.py --save-baseline main
+    python benchmarks/check_startup.py --compare main --budget-ms 150
+"""
+
+import argparse
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+BENCH_DIR = Path(__file__).resolve().parent
+BASELINE_DIR = BENCH_DIR / "baselines"
+sys.path.insert(0, str(BENCH_DIR))
+
+from generate_calendar import generate_calendar
+
+# Hızlı yolda import edilmemesi gereken modüller (ve alt modülleri)
+FORBIDDEN_MODULES = ("pandas", "numpy", "openpyxl", "smtplib", "email.mime", "sqlite3")
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def parse_importtime(stderr: str) -> list:
+    """
+    -X importtime çıktısını ayrıştır
+
+    Returns:
+        list: (modül, self_us, kümülatif_us, derinlik) listesi
+    """
+    entries = []
+    for line in stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            entries.append((module, int(self_us), int(cumulative_us), len(indent) // 2))
+    return entries
+
+
+def prepare_workspace(rows: int) -> Path:
+    """Sentetik takvim ile çalışma klasörü hazırla ve hızlı yol önbelleğini oluştur"""
+    workspace = Path(tempfile.mkdtemp(prefix="startup_"))
+    (workspace / "logs").mkdir()
+    shutil.copytree(ROOT / "config", workspace / "config")
+    generate_calendar(workspace / "data" / "Merkezi_Takvimi.xlsx", rows, due_ratio=0.0)
+
+    # İlk çalıştırma takvimi okur ve sonraki hatırlatma tarihini önbelleğe alır
+    subprocess.run(
+        [sys.executable, str(ROOT / "src" / "main.py")],
+        cwd=workspace, env=_child_env(), capture_output=True, check=False
+    )
+    return workspace
+
+
+def _child_env() -> dict:
+    env = dict(os.environ)
+    env.update({"TEST_MODE": "true", "SMTP_RATE_PER_MINUTE": "0"})
+    return env
+
+
+def measure_startup(workspace: Path) -> dict:
+    """Hızlı yol çalıştırmasının import ölçümleri"""
+    started = time.perf_counter()
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", str(ROOT / "src" / "main.py")],
+        cwd=workspace, env=_child_env(), capture_output=True, text=True, check=False
+    )
+    wall_seconds = time.perf_counter() - started
+
+    entries = parse_importtime(process.stderr)
+    top_level = [(module, cumulative) for module, _, cumulative, depth in entries if depth == 0]
+    imported = {module for module, _, _, _ in entries}
+    forbidden = sorted(
+        module for module in imported
+        if any(module == name or module.startswith(name + ".") for name in FORBIDDEN_MODULES)
+    )
+    return {
+        "exit_code": process.returncode,
+        "fast_path": "takvim değişmedi" in process.stderr,
+        "wall_ms": round(wall_seconds * 1000, 2),
+        "import_ms": round(sum(cumulative for _, cumulative in top_level) / 1000, 2),
+        "module_count": len(imported),
+        "top_imports": [
+            {"module": module, "cumulative_ms": round(cumulative / 1000, 2)}
+            for module, cumulative in sorted(top_level, key=lambda item: -item[1])[:15]
+        ],
+        "forbidden": forbidden
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Başlangıç (import) süresi kontrolü")
+    parser.add_argument("--rows", type=int, default=1000, help="Sentetik takvim satır sayısı")
+    parser.add_argument("--repeat", type=int, default=5, help="Tekrar sayısı (en iyi süre alınır)")
+    parser.add_argument("--budget-ms", type=float, help="Toplam import süresi üst sınırı (ms)")
+    parser.add_argument("--save-baseline", metavar="AD", help="benchmarks/baselines/startup_AD.json olarak kaydet")
+    parser.add_argument("--compare", metavar="AD", help="benchmarks/baselines/startup_AD.json ile karşılaştır")
+    parser.add_argument("--threshold", type=float, default=0.3, help="Regresyon eşiği (0.3 = %%30 yavaşlama)")
+    parser.add_argument("--json", dest="json_output", help="Sonucu JSON dosyasına yaz")
+    args = parser.parse_args()
+
+    workspace = prepare_workspace(args.rows)
+    try:
+        runs = [measure_startup(workspace) for _ in range(args.repeat)]
+    finally:
+        shutil.rmtree(workspace, ignore_errors=True)
+
+    best = min(runs, key=lambda run: run["import_ms"])
+    failures = []
+
+    print("\n🚀 Başlangıç Süresi (hızlı yol)")
+    print("-" * 50)
+    print(f"  Hızlı yol: {'evet' if best['fast_path'] else 'HAYIR'}")
+    print(f"  Import: {best['import_ms']} ms ({best['module_count']} modül)")
+    print(f"  Toplam süreç: {best['wall_ms']} ms")
+    print("  En pahalı importlar:")
+    for item in best["top_imports"][:8]:
+        print(f"    {item['cumulative_ms']:>8.2f} ms  {item['module']}")
+
+    if not best["fast_path"]:
+        failures.append("Çalıştırma hızlı yoldan geçmedi")
+    if best["forbidden"]:
+        failures.append(f"Hızlı yolda ağır modüller import edildi: {', '.join(best['forbidden'][:10])}")
+    if args.budget_ms is not None and best["import_ms"] > args.budget_ms:
+        failures.append(f"Import süresi bütçeyi aştı: {best['import_ms']} ms > {args.budget_ms} ms")
+
+    if args.compare:
+        baseline_file = BASELINE_DIR / f"startup_{args.compare}.json"
+        if baseline_file.exists():
+            baseline = json.loads(baseline_file.read_text(encoding="utf-8"))
+            ratio = best["import_ms"] / baseline["import_ms"] if baseline["import_ms"] else 0.0
+            print(f"  Baseline: {baseline['import_ms']} ms ({ratio:.2f}x)")
+            if ratio > 1 + args.threshold:
+                failures.append(f"Import süresi baseline'a göre {ratio:.2f}x")
+        else:
+            print(f"⚠️  Baseline bulunamadı: {baseline_file}")
+
+    if args.json_output:
+        Path(args.json_output).write_text(json.dumps(best, indent=2), encoding="utf-8")
+
+    if args.save_baseline:
+        BASELINE_DIR.mkdir(parents=True, exist_ok=True)
+        baseline_file = BASELINE_DIR / f"startup_{args.save_baseline}.json"
+        baseline_file.write_text(json.dumps(best, indent=2), encoding="utf-8")
+        print(f"\n💾 Baseline kaydedildi: {baseline_file}")
+
+    if failures:
+        print()
+        for failure in failures:
+            print(f"❌ {failure}")
+        sys.exit(1)
+    print("\n✅ Başlangıç kontrolü geçti")
+
+
+if __name__ == "__main__":
+    main()
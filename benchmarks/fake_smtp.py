@@ -0,0 +1,368 @@
+"""
+Fake SMTP Server
+Office 365 yerine yerel yük testi için kullanılan sahte SMTP sunucusu.
+
+STARTTLS (self-signed sertifika), AUTH PLAIN/LOGIN, yapay gecikme,
+throttle kodu enjeksiyonu ve rastgele alıcı hataları desteklenir. Aynı
+Message-ID ile tekrar gelen mesajlar "duplicates" sayacında tutulur.
+
+Kullanım:
+    python benchmarks/fake_smtp.py --port 2525 --latency 0.05 --throttle-rate 0.01
+"""
+
+import argparse
+import base64
+import random
+import socketserver
+import ssl
+import subprocess
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+
+def generate_self_signed_cert(directory: Path) -> tuple:
+    """openssl ile localhost için self-signed sertifika üret"""
+    cert_file = directory / "cert.pem"
+    key_file = directory / "key.pem"
+    try:
+        subprocess.run(
+            [
+                "openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes",
+                "-keyout", str(key_file), "-out", str(cert_file),
+                "-days", "1", "-subj", "/CN=localhost"
+            ],
+            check=True, capture_output=True
+        )
+    except FileNotFoundError:
+        raise RuntimeError("STARTTLS için openssl gerekli (veya --no-tls kullanın)")
+    return cert_file, key_file
+
+
+class FakeSMTPStats:
+    """Sunucu tarafı sayaçlar"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.connections = 0
+        self.auth_success = 0
+        self.auth_failed = 0
+        self.messages = 0
+        self.bytes_received = 0
+        self.throttled = 0
+        self.rejected = 0
+        self.duplicates = 0
+        self._message_ids = set()
+
+    def incr(self, name: str, value: int = 1):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + value)
+
+    def record_message_id(self, message_id: str):
+        """Aynı Message-ID ile ikinci kez gelen mesajları say (çift gönderim kontrolü)"""
+        with self._lock:
+            if message_id in self._message_ids:
+                self.duplicates += 1
+            else:
+                self._message_ids.add(message_id)
+
+    def as_dict(self) -> dict:
+        with self._lock:
+            return {
+                "connections": self.connections,
+                "auth_success": self.auth_success,
+                "auth_failed": self.auth_failed,
+                "messages": self.messages,
+                "bytes_received": self.bytes_received,
+                "throttled": self.throttled,
+                "rejected": self.rejected,
+                "duplicates": self.duplicates
+            }
+
+
+class _SMTPHandler(socketserver.StreamRequestHandler):
+    """Tek bir SMTP oturumu"""
+
+    def setup(self):
+        super().setup()
+        self.tls_active = False
+        self.authenticated = False
+        self.mail_from = None
+        self.recipients = []
+
+    def _reply(self, line: str):
+        self.wfile.write((line + "\r\n").encode("utf-8"))
+        self.wfile.flush()
+
+    def _readline(self) -> str:
+        line = self.rfile.readline(65537)
+        if not line:
+            raise ConnectionError("İstemci bağlantıyı kapattı")
+        return line.decode("utf-8", errors="replace").rstrip("\r\n")
+
+    def _start_tls(self):
+        self.wfile.flush()
+        self.connection = self.server.ssl_context.wrap_socket(self.connection, server_side=True)
+        self.request = self.connection
+        self.rfile = self.connection.makefile("rb")
+        self.wfile = self.connection.makefile("wb")
+        self.tls_active = True
+        self.authenticated = False
+
+    def _check_credentials(self, username: str, password: str) -> bool:
+        users = self.server.users
+        if users is None:
+            return True
+        return users.get(username) == password
+
+    def _auth(self, args: str):
+        parts = args.split()
+        mechanism = parts[0].upper() if parts else ""
+
+        if mechanism == "PLAIN":
+            if len(parts) > 1:
+                payload = parts[1]
+            else:
+                self._reply("334 ")
+                payload = self._readline()
+            decoded = base64.b64decode(payload).decode("utf-8", errors="replace")
+            _, username, password = (decoded.split("\0") + ["", ""])[:3]
+        elif mechanism == "LOGIN":
+            if len(parts) > 1:
+                username = base64.b64decode(parts[1]).decode("utf-8", errors="replace")
+            else:
+                self._reply("334 VXNlcm5hbWU6")
+                username = base64.b64decode(self._readline()).decode("utf-8", errors="replace")
+            self._reply("334 UGFzc3dvcmQ6")
+            password = base64.b64decode(self._readline()).decode("utf-8", errors="replace")
+        else:
+            self._reply("504 5.7.4 Unrecognized authentication type")
+            return
+
+        if self._check_credentials(username, password):
+            self.authenticated = True
+            self.server.stats.incr("auth_success")
+            self._reply("235 2.7.0 Authentication successful")
+        else:
+            self.server.stats.incr("auth_failed")
+            self._reply("535 5.7.3 Authentication unsuccessful")
+
+    def _read_data(self) -> tuple:
+        size = 0
+        message_id = None
+        in_headers = True
+        while True:
+            line = self.rfile.readline(1_000_001)
+            if not line:
+                raise ConnectionError("DATA sırasında bağlantı kapandı")
+            if line in (b".\r\n", b".\n"):
+                return size, message_id
+            if in_headers:
+                if line in (b"\r\n", b"\n"):
+                    in_headers = False
+                elif line[:11].lower() == b"message-id:":
+                    message_id = line[11:].strip().decode("ascii", errors="replace")
+            size += len(line)
+
+    def handle(self):
+        server = self.server
+        server.stats.incr("connections")
+        self._reply("220 fake-smtp ESMTP ready")
+
+        try:
+            while True:
+                line = self._readline()
+                command, _, args = line.partition(" ")
+                command = command.upper()
+
+                if command in ("EHLO", "HELO"):
+                    if command == "HELO":
+                        self._reply("250 fake-smtp")
+                        continue
+                    features = ["fake-smtp", "SIZE 36700160", "PIPELINING"]
+                    if server.eight_bit_mime:
+                        features.append("8BITMIME")
+                    if server.ssl_context is not None and not self.tls_active:
+                        features.append("STARTTLS")
+                    if self.tls_active or server.ssl_context is None:
+                        features.append("AUTH LOGIN PLAIN")
+                    for feature in features[:-1]:
+                        self._reply(f"250-{feature}")
+                    self._reply(f"250 {features[-1]}")
+
+                elif command == "STARTTLS":
+                    if server.ssl_context is None or self.tls_active:
+                        self._reply("454 4.7.0 TLS not available")
+                        continue
+                    self._reply("220 2.0.0 Ready to start TLS")
+                    self._start_tls()
+
+                elif command == "AUTH":
+                    self._auth(args)
+
+                elif command == "MAIL":
+                    if server.users is not None and not self.authenticated:
+                        self._reply("530 5.7.57 Client not authenticated")
+                        continue
+                    if server.throttle_rate and random.random() < server.throttle_rate:
+                        server.stats.incr("throttled")
+                        self._reply(f"{server.throttle_code} {server.throttle_message}")
+                        continue
+                    self.mail_from = args
+                    self.recipients = []
+                    self._reply("250 2.1.0 Sender OK")
+
+                elif command == "RCPT":
+                    address = args.split(":", 1)[-1].strip().strip("<>").lower()
+                    if address in server.unknown_recipients or (
+                            server.failure_rate and random.random() < server.failure_rate):
+                        server.stats.incr("rejected")
+                        self._reply("550 5.1.1 Recipient address rejected: mailbox unavailable")
+                        continue
+                    self.recipients.append(args)
+                    self._reply("250 2.1.5 Recipient OK")
+
+                elif command == "DATA":
+                    if not self.recipients:
+                        self._reply("503 5.5.1 No valid recipients")
+                        continue
+                    self._reply("354 Start mail input; end with <CRLF>.<CRLF>")
+                    size, message_id = self._read_data()
+                    if server.bandwidth:
+                        # Yavaş bağlantı: aktarım süresi mesaj boyutuyla orantılı
+                        time.sleep(size / server.bandwidth)
+                    if server.latency:
+                        time.sleep(server.latency + random.uniform(0, server.jitter))
+                    server.stats.incr("messages")
+                    if message_id:
+                        server.stats.record_message_id(message_id)
+                    server.stats.incr("bytes_received", size)
+                    self.mail_from = None
+                    self.recipients = []
+                    self._reply("250 2.0.0 OK queued")
+
+                elif command == "RSET":
+                    self.mail_from = None
+                    self.recipients = []
+                    self._reply("250 2.0.0 OK")
+
+                elif command == "NOOP":
+                    self._reply("250 2.0.0 OK")
+
+                elif command == "QUIT":
+                    self._reply("221 2.0.0 Bye")
+                    return
+
+                else:
+                    self._reply("502 5.5.2 Command not implemented")
+
+        except (ConnectionError, ssl.SSLError, OSError):
+            return
+
+
+class FakeSMTPServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    """
+    Yerel sahte SMTP sunucusu
+
+    Args:
+        host, port: Dinlenecek adres (port=0 ise boş port seçilir)
+        users: {kullanıcı: şifre} (None ise her kimlik kabul edilir, AUTH zorunlu değildir)
+        tls: STARTTLS desteği (self-signed sertifika üretilir)
+        latency / jitter: Mesaj kabulünde yapay gecikme (saniye)
+        throttle_rate / throttle_code: MAIL FROM'da throttle cevabı oranı ve kodu
+        failure_rate: RCPT TO'da kalıcı 550 hatası oranı
+        unknown_recipients: RCPT TO'da her zaman 550 ile reddedilen adresler
+        eight_bit_mime: EHLO'da 8BITMIME ilan edilsin mi
+        bandwidth: Mesaj aktarımı için bağlantı hızı (byte/saniye, 0 ise sınırsız)
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, users: dict = None,
+                 tls: bool = True, latency: float = 0.0, jitter: float = 0.0,
+                 throttle_rate: float = 0.0, throttle_code: int = 451,
+                 throttle_message: str = "4.7.500 Server busy. Please try again later.",
+                 failure_rate: float = 0.0, unknown_recipients=None, eight_bit_mime: bool = True,
+                 bandwidth: float = 0.0):
+        super().__init__((host, port), _SMTPHandler)
+        self.users = users
+        self.latency = latency
+        self.jitter = jitter
+        self.throttle_rate = throttle_rate
+        self.throttle_code = throttle_code
+        self.throttle_message = throttle_message
+        self.failure_rate = failure_rate
+        self.unknown_recipients = {a.lower() for a in unknown_recipients or ()}
+        self.eight_bit_mime = eight_bit_mime
+        self.bandwidth = bandwidth
+        self.stats = FakeSMTPStats()
+        self._thread = None
+
+        self.ssl_context = None
+        self._cert_dir = None
+        if tls:
+            self._cert_dir = tempfile.TemporaryDirectory(prefix="fake_smtp_")
+            cert_file, key_file = generate_self_signed_cert(Path(self._cert_dir.name))
+            self.ssl_context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+            self.ssl_context.load_cert_chain(cert_file, key_file)
+
+    @property
+    def port(self) -> int:
+        return self.server_address[1]
+
+    def start(self) -> "FakeSMTPServer":
+        """Sunucuyu arka plan thread'inde başlat"""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+        if self._cert_dir is not None:
+            self._cert_dir.cleanup()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Yerel sahte SMTP sunucusu")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=2525)
+    parser.add_argument("--user", action="append", default=[], help="kullanici:sifre (birden fazla verilebilir)")
+    parser.add_argument("--no-tls", action="store_true")
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--throttle-code", type=int, default=451)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--unknown", action="append", default=[], help="Her zaman reddedilen alıcı adresi")
+    parser.add_argument("--no-8bitmime", action="store_true", help="8BITMIME ilan etme")
+    parser.add_argument("--bandwidth", type=float, default=0.0, help="Bağlantı hızı (KB/s, 0 = sınırsız)")
+    args = parser.parse_args()
+
+    users = dict(u.split(":", 1) for u in args.user) if args.user else None
+    server = FakeSMTPServer(
+        host=args.host, port=args.port, users=users, tls=not args.no_tls,
+        latency=args.latency, jitter=args.jitter, throttle_rate=args.throttle_rate,
+        throttle_code=args.throttle_code, failure_rate=args.failure_rate, unknown_recipients=args.unknown,
+        eight_bit_mime=not args.no_8bitmime, bandwidth=args.bandwidth * 1024
+    )
+    print(f"📮 Fake SMTP dinleniyor: {args.host}:{server.port} (TLS: {not args.no_tls})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(f"\n📊 {server.stats.as_dict()}")
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+"""
+Synthetic Calendar Generator
+Benchmark'lar için sentetik Merkezi_Takvimi.xlsx ve önceden doldurulmuş
+rapor geçmişi üretir.
+
+Takvimdeki başlangıç tarihleri geçmiş 60 gün ile gelecek bir yıl arasına
+yayılır; belirli bir oran bugün 60/30/1 gün hatırlatması düşecek şekilde
+seçilir. Geçersiz satırlar (boş alanlar, hatalı mail, okunamayan tarih)
+ayrı bir oranla eklenir.
+
+Kullanım:
+    python benchmarks/generate_calendar.py --rows 10000 --output /tmp/Merkezi_Takvimi.xlsx
+    python benchmarks/generate_calendar.py --rows 1000 --history-rows 50000 --history-dir /tmp/mail_raporu
+"""
+
+import argparse
+import random
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+# Gerçek takvimle aynı başlıklar (ilk sütun boş, yönetici sütununda newline var)
+CALENDAR_HEADER = [
+    None, "S.no", "Toplantı Adı", "D.Serve İlgili Kişi\n", "D.serve İlgili Kişi Mail",
+    "Toplantı Hazırlıkları Başlangıç Dönemi", "Hatırlatma Durumu"
+]
+
+IHALE_KONULARI = [
+    "Yemek Çeki", "Toplu SMS Alım", "Moto Kurye Hizmetleri", "Temizlik Hizmetleri",
+    "Güvenlik Hizmetleri", "Kırtasiye Alımı", "Araç Kiralama", "Bilgisayar Donanımı",
+    "Yazılım Lisansları", "Catering Hizmetleri", "Bina Bakım Onarım", "Sigorta Hizmetleri"
+]
+ISIMLER = ["Ayşe", "Mehmet", "Fatma", "Ahmet", "Zeynep", "Mustafa", "Elif", "Emre", "Selin", "Burak"]
+SOYISIMLER = ["Yılmaz", "Kaya", "Demir", "Çelik", "Şahin", "Yıldız", "Aydın", "Öztürk", "Arslan", "Doğan"]
+
+INVALID_KINDS = ("bos_satir", "bos_ad", "bos_yonetici", "hatali_mail", "bos_tarih", "hatali_tarih")
+
+
+def _ascii(text: str) -> str:
+    return text.lower().translate(str.maketrans("çğıöşü", "cgiosu"))
+
+
+def _sent_status(start: datetime, today: datetime) -> str:
+    """Geçmişte kalan hatırlatma noktaları için gerçekçi 'Hatırlatma Durumu'"""
+    entries = []
+    for gun, tipi in ((60, "60_gun"), (30, "30_gun"), (1, "1_gun")):
+        due = start - timedelta(days=gun)
+        if due < today:
+            entries.append(f"{tipi}:{due.strftime('%Y-%m-%d')}")
+    return ", ".join(entries) if entries else None
+
+
+def iter_calendar_rows(rows: int, invalid_ratio: float = 0.02, due_ratio: float = 0.02,
+                       managers: int = 200, seed: int = 42, today: datetime = None):
+    """
+    Takvim satırlarını üret (başlık hariç)
+
+    Args:
+        rows: Satır sayısı
+        invalid_ratio: Geçersiz satır oranı
+        due_ratio: Bugün hatırlatması düşen satır oranı
+        managers: Farklı yönetici sayısı
+        seed: Rastgelelik tohumu (aynı tohum aynı takvimi üretir)
+    """
+    rng = random.Random(seed)
+    today = (today or datetime.now()).replace(hour=0, minute=0, second=0, microsecond=0)
+    people = [
+        (f"{rng.choice(ISIMLER)} {rng.choice(SOYISIMLER)}", i)
+        for i in range(managers)
+    ]
+
+    for i in range(rows):
+        s_no = i + 1
+        name, person_id = people[rng.randrange(managers)]
+        mail = f"{_ascii(name).replace(' ', '.')}{person_id}@example.com"
+        ihale_adi = f"{rng.choice(IHALE_KONULARI)} İhalesi {s_no}"
+
+        roll = rng.random()
+        if roll < due_ratio:
+            start = today + timedelta(days=rng.choice((60, 30, 1)))
+            status = _sent_status(start, today)
+        else:
+            start = today + timedelta(days=rng.randint(-60, 365))
+            status = _sent_status(start, today)
+
+        if rng.random() < invalid_ratio:
+            kind = INVALID_KINDS[rng.randrange(len(INVALID_KINDS))]
+            if kind == "bos_satir":
+                yield [None] * len(CALENDAR_HEADER)
+                continue
+            if kind == "bos_ad":
+                ihale_adi = None
+            elif kind == "bos_yonetici":
+                name = None
+            elif kind == "hatali_mail":
+                mail = mail.replace("@", " at ")
+            elif kind == "bos_tarih":
+                start = None
+            elif kind == "hatali_tarih":
+                start = "31/31/2025"
+
+        yield [None, s_no, ihale_adi, name, mail, start, status]
+
+
+def generate_calendar(output: str, rows: int, invalid_ratio: float = 0.02, due_ratio: float = 0.02,
+                      managers: int = 200, seed: int = 42) -> Path:
+    """Sentetik takvimi write-only openpyxl ile dosyaya yaz"""
+    from openpyxl import Workbook
+
+    output = Path(output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet("Sheet1")
+    sheet.append(CALENDAR_HEADER)
+    for row in iter_calendar_rows(rows, invalid_ratio, due_ratio, managers, seed):
+        sheet.append(row)
+    workbook.save(output)
+    return output
+
+
+def generate_report_history(store_dir: str, rows: int, months: int = 12, managers: int = 200,
+                            failure_ratio: float = 0.03, seed: int = 42, batch_size: int = 10000) -> int:
+    """
+    Rapor store'unu son `months` aya yayılmış sentetik gönderim geçmişiyle doldur
+
+    Returns:
+        int: Eklenen kayıt sayısı
+    """
+    from report_store import ReportStore
+
+    rng = random.Random(seed)
+    now = datetime.now()
+    span_seconds = months * 30 * 24 * 3600
+    types = (("60_gun", 60), ("30_gun", 30), ("1_gun", 1))
+
+    store = ReportStore(store_dir)
+    added = 0
+    try:
+        batch = []
+        for i in range(rows):
+            sent_at = now - timedelta(seconds=rng.randrange(span_seconds))
+            tipi, kalan = types[rng.randrange(len(types))]
+            person_id = rng.randrange(managers)
+            failed = rng.random() < failure_ratio
+            batch.append({
+                "Gönderim Tarihi": sent_at.strftime("%Y-%m-%d"),
+                "Gönderim Saati": sent_at.strftime("%H:%M:%S"),
+                "İhale No": rng.randint(1, max(1, rows // 3)),
+                "İhale Adı": f"{rng.choice(IHALE_KONULARI)} İhalesi",
+                "Yönetici": f"Yönetici {person_id}",
+                "Yönetici Mail": f"yonetici{person_id}@example.com",
+                "Hatırlatma Tipi": tipi,
+                "Kalan Gün": kalan,
+                "Başlangıç Tarihi": (sent_at + timedelta(days=kalan)).strftime("%Y-%m-%d"),
+                "Durum": "Başarısız" if failed else "Başarılı",
+                "Hata Mesajı": "(451, b'4.7.500 Server busy')" if failed else "",
+                "Retry Sayısı": 2 if failed else 0
+            })
+            if len(batch) >= batch_size:
+                added += store.append_many(batch)
+                batch = []
+        added += store.append_many(batch)
+    finally:
+        store.close()
+    return added
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sentetik ihale takvimi ve rapor geçmişi üret")
+    parser.add_argument("--rows", type=int, default=1000, help="Takvim satır sayısı")
+    parser.add_argument("--output", default="data/Merkezi_Takvimi_synthetic.xlsx", help="Takvim dosyası")
+    parser.add_argument("--invalid-ratio", type=float, default=0.02, help="Geçersiz satır oranı")
+    parser.add_argument("--due-ratio", type=float, default=0.02, help="Bugün hatırlatması düşen satır oranı")
+    parser.add_argument("--managers", type=int, default=200, help="Farklı yönetici sayısı")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--history-rows", type=int, default=0, help="Rapor geçmişi kayıt sayısı (0 = üretme)")
+    parser.add_argument("--history-months", type=int, default=12)
+    parser.add_argument("--history-dir", default="data/mail_raporu_synthetic", help="Rapor store klasörü")
+    args = parser.parse_args()
+
+    path = generate_calendar(args.output, args.rows, args.invalid_ratio, args.due_ratio, args.managers, args.seed)
+    print(f"✅ {args.rows} satırlık takvim yazıldı: {path}")
+
+    if args.history_rows:
+        added = generate_report_history(
+            args.history_dir, args.history_rows, args.history_months, args.managers, seed=args.seed
+        )
+        print(f"✅ {added} kayıtlık rapor geçmişi yazıldı: {args.history_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+"""
+End-to-end Benchmark Suite
+Sentetik takvimler üzerinde sistemin aşamalarını ölçer, sonuçları baseline
+olarak saklar ve önceki baseline ile karşılaştırıp regresyonları raporlar.
+
+Ölçülenler:
+    read_ihale_file, calculate_reminders, send_reminders (TEST_MODE),
+    add_entry, _save_report, get_daily_statistics
+
+Kullanım:
+    python benchmarks/run_benchmarks.py --sizes 1k,10k --save-baseline main
+    python benchmarks/run_benchmarks.py --sizes 1k,10k --compare main --threshold 0.25
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+BENCH_DIR = Path(__file__).resolve().parent
+BASELINE_DIR = BENCH_DIR / "baselines"
+CACHE_DIR = BENCH_DIR / ".cache"
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(BENCH_DIR))
+
+from generate_calendar import generate_calendar, generate_report_history
+
+
+def parse_size(text: str) -> int:
+    """'10k' -> 10000, '1m' -> 1000000"""
+    text = text.strip().lower()
+    multiplier = 1
+    if text.endswith("k"):
+        multiplier, text = 1000, text[:-1]
+    elif text.endswith("m"):
+        multiplier, text = 1000000, text[:-1]
+    return int(float(text) * multiplier)
+
+
+def size_label(rows: int) -> str:
+    if rows >= 1000000 and rows % 1000000 == 0:
+        return f"{rows // 1000000}m"
+    if rows >= 1000 and rows % 1000 == 0:
+        return f"{rows // 1000}k"
+    return str(rows)
+
+
+def cached_calendar(rows: int, invalid_ratio: float, seed: int) -> Path:
+    """Aynı parametrelerle üretilmiş takvimi önbellekten kullan (büyük takvimler yavaş üretilir)"""
+    path = CACHE_DIR / f"calendar_{rows}_{invalid_ratio}_{seed}.xlsx"
+    if not path.exists():
+        print(f"  📄 {rows} satırlık takvim üretiliyor...")
+        tmp_path = path.with_suffix(".tmp.xlsx")
+        generate_calendar(tmp_path, rows, invalid_ratio=invalid_ratio, seed=seed)
+        tmp_path.replace(path)
+    return path
+
+
+def measure(func, repeat: int) -> tuple:
+    """Fonksiyonu repeat kez çalıştır, en iyi süreyi ve son sonucu döndür"""
+    best = None
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def run_size(rows: int, args) -> dict:
+    """Tek bir takvim boyutu için tüm benchmark'ları çalıştır"""
+    calendar = cached_calendar(rows, args.invalid_ratio, args.seed)
+    workspace = Path(tempfile.mkdtemp(prefix=f"bench_{size_label(rows)}_"))
+    cwd = os.getcwd()
+    results = {}
+
+    try:
+        (workspace / "data").mkdir()
+        (workspace / "logs").mkdir()
+        shutil.copytree(ROOT / "config", workspace / "config")
+        shutil.copy(calendar, workspace / "data" / "Merkezi_Takvimi.xlsx")
+        os.chdir(workspace)
+
+        from file_handler import FileHandler
+        from scheduler import Scheduler
+        from email_sender import EmailSender
+        from report_manager import ReportManager
+
+        # Okuma
+        handler = FileHandler("data/Merkezi_Takvimi.xlsx")
+        seconds, file_result = measure(handler.read_ihale_file, args.repeat)
+        results["read_ihale_file"] = {"seconds": seconds, "items": file_result["total_count"]}
+
+        # Zamanlama
+        scheduler = Scheduler()
+        seconds, schedule_result = measure(lambda: scheduler.calculate_reminders(file_result["data"]), args.repeat)
+        reminders = schedule_result["reminders_to_send"]
+        results["calculate_reminders"] = {"seconds": seconds, "items": file_result["valid_count"]}
+
+        # Gönderim (TEST_MODE, rate limit yok)
+        sender = EmailSender()
+        seconds, send_result = measure(lambda: sender.send_reminders(reminders), 1)
+        results["send_reminders"] = {"seconds": seconds, "items": len(reminders)}
+
+        # Rapor: önceden doldurulmuş geçmiş üzerine kayıt ekleme
+        if args.history_rows:
+            generate_report_history("data/mail_raporu", args.history_rows, seed=args.seed)
+        manager = ReportManager("data/mail_raporu.xlsx")
+        pairs = list(zip(send_result["results"], reminders))[:args.entries]
+
+        def add_entries():
+            for email_result, reminder in pairs:
+                manager.add_entry(email_result, reminder)
+
+        seconds, _ = measure(add_entries, 1)
+        results["add_entry"] = {"seconds": seconds, "items": len(pairs)}
+
+        seconds, _ = measure(manager._save_report, args.repeat)
+        results["_save_report"] = {"seconds": seconds, "items": manager.store.count()}
+
+        seconds, _ = measure(manager.get_daily_statistics, args.repeat)
+        results["get_daily_statistics"] = {"seconds": seconds, "items": manager.store.count()}
+
+        manager.store.close()
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(workspace, ignore_errors=True)
+
+    for bench in results.values():
+        bench["seconds"] = round(bench["seconds"], 6)
+        bench["per_item_us"] = round(bench["seconds"] / bench["items"] * 1e6, 3) if bench["items"] else None
+    return results
+
+
+def compare(current: dict, baseline: dict, threshold: float, min_delta: float = 0.005) -> list:
+    """
+    Baseline'a göre yavaşlayan benchmark'ları bul
+
+    Milisaniye altı ölçümlerdeki gürültü regresyon sayılmasın diye süre farkı
+    min_delta saniyeden küçükse oran dikkate alınmaz.
+
+    Returns:
+        list: (boyut, benchmark, baseline_saniye, şimdiki_saniye, oran) listesi
+    """
+    regressions = []
+    for size, benches in current["results"].items():
+        for name, bench in benches.items():
+            base = baseline.get("results", {}).get(size, {}).get(name)
+            if not base or not base["seconds"]:
+                continue
+            ratio = bench["seconds"] / base["seconds"]
+            if ratio > 1 + threshold and bench["seconds"] - base["seconds"] >= min_delta:
+                regressions.append((size, name, base["seconds"], bench["seconds"], ratio))
+    return regressions
+
+
+def print_table(current: dict, baseline: dict = None):
+    print(f"\n{'Boyut':<7} {'Benchmark':<22} {'Süre (s)':>11} {'Kayıt':>9} {'µs/kayıt':>10} {'Baseline':>11} {'Oran':>7}")
+    print("-" * 84)
+    for size, benches in current["results"].items():
+        for name, bench in benches.items():
+            base = (baseline or {}).get("results", {}).get(size, {}).get(name)
+            base_text = f"{base['seconds']:.4f}" if base else "-"
+            ratio_text = f"{bench['seconds'] / base['seconds']:.2f}x" if base and base["seconds"] else "-"
+            per_item = f"{bench['per_item_us']:.1f}" if bench["per_item_us"] is not None else "-"
+            print(f"{size:<7} {name:<22} {bench['seconds']:>11.4f} {bench['items']:>9} {per_item:>10} {base_text:>11} {ratio_text:>7}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Uçtan uca benchmark paketi")
+    parser.add_argument("--sizes", default="1k,10k", help="Takvim boyutları (ör. 1k,10k,100k,1m)")
+    parser.add_argument("--invalid-ratio", type=float, default=0.02)
+    parser.add_argument("--history-rows", type=int, default=10000, help="Önceden doldurulmuş rapor geçmişi")
+    parser.add_argument("--entries", type=int, default=200, help="add_entry ile eklenecek kayıt sayısı")
+    parser.add_argument("--repeat", type=int, default=3, help="Tekrar sayısı (en iyi süre alınır)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--save-baseline", metavar="AD", help="Sonuçları benchmarks/baselines/AD.json olarak kaydet")
+    parser.add_argument("--compare", metavar="AD", help="benchmarks/baselines/AD.json ile karşılaştır")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Regresyon eşiği (0.2 = %%20 yavaşlama)")
+    parser.add_argument("--min-delta", type=float, default=0.005, help="Regresyon için en az süre farkı (saniye)")
+    parser.add_argument("--json", dest="json_output", help="Sonucu JSON dosyasına yaz")
+    parser.add_argument("--verbose", action="store_true", help="Modül loglarını göster")
+    args = parser.parse_args()
+
+    if not args.verbose:
+        logging.disable(logging.CRITICAL)
+
+    os.environ.update({"TEST_MODE": "true", "SMTP_RATE_PER_MINUTE": "0"})
+
+    current = {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "params": {
+            "invalid_ratio": args.invalid_ratio, "history_rows": args.history_rows,
+            "entries": args.entries, "repeat": args.repeat, "seed": args.seed
+        },
+        "results": {}
+    }
+    for rows in [parse_size(size) for size in args.sizes.split(",")]:
+        print(f"⏱️  {size_label(rows)} satır ölçülüyor...")
+        current["results"][size_label(rows)] = run_size(rows, args)
+
+    baseline = None
+    if args.compare:
+        baseline_file = BASELINE_DIR / f"{args.compare}.json"
+        if baseline_file.exists():
+            baseline = json.loads(baseline_file.read_text(encoding="utf-8"))
+        else:
+            print(f"⚠️  Baseline bulunamadı: {baseline_file}")
+
+    print_table(current, baseline)
+
+    if args.json_output:
+        Path(args.json_output).write_text(json.dumps(current, indent=2), encoding="utf-8")
+
+    if args.save_baseline:
+        BASELINE_DIR.mkdir(parents=True, exist_ok=True)
+        baseline_file = BASELINE_DIR / f"{args.save_baseline}.json"
+        baseline_file.write_text(json.dumps(current, indent=2), encoding="utf-8")
+        print(f"\n💾 Baseline kaydedildi: {baseline_file}")
+
+    if baseline:
+        regressions = compare(current, baseline, args.threshold, args.min_delta)
+        if regressions:
+            print(f"\n❌ {len(regressions)} regresyon (eşik %{args.threshold * 100:.0f}):")
+            for size, name, base_seconds, seconds, ratio in regressions:
+                print(f"  - {size} {name}: {base_seconds:.4f}s -> {seconds:.4f}s ({ratio:.2f}x)")
+            sys.exit(1)
+        print(f"\n✅ Regresyon yok (eşik %{args.threshold * 100:.0f})")
+
+
+if __name__ == "__main__":
+    main()
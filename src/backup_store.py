@@ -0,0 +1,216 @@
+"""
+Backup Store Module
+İçerik adresli (content-addressed) yedek deposu. Her dosya SHA-256 hash'i ile
+objects/ altında bir kez saklanır; snapshot'lar yalnızca dosya adı → hash
+eşlemesidir ve manifest.json içinde tutulur. İçeriği değişmemiş bir dosya için
+yeni kopya oluşturulmaz, önceki snapshot ile aynıysa snapshot da atlanır.
+
+Saklama politikası (yedek adı başına):
+    - En son snapshot her zaman tutulur
+    - Son BACKUP_KEEP_DAILY günün her biri için günün son snapshot'ı
+    - Son BACKUP_KEEP_MONTHLY ayın her biri için ayın son snapshot'ı
+Hiçbir snapshot'ın kullanmadığı nesneler silinir.
+
+Klasör yapısı:
+    data/backups/
+        manifest.json
+        objects/ab/ab12...ef
+"""
+
+import hashlib
+import json
+import os
+import shutil
+from datetime import datetime
+from pathlib import Path
+import logging
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+
+
+def _sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class BackupStore:
+    """Hash ile tekilleştirilmiş, saklama politikalı yedek deposu"""
+
+    def __init__(self, root: str = None, keep_daily: int = None, keep_monthly: int = None):
+        """
+        Args:
+            root: Depo klasörü (None ise BACKUP_DIR veya data/backups)
+            keep_daily: Tutulacak günlük snapshot sayısı (None ise BACKUP_KEEP_DAILY veya 7)
+            keep_monthly: Tutulacak aylık snapshot sayısı (None ise BACKUP_KEEP_MONTHLY veya 12)
+        """
+        self.root = Path(root or os.getenv("BACKUP_DIR", "data/backups"))
+        self.keep_daily = keep_daily if keep_daily is not None else int(os.getenv("BACKUP_KEEP_DAILY", "7"))
+        self.keep_monthly = keep_monthly if keep_monthly is not None else int(os.getenv("BACKUP_KEEP_MONTHLY", "12"))
+        self.manifest_file = self.root / "manifest.json"
+        self.objects_dir = self.root / "objects"
+
+    def _object_path(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / digest
+
+    def load_manifest(self) -> dict:
+        """Manifest'i oku (yoksa boş manifest)"""
+        try:
+            with open(self.manifest_file, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {"version": MANIFEST_VERSION, "snapshots": []}
+
+    def _save_manifest(self, manifest: dict):
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.manifest_file.with_name(self.manifest_file.name + ".tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        tmp_file.replace(self.manifest_file)
+
+    def snapshots(self, name: str = None) -> list:
+        """Snapshot'ları eskiden yeniye listele (name verilirse yalnızca o yedek)"""
+        return [s for s in self.load_manifest()["snapshots"] if name is None or s["name"] == name]
+
+    def _store_object(self, source: Path, digest: str) -> bool:
+        """Nesne yoksa kopyala; kopyalandıysa True"""
+        target = self._object_path(digest)
+        if target.exists():
+            return False
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = target.with_name(target.name + ".tmp")
+        shutil.copyfile(source, tmp_file)
+        tmp_file.replace(target)
+        return True
+
+    def snapshot(self, name: str, files: dict) -> dict:
+        """
+        Dosya kümesinin snapshot'ını al
+
+        Dosyanın boyutu ve mtime'ı önceki snapshot'takiyle aynıysa dosya tekrar
+        okunmaz; önceki hash kullanılır.
+
+        Args:
+            name: Yedek adı (ör. "Merkezi_Takvimi")
+            files: Snapshot içindeki ad → kaynak dosya yolu
+
+        Returns:
+            dict: success, skipped, snapshot_id, new_objects, new_bytes
+        """
+        manifest = self.load_manifest()
+        previous = next((s for s in reversed(manifest["snapshots"]) if s["name"] == name), None)
+        previous_files = previous["files"] if previous else {}
+
+        entries = {}
+        new_objects = 0
+        new_bytes = 0
+        for file_name, source in files.items():
+            source = Path(source)
+            stat = source.stat()
+            known = previous_files.get(file_name)
+            if (known and known["size"] == stat.st_size and known.get("mtime_ns") == stat.st_mtime_ns
+                    and self._object_path(known["sha256"]).exists()):
+                digest = known["sha256"]
+            else:
+                digest = _sha256(source)
+            if self._store_object(source, digest):
+                new_objects += 1
+                new_bytes += stat.st_size
+            entries[file_name] = {"sha256": digest, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+        if previous and {k: v["sha256"] for k, v in previous_files.items()} == {k: v["sha256"] for k, v in entries.items()}:
+            # İçerik aynı: yalnızca mtime'ları tazele ki bir sonraki çağrıda hash atlansın
+            if previous_files != entries:
+                previous["files"] = entries
+                self._save_manifest(manifest)
+            return {"success": True, "skipped": True, "snapshot_id": previous["id"], "new_objects": 0, "new_bytes": 0}
+
+        created_at = datetime.now()
+        snapshot_id = f"{name}-{created_at.strftime('%Y%m%d_%H%M%S_%f')}"
+        manifest["snapshots"].append({
+            "id": snapshot_id,
+            "name": name,
+            "created_at": created_at.isoformat(timespec="seconds"),
+            "files": entries
+        })
+        self._prune(manifest, name)
+        self._save_manifest(manifest)
+        self._collect_garbage(manifest)
+
+        return {
+            "success": True,
+            "skipped": False,
+            "snapshot_id": snapshot_id,
+            "new_objects": new_objects,
+            "new_bytes": new_bytes
+        }
+
+    def _prune(self, manifest: dict, name: str):
+        """Saklama politikası dışında kalan snapshot'ları manifest'ten çıkar"""
+        own = [s for s in manifest["snapshots"] if s["name"] == name]
+        keep = {own[-1]["id"]}
+
+        # Yeniden eskiye: her gün/ayın ilk görülen snapshot'ı o dönemin sonuncusudur
+        days, months = [], []
+        for snap in reversed(own):
+            day = snap["created_at"][:10]
+            month = snap["created_at"][:7]
+            if day not in days and len(days) < self.keep_daily:
+                days.append(day)
+                keep.add(snap["id"])
+            if month not in months and len(months) < self.keep_monthly:
+                months.append(month)
+                keep.add(snap["id"])
+
+        removed = [s["id"] for s in own if s["id"] not in keep]
+        if removed:
+            manifest["snapshots"] = [s for s in manifest["snapshots"] if s["name"] != name or s["id"] in keep]
+            logger.info(f"🧹 {len(removed)} eski {name} snapshot'ı silindi")
+
+    def _collect_garbage(self, manifest: dict) -> int:
+        """Hiçbir snapshot'ın kullanmadığı nesneleri sil"""
+        referenced = {entry["sha256"] for snap in manifest["snapshots"] for entry in snap["files"].values()}
+        removed = 0
+        if not self.objects_dir.exists():
+            return removed
+        for path in self.objects_dir.glob("*/*"):
+            if path.name not in referenced:
+                path.unlink(missing_ok=True)
+                removed += 1
+        return removed
+
+    def restore(self, snapshot_id: str, target_dir) -> list:
+        """Snapshot dosyalarını target_dir altına geri yükle"""
+        snap = next((s for s in self.load_manifest()["snapshots"] if s["id"] == snapshot_id), None)
+        if snap is None:
+            raise KeyError(f"Snapshot bulunamadı: {snapshot_id}")
+
+        target_dir = Path(target_dir)
+        restored = []
+        for file_name, entry in snap["files"].items():
+            target = target_dir / file_name
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(self._object_path(entry["sha256"]), target)
+            restored.append(target)
+        return restored
+
+    def disk_usage(self) -> int:
+        """Nesnelerin toplam boyutu (byte)"""
+        if not self.objects_dir.exists():
+            return 0
+        return sum(path.stat().st_size for path in self.objects_dir.glob("*/*"))
+
+
+if __name__ == "__main__":
+    # Snapshot listesi
+    from log_config import setup_logging
+    setup_logging(log_file="")
+    store = BackupStore()
+    for snap in store.snapshots():
+        size = sum(entry["size"] for entry in snap["files"].values())
+        print(f"{snap['created_at']}  {snap['id']}  {len(snap['files'])} dosya, {size / 1024:.1f} KB")
+    print(f"Toplam depo boyutu: {store.disk_usage() / 1024:.1f} KB")
@@ -0,0 +1,85 @@
+"""
+Due Cache Module
+Bir sonraki hatırlatma tarihini takvim dosyasının içerik hash'iyle birlikte saklar.
+Takvim değişmediyse ve bugün o tarihten önceyse çalıştırma hiçbir dosyayı
+okumadan sonlandırılabilir.
+"""
+
+import hashlib
+import json
+import os
+from datetime import date, datetime
+from pathlib import Path
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class DueCache:
+    """Sonraki hatırlatma tarihi önbelleği"""
+
+    def __init__(self, cache_file: str = "data/.sonraki_hatirlatma.json"):
+        self.cache_file = Path(cache_file)
+
+    @staticmethod
+    def _fingerprint(calendar_file: Path) -> dict:
+        # mtime yerine içerik hash'i: git checkout sonrası da (CI) geçerli kalır
+        digest = hashlib.sha256()
+        with open(calendar_file, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+        return {
+            "path": str(calendar_file),
+            "size": os.path.getsize(calendar_file),
+            "sha256": digest.hexdigest()
+        }
+
+    def load(self) -> dict:
+        """Önbellek içeriğini oku (yoksa veya bozuksa boş dict)"""
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def is_quiet_day(self, calendar_file, today: date) -> tuple:
+        """
+        Bugün gönderilecek hatırlatma olmadığı önbellekten anlaşılabiliyor mu
+
+        Returns:
+            tuple: (sessiz_gun_mu, sonraki_tarih)
+        """
+        calendar_file = Path(calendar_file)
+        cache = self.load()
+        if not cache or not calendar_file.exists():
+            return False, None
+
+        if cache.get("calendar") != self._fingerprint(calendar_file):
+            return False, None
+
+        next_due = cache.get("next_due")
+        if next_due is None:
+            # Takvimde ileride hiçbir hatırlatma yok
+            return True, None
+
+        next_due = date.fromisoformat(next_due)
+        return today < next_due, next_due
+
+    def save(self, calendar_file, next_due: date):
+        """Takvimin güncel parmak izi ile sonraki hatırlatma tarihini kaydet"""
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            payload = {
+                "calendar": self._fingerprint(Path(calendar_file)),
+                "next_due": next_due.isoformat() if next_due else None,
+                "computed_at": datetime.now().isoformat(timespec="seconds")
+            }
+            tmp_file = self.cache_file.with_name(self.cache_file.name + ".tmp")
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(payload, f, ensure_ascii=False, indent=2)
+            tmp_file.replace(self.cache_file)
+        except OSError as e:
+            logger.warning(f"⚠️  Hatırlatma önbelleği yazılamadı: {str(e)}")
+
+    def clear(self):
+        self.cache_file.unlink(missing_ok=True)
@@ -3,23 +3,112 @@ Email Sender Module
 Outlook SMTP üzerinden hatırlatma maillerini gönderir.
 """
 
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from datetime import datetime
+from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import queue
 import time
 import os
+import re
 from pathlib import Path
 import logging
 
-logging.basicConfig(level=logging.INFO)
+from sender_pool import SenderPool, load_sender_accounts, is_account_error
+from suppression import SuppressionList, permanent_failure
+
 logger = logging.getLogger(__name__)
 
 
+_PLACEHOLDER_PATTERN = re.compile(r"\{\{|\}\}|\{(\w+)\}")
+
+
+def _render_template(template: str, values: dict) -> str:
+    """
+    Şablondaki {alan} yer tutucularını doldur
+
+    str.format'tan farklı olarak bilinmeyen süslü parantezlere (ör. CSS blokları)
+    dokunmaz; {{ ve }} kaçışları tek paranteze çevrilir.
+    """
+    def replace(match):
+        key = match.group(1)
+        if key is None:
+            return match.group(0)[0]
+        if key in values:
+            return str(values[key])
+        return match.group(0)
+
+    return _PLACEHOLDER_PATTERN.sub(replace, template)
+
+
+_HTML_COMMENT_PATTERN = re.compile(r"<!--(?!\[if).*?-->", re.DOTALL)
+_STYLE_PATTERN = re.compile(r"(<style[^>]*>)(.*?)(</style>)", re.DOTALL | re.IGNORECASE)
+_CSS_COMMENT_PATTERN = re.compile(r"/\*.*?\*/", re.DOTALL)
+_CSS_TOKEN_PATTERN = re.compile(r"\s*(\{\{|\}\}|[{};:,>])\s*")
+
+
+def _minify_css(css: str) -> str:
+    def replace(match):
+        token = match.group(1)
+        # Her kural ayrı satırda kalır (8bit'te satır sınırı); {{ ve }} kaçışları bölünmez
+        return token + "\n" if token in ("}", "}}") else token
+
+    css = _CSS_TOKEN_PATTERN.sub(replace, _CSS_COMMENT_PATTERN.sub("", css))
+    return css.replace(";}", "}").strip()
+
+
+def _minify_html(html: str) -> str:
+    """
+    Şablonu küçült: yorumlar, girintiler ve boş satırlar atılır, <style> bloğu sıkıştırılır
+
+    Satır sonları korunur (HTML'de boşlukla eşdeğerdir); böylece satırlar
+    8bit aktarımın 998 karakter sınırının altında kalır. Yer tutuculara dokunulmaz.
+    """
+    html = _HTML_COMMENT_PATTERN.sub("", html)
+    html = _STYLE_PATTERN.sub(lambda m: m.group(1) + _minify_css(m.group(2)) + m.group(3), html)
+    html = re.sub(r"[ \t]*\n\s*", "\n", html)
+    html = re.sub(r"[ \t]{2,}", " ", html)
+    return html.strip()
+
+
+_TEXT_DROP_PATTERN = re.compile(r"<(head|style|script)\b.*?</\1>", re.DOTALL | re.IGNORECASE)
+_TEXT_BREAK_PATTERN = re.compile(r"<(?:br|/p|/div|/h\d|/li|/tr)\b[^>]*>", re.IGNORECASE)
+_TAG_PATTERN = re.compile(r"<[^>]+>")
+
+
+def _html_to_text(html: str) -> str:
+    """HTML gövdeden düz metin alternatifi üret (blok sonları satır sonu olur)"""
+    import html as html_lib
+
+    text = _TEXT_DROP_PATTERN.sub("", html)
+    text = re.sub(r"\s+", " ", text)
+    text = _TEXT_BREAK_PATTERN.sub("\n", text)
+    text = html_lib.unescape(_TAG_PATTERN.sub("", text))
+    return "\n".join(line.strip() for line in text.split("\n") if line.strip()) + "\n"
+
+
+# RFC 5321: 8bit aktarımda satır uzunluğu sınırı (CRLF hariç)
+_MAX_8BIT_LINE = 998
+
+
+_ACILIYET_HTML = """
+            <div class="warning">
+                <strong>⚠️ DİKKAT:</strong> Yarın ihale hazırlık sürecine başlanacaktır. 
+                Lütfen acil olarak gerekli hazırlıkları tamamlayınız!
+            </div>
+            """
+
+
 class EmailSender:
     """Email gönderim sınıfı"""
     
-    def __init__(self):
+    def __init__(self, pool: SenderPool = None, template_path: str = "config/email_template.html",
+                 suppression: SuppressionList = None):
+        """
+        Args:
+            pool: Paylaşılan gönderici havuzu (None ise environment'tan oluşturulur)
+            template_path: HTML mail şablonu
+            suppression: Kalıcı hata alan alıcılar listesi (None ise SUPPRESSION_FILE'dan yüklenir)
+        """
         # Environment variables'dan ayarları al
         self.smtp_server = os.getenv("SMTP_SERVER", "smtp.office365.com")
         self.smtp_port = int(os.getenv("SMTP_PORT", "587"))
@@ -27,12 +116,37 @@ class EmailSender:
         self.smtp_password = os.getenv("SMTP_PASSWORD", "")
         self.test_mode = os.getenv("TEST_MODE", "False").lower() == "true"
         
-        # Mail şablonunu yükle
-        self.email_template = self._load_email_template()
+        # Retry ayarları (saniye)
+        self.max_retries = 3
+        self.retry_delays = [float(x) for x in os.getenv("SMTP_RETRY_DELAYS", "5,10,30").split(",")]
+        
+        # Gönderici hesapları (tek hesap veya SMTP_ACCOUNTS ile çoklu hesap).
+        # Dışarıdan verilen havuzun bağlantılarını sahibi kapatır.
+        self._owns_pool = pool is None
+        self.pool = pool if pool is not None else SenderPool(load_sender_accounts())
+        
+        # Engelli alıcılara gönderim denenmez
+        self.suppression = suppression if suppression is not None else SuppressionList()
+        
+        # Mail şablonu ilk mail oluşturulurken yüklenir
+        self.template_path = Path(template_path)
+        self._email_template = None
+        
+        # Kompakt mod: küçültülmüş şablon, 8bit/quoted-printable gövde ve düz metin alternatifi
+        self.compact = os.getenv("MAIL_COMPACT", "True").lower() == "true"
+        self._aciliyet_html = _minify_html(_ACILIYET_HTML) if self.compact else _ACILIYET_HTML
+    
+    @property
+    def email_template(self) -> str:
+        """HTML mail şablonu (ihtiyaç anında yüklenir)"""
+        if self._email_template is None:
+            template = self._load_email_template()
+            self._email_template = _minify_html(template) if self.compact else template
+        return self._email_template
     
     def _load_email_template(self) -> str:
         """HTML mail şablonunu yükle"""
-        template_path = Path("config/email_template.html")
+        template_path = self.template_path
         
         if template_path.exists():
             with open(template_path, "r", encoding="utf-8") as f:
@@ -98,53 +212,67 @@ class EmailSender:
         </html>
         """
     
-    def _create_email_body(self, reminder: dict) -> str:
-        """Mail içeriğini oluştur"""
+    def _create_subject(self, reminder: dict) -> str:
+        """Mail konusu"""
+        return f"🔔 Hatırlatma - {reminder['ihale_adi']}"
+    
+    def _create_email_body(self, reminder: dict, gonderim_zamani: datetime = None) -> str:
+        """Mail içeriğini oluştur (gonderim_zamani verilmezse şu an kullanılır)"""
         # Aciliyet mesajı (1 gün kaldıysa)
         aciliyet_mesaji = ""
         if reminder["kalan_gun"] == 1:
-            aciliyet_mesaji = """
-            <div class="warning">
-                <strong>⚠️ DİKKAT:</strong> Yarın ihale hazırlık sürecine başlanacaktır. 
-                Lütfen acil olarak gerekli hazırlıkları tamamlayınız!
-            </div>
-            """
+            aciliyet_mesaji = self._aciliyet_html
         
         # Tarihi formatla
         baslangic_tarihi = reminder["baslangic_tarihi"].strftime("%d.%m.%Y")
-        gonderim_tarihi = datetime.now().strftime("%d.%m.%Y %H:%M")
+        gonderim_tarihi = (gonderim_zamani or datetime.now()).strftime("%d.%m.%Y %H:%M")
         
         # Şablonu doldur
-        body = self.email_template.format(
-            yonetici=reminder["yonetici"],
-            ihale_adi=reminder["ihale_adi"],
-            kalan_gun=reminder["kalan_gun"],
-            baslangic_tarihi=baslangic_tarihi,
-            aciliyet_mesaji=aciliyet_mesaji,
-            gonderim_tarihi=gonderim_tarihi
-        )
+        body = _render_template(self.email_template, {
+            "yonetici": reminder["yonetici"],
+            "ihale_adi": reminder["ihale_adi"],
+            "kalan_gun": reminder["kalan_gun"],
+            "baslangic_tarihi": baslangic_tarihi,
+            "aciliyet_mesaji": aciliyet_mesaji,
+            "gonderim_tarihi": gonderim_tarihi
+        })
         
         return body
     
     def test_connection(self) -> dict:
-        """SMTP bağlantısını test et"""
+        """SMTP bağlantısını test et (tüm gönderici hesapları için)"""
         try:
-            if not self.smtp_email or not self.smtp_password:
+            accounts = [acc for acc in self.pool.accounts if acc.has_credentials]
+            if not accounts:
                 return {
                     "success": False,
                     "message": "SMTP email veya password ayarlanmamış. .env dosyasını kontrol edin."
                 }
             
-            logger.info(f"🔌 SMTP bağlantısı test ediliyor: {self.smtp_server}:{self.smtp_port}")
+            failed = []
+            for account in accounts:
+                logger.info(f"🔌 SMTP bağlantısı test ediliyor: {account.email} @ {account.server}:{account.port}")
+                try:
+                    account.test()
+                except Exception as e:
+                    logger.error(f"❌ {account.email} bağlantı hatası: {str(e)}")
+                    account.record_failure()
+                    failed.append(f"{account.email}: {str(e)}")
+            
+            if len(failed) == len(accounts):
+                return {
+                    "success": False,
+                    "message": f"SMTP bağlantı hatası: {'; '.join(failed)}"
+                }
             
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.smtp_email, self.smtp_password)
+            message = "SMTP bağlantısı başarılı"
+            if len(accounts) > 1:
+                message += f" ({len(accounts) - len(failed)}/{len(accounts)} hesap)"
             
-            logger.info("✅ SMTP bağlantısı başarılı")
+            logger.info(f"✅ {message}")
             return {
                 "success": True,
-                "message": "SMTP bağlantısı başarılı"
+                "message": message
             }
             
         except Exception as e:
@@ -154,135 +282,311 @@ class EmailSender:
                 "message": f"SMTP bağlantı hatası: {str(e)}"
             }
     
-    def send_single_email(self, reminder: dict, retry_count: int = 0) -> dict:
+    def send_single_email(self, reminder: dict, retry_count: int = 0, account=None) -> dict:
         """
         Tek bir mail gönder
         
         Args:
             reminder: Hatırlatma bilgileri
             retry_count: Kaçıncı deneme olduğu
+            account: Kullanılacak gönderici hesabı (None ise havuzdan seçilir)
             
         Returns:
             dict: Gönderim sonucu
         """
+        if account is None:
+            account = self.pool.pick(reminder["yonetici_mail"])
+        if account is None:
+            return self._daily_limit_result(reminder, retry_count)
+        
+        started = time.perf_counter()
         try:
+            # Hesabın rate limit'ine göre sırayı bekle (günlük limit dolduysa gönderme)
+            if not account.wait_for_slot():
+                return self._daily_limit_result(reminder, retry_count, account)
+            started = time.perf_counter()
+            
             # Test modu kontrolü
             if self.test_mode:
-                logger.info(f"[TEST MODE] Mail gönderildi:")
-                logger.info(f"  Alıcı: {reminder['yonetici_mail']}")
-                logger.info(f"  Konu: 🔔 Hatırlatma - {reminder['ihale_adi']}")
+                logger.info(
+                    f"[TEST MODE] Mail gönderildi: {account.email} -> {reminder['yonetici_mail']} "
+                    f"({self._create_subject(reminder)})",
+                    extra=self._log_fields(reminder, account, "sent", 0.0, retry_count)
+                )
                 return {
                     "ihale_no": reminder["ihale_no"],
                     "ihale_adi": reminder["ihale_adi"],
                     "recipient": reminder["yonetici_mail"],
+                    "sender": account.email,
                     "status": "sent",
                     "timestamp": datetime.now(),
                     "error_message": None,
-                    "retry_count": retry_count
+                    "retry_count": retry_count,
+                    "latency": 0.0
                 }
             
-            # Mail içeriğini hazırla
-            subject = f"🔔 Hatırlatma - {reminder['ihale_adi']}"
-            body = self._create_email_body(reminder)
-            
-            # MIME mesaj oluştur
-            msg = MIMEMultipart('alternative')
-            msg['From'] = self.smtp_email
-            msg['To'] = reminder["yonetici_mail"]
-            msg['Subject'] = subject
-            
-            # Öncelik ayarla (1 gün kaldıysa yüksek öncelik)
-            if reminder["kalan_gun"] == 1:
-                msg['X-Priority'] = '1'
-                msg['Importance'] = 'high'
+            msg, mail_options = self._create_message(reminder, account)
             
-            # HTML içeriği ekle
-            html_part = MIMEText(body, 'html', 'utf-8')
-            msg.attach(html_part)
+            # Hesabın bağlantı havuzu üzerinden gönder
+            account.send_message(msg, mail_options)
+            account.record_success()
+            latency = time.perf_counter() - started
             
-            # SMTP üzerinden gönder
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.smtp_email, self.smtp_password)
-                server.send_message(msg)
-            
-            logger.info(f"✅ Mail gönderildi: {reminder['yonetici']} ({reminder['ihale_adi']})")
+            logger.info(
+                f"✅ Mail gönderildi: {reminder['yonetici']} ({reminder['ihale_adi']})",
+                extra=self._log_fields(reminder, account, "sent", latency, retry_count)
+            )
             
             return {
                 "ihale_no": reminder["ihale_no"],
                 "ihale_adi": reminder["ihale_adi"],
                 "recipient": reminder["yonetici_mail"],
+                "sender": account.email,
                 "status": "sent",
                 "timestamp": datetime.now(),
                 "error_message": None,
-                "retry_count": retry_count
+                "retry_count": retry_count,
+                "latency": latency
             }
             
         except Exception as e:
-            logger.error(f"❌ Mail gönderim hatası: {str(e)}")
+            logger.error(
+                f"❌ Mail gönderim hatası ({account.email}): {str(e)}",
+                extra=self._log_fields(reminder, account, "failed", time.perf_counter() - started, retry_count)
+            )
+            if is_account_error(e):
+                account.record_failure()
             return {
                 "ihale_no": reminder["ihale_no"],
                 "ihale_adi": reminder["ihale_adi"],
                 "recipient": reminder["yonetici_mail"],
+                "sender": account.email,
                 "status": "failed",
                 "timestamp": datetime.now(),
                 "error_message": str(e),
-                "retry_count": retry_count
+                "retry_count": retry_count,
+                "latency": time.perf_counter() - started,
+                "permanent_failure": permanent_failure(e)
             }
     
+    def _create_message(self, reminder: dict, account) -> tuple:
+        """
+        MIME mesajını oluştur
+        
+        Kompakt modda HTML'in yanına düz metin alternatifi eklenir. Gövde,
+        sunucu 8BITMIME destekliyorsa 8bit, desteklemiyorsa (veya henüz
+        bilinmiyorsa) quoted-printable kodlanır; base64'ün ~%33 ek yükü olmaz.
+        
+        Returns:
+            tuple: (mesaj, SMTP MAIL FROM seçenekleri)
+        """
+        from email.mime.text import MIMEText
+        from email.mime.multipart import MIMEMultipart
+        from email.charset import Charset, QP
+        
+        subject = self._create_subject(reminder)
+        body = self._create_email_body(reminder)
+        
+        msg = MIMEMultipart('alternative')
+        msg['From'] = account.email
+        msg['To'] = reminder["yonetici_mail"]
+        msg['Subject'] = subject
+        if reminder.get("message_id"):
+            # Kuyruk modunda sabit Message-ID: tekrar gönderim alıcı tarafında ayırt edilebilir
+            msg['Message-ID'] = reminder["message_id"]
+        
+        # Öncelik ayarla (1 gün kaldıysa yüksek öncelik)
+        if reminder["kalan_gun"] == 1:
+            msg['X-Priority'] = '1'
+            msg['Importance'] = 'high'
+        
+        if not self.compact:
+            msg.attach(MIMEText(body, 'html', 'utf-8'))
+            return msg, ()
+        
+        text = _html_to_text(body)
+        eight_bit = bool(account.supports_8bitmime) and all(
+            len(line.encode("utf-8")) <= _MAX_8BIT_LINE for part in (text, body) for line in part.splitlines()
+        )
+        charset = Charset('utf-8')
+        charset.body_encoding = None if eight_bit else QP
+        
+        # Alternatiflerde tercih edilen (HTML) en sonda olur
+        for content, subtype in ((text, 'plain'), (body, 'html')):
+            part = MIMEText(content, subtype, charset)
+            # MIME-Version yalnızca kök başlıkta gerekli
+            del part['MIME-Version']
+            msg.attach(part)
+        return msg, ("BODY=8BITMIME",) if eight_bit else ()
+    
+    @staticmethod
+    def _log_fields(reminder: dict, account, status: str, latency: float, retry_count: int) -> dict:
+        """JSON log satırına eklenecek mail alanları (log_config.MAIL_FIELDS)"""
+        return {
+            "ihale_no": reminder["ihale_no"],
+            "recipient": reminder["yonetici_mail"],
+            "sender": account.email,
+            "status": status,
+            "latency": round(latency, 4),
+            "attempt": retry_count + 1
+        }
+    
+    def _send_with_retry(self, reminder: dict, before_retry=None) -> dict:
+        """
+        Bir hatırlatmayı retry ve failover ile gönder
+        
+        Başarısız olan hesap bu hatırlatma için dışlanır, sonraki deneme
+        ring üzerindeki sıradaki hesaptan yapılır.
+        
+        Args:
+            before_retry: Her yeniden denemeden önce çağrılır; False dönerse
+                tekrar denenmez (ör. worker'ın lease'i düştüyse)
+        """
+        max_retries = self.max_retries
+        retry_delays = self.retry_delays
+        
+        suppressed = self.suppression.get(reminder["yonetici_mail"])
+        if suppressed is not None:
+            return self._suppressed_result(reminder, suppressed)
+        
+        failed_accounts = set()
+        result = None
+        for attempt in range(max_retries):
+            if attempt > 0 and before_retry is not None and not before_retry():
+                logger.warning(f"⚠️  Yeniden deneme iptal edildi: {reminder['yonetici_mail']} (ihale {reminder['ihale_no']})")
+                break
+            account = self.pool.pick(reminder["yonetici_mail"], exclude=failed_accounts)
+            if account is None:
+                result = self._daily_limit_result(reminder, attempt)
+                break
+            result = self.send_single_email(reminder, retry_count=attempt, account=account)
+            
+            if result["status"] == "sent":
+                break
+            
+            # Alıcı kalıcı olarak reddedildi: başka hesaptan veya beklemeyle denemek sonucu değiştirmez
+            if result.get("permanent_failure"):
+                code, reason = result["permanent_failure"]
+                self.suppression.add(reminder["yonetici_mail"], code, reason)
+                break
+            
+            failed_accounts.add(account.email)
+            
+            # Başarısız, tekrar dene
+            if attempt < max_retries - 1:
+                next_account = self.pool.pick(reminder["yonetici_mail"], exclude=failed_accounts)
+                if next_account is None:
+                    result = self._daily_limit_result(reminder, attempt + 1)
+                    break
+                if next_account is not account:
+                    logger.warning(f"⚠️  Deneme {attempt + 1} başarısız. {next_account.email} hesabına geçiliyor...")
+                else:
+                    delay = retry_delays[min(attempt, len(retry_delays) - 1)]
+                    logger.warning(f"⚠️  Deneme {attempt + 1} başarısız. {delay} saniye sonra tekrar denenecek...")
+                    time.sleep(delay)
+        
+        return result
+    
+    def _failed_result(self, reminder: dict, error_message: str, retry_count: int = 0, account=None) -> dict:
+        """Gönderim denemesi tamamlanamayan hatırlatma için başarısız sonuç üret"""
+        return {
+            "ihale_no": reminder["ihale_no"],
+            "ihale_adi": reminder["ihale_adi"],
+            "recipient": reminder["yonetici_mail"],
+            "sender": account.email if account is not None else None,
+            "status": "failed",
+            "timestamp": datetime.now(),
+            "error_message": error_message,
+            "retry_count": retry_count,
+            "latency": None
+        }
+    
+    def _daily_limit_result(self, reminder: dict, retry_count: int = 0, account=None) -> dict:
+        """Günlük limiti dolan hesap(lar) yüzünden gönderilmeyen hatırlatma için sonuç"""
+        if account is None:
+            message = "Günlük limit doldu: tüm gönderici hesapları günlük gönderim limitine ulaştı"
+        else:
+            message = f"Günlük limit doldu: {account.email} ({account.daily_limit} mail)"
+        logger.warning(
+            f"⚠️  {message}, gönderilmedi: {reminder['yonetici_mail']} ({reminder['ihale_adi']})",
+            extra={"ihale_no": reminder["ihale_no"], "recipient": reminder["yonetici_mail"], "status": "failed"}
+        )
+        return self._failed_result(reminder, message, retry_count, account)
+    
+    def _suppressed_result(self, reminder: dict, entry: dict) -> dict:
+        """Engel listesindeki alıcı için gönderim denemeden sonuç üret"""
+        logger.info(
+            f"⛔ Engelli alıcı, gönderilmedi: {reminder['yonetici_mail']} ({reminder['ihale_adi']})",
+            extra={"ihale_no": reminder["ihale_no"], "recipient": reminder["yonetici_mail"], "status": "suppressed"}
+        )
+        return {
+            "ihale_no": reminder["ihale_no"],
+            "ihale_adi": reminder["ihale_adi"],
+            "recipient": reminder["yonetici_mail"],
+            "sender": None,
+            "status": "suppressed",
+            "timestamp": datetime.now(),
+            "error_message": f"Engel listesinde: {entry['kod']} {entry['neden']} ({entry['eklenme']})",
+            "retry_count": 0,
+            "latency": None
+        }
+    
     def send_reminders(self, reminders_list: list) -> dict:
         """
         Toplu hatırlatma maili gönder
         
+        Hatırlatmalar alıcıya göre birincil gönderici hesabına dağıtılır ve her
+        hesap kendi rate limit'i ile paralel olarak gönderim yapar.
+        
         Args:
             reminders_list: Gönderilecek hatırlatmalar listesi
             
         Returns:
-            dict: Gönderim sonuçları
+            dict: Gönderim sonuçları (results, reminders_list ile aynı sırada)
         """
         try:
-            results = []
-            sent_count = 0
-            failed_count = 0
+            results = [None] * len(reminders_list)
             
             logger.info(f"\n📧 {len(reminders_list)} mail gönderilecek...")
             
+            # Hatırlatmaları birincil hesaplara göre grupla
+            shards = {}
             for i, reminder in enumerate(reminders_list):
-                logger.info(f"\n[{i+1}/{len(reminders_list)}] İşleniyor: {reminder['ihale_adi']}")
-                
-                # Mail gönder (retry mekanizması ile)
-                max_retries = 3
-                retry_delays = [5, 10, 30]  # saniye
-                
-                result = None
-                for attempt in range(max_retries):
-                    result = self.send_single_email(reminder, retry_count=attempt)
-                    
-                    if result["status"] == "sent":
-                        sent_count += 1
-                        break
-                    else:
-                        # Başarısız, tekrar dene
-                        if attempt < max_retries - 1:
-                            logger.warning(f"⚠️  Deneme {attempt + 1} başarısız. {retry_delays[attempt]} saniye sonra tekrar denenecek...")
-                            time.sleep(retry_delays[attempt])
-                        else:
-                            failed_count += 1
-                
-                results.append(result)
-                
-                # Rate limiting (her mail arasında 2 saniye bekle)
-                if i < len(reminders_list) - 1:
-                    time.sleep(2)
+                account = self.pool.primary(reminder["yonetici_mail"])
+                shards.setdefault(account.email, []).append(i)
+            
+            def send_shard(indexes: list):
+                for i in indexes:
+                    reminder = reminders_list[i]
+                    logger.info(f"\n[{i+1}/{len(reminders_list)}] İşleniyor: {reminder['ihale_adi']}")
+                    results[i] = self._send_with_retry(reminder)
+            
+            try:
+                if len(shards) <= 1:
+                    for indexes in shards.values():
+                        send_shard(indexes)
+                else:
+                    with ThreadPoolExecutor(max_workers=len(shards)) as executor:
+                        for future in [executor.submit(send_shard, idx) for idx in shards.values()]:
+                            future.result()
+            finally:
+                self._release_pool()
+            
+            sent_count = sum(1 for r in results if r["status"] == "sent")
+            suppressed_count = sum(1 for r in results if r["status"] == "suppressed")
+            failed_count = len(results) - sent_count - suppressed_count
             
             logger.info(f"\n📊 Gönderim Tamamlandı:")
             logger.info(f"  ✅ Başarılı: {sent_count}")
             logger.info(f"  ❌ Başarısız: {failed_count}")
+            if suppressed_count:
+                logger.info(f"  ⛔ Engellendi: {suppressed_count}")
             
             return {
                 "success": True,
                 "sent_count": sent_count,
                 "failed_count": failed_count,
+                "suppressed_count": suppressed_count,
                 "results": results
             }
             
@@ -292,13 +596,184 @@ class EmailSender:
                 "success": False,
                 "sent_count": 0,
                 "failed_count": 0,
+                "suppressed_count": 0,
                 "results": [],
                 "error": str(e)
             }
+    
+    def _release_pool(self):
+        """Gönderim sonunda boştaki bağlantıları kapat (havuz paylaşılıyorsa sahibine bırak)"""
+        if self._owns_pool:
+            self.pool.close()
+    
+    def send_one(self, reminder: dict, before_retry=None) -> dict:
+        """Tek hatırlatmayı retry ve failover ile gönder (bağlantılar açık kalır, bkz. close)"""
+        return self._send_with_retry(reminder, before_retry)
+    
+    def close(self):
+        """send_one ile açılan bağlantıları kapat"""
+        self._release_pool()
+    
+    def plan(self, reminders_list: list, start: datetime = None) -> list:
+        """
+        Gönderim planı çıkar (SMTP'ye bağlanmadan, bekleme yapmadan)
+        
+        Her hatırlatma send_reminders ile aynı şekilde birincil gönderici hesabına
+        atanır; tahmini gönderim zamanı hesap başına rate limit aralığıyla hesaplanır
+        (hesaplar paralel gönderir). Mesaj tahmini gönderim zamanıyla render edilip
+        hash'lenir. Engel listesindeki alıcılar gönderimde olduğu gibi atlanır:
+        hesaba atanmaz, rate limit süresine sayılmaz, "engellendi" ile işaretlenir.
+        
+        Args:
+            reminders_list: Gönderilecek hatırlatmalar (gönderim sırasıyla)
+            start: Gönderimin başlayacağı zaman (varsayılan şimdi)
+            
+        Returns:
+            list: Plan kayıtları
+        """
+        import hashlib
+        
+        start = start or datetime.now()
+        next_offset = {}
+        planned_count = {}
+        plan = []
+        
+        for i, reminder in enumerate(reminders_list):
+            suppressed = self.suppression.get(reminder["yonetici_mail"])
+            if suppressed is not None:
+                plan.append({
+                    "sira": i + 1,
+                    "ihale_no": reminder["ihale_no"],
+                    "ihale_adi": reminder["ihale_adi"],
+                    "yonetici": reminder["yonetici"],
+                    "yonetici_mail": reminder["yonetici_mail"],
+                    "hatirlatma_tipi": reminder["hatirlatma_tipi"],
+                    "kalan_gun": reminder["kalan_gun"],
+                    "oncelik": reminder["oncelik"],
+                    "gonderici": None,
+                    "konu": None,
+                    "mesaj_hash": None,
+                    "mesaj_boyutu": None,
+                    "tahmini_gonderim": None,
+                    "tahmini_gecikme_saniye": None,
+                    "gunluk_limit_asimi": False,
+                    "engellendi": True,
+                    "engel_nedeni": f"{suppressed['kod']} {suppressed['neden']} ({suppressed['eklenme']})"
+                })
+                continue
+            
+            account = self.pool.primary(reminder["yonetici_mail"])
+            offset = next_offset.get(account.email, 0.0)
+            next_offset[account.email] = offset + account.send_interval
+            planned_count[account.email] = planned_count.get(account.email, 0) + 1
+            
+            send_time = start + timedelta(seconds=offset)
+            subject = self._create_subject(reminder)
+            body = self._create_email_body(reminder, gonderim_zamani=send_time)
+            digest = hashlib.sha256()
+            for part in (reminder["yonetici_mail"], subject, body):
+                digest.update(part.encode("utf-8"))
+                digest.update(b"\0")
+            
+            plan.append({
+                "sira": i + 1,
+                "ihale_no": reminder["ihale_no"],
+                "ihale_adi": reminder["ihale_adi"],
+                "yonetici": reminder["yonetici"],
+                "yonetici_mail": reminder["yonetici_mail"],
+                "hatirlatma_tipi": reminder["hatirlatma_tipi"],
+                "kalan_gun": reminder["kalan_gun"],
+                "oncelik": reminder["oncelik"],
+                "gonderici": account.email,
+                "konu": subject,
+                "mesaj_hash": digest.hexdigest(),
+                "mesaj_boyutu": len(body.encode("utf-8")),
+                "tahmini_gonderim": send_time.isoformat(timespec="seconds"),
+                "tahmini_gecikme_saniye": round(offset, 3),
+                "gunluk_limit_asimi": planned_count[account.email] > account.daily_limit,
+                "engellendi": False,
+                "engel_nedeni": None
+            })
+        
+        return plan
+    
+    def send_stream(self, reminders, queue_size: int = 100):
+        """
+        Hatırlatmaları geldikçe gönder (akış modu)
+        
+        Her gönderici hesabının sınırlı (bounded) bir giriş kuyruğu vardır;
+        kuyruk dolduğunda okuma/zamanlama tarafı bekler, böylece bellekte en fazla
+        hesap başına queue_size hatırlatma tutulur. Sonuçlar tamamlanma sırasıyla döner.
+        
+        Args:
+            reminders: Hatırlatma üreten iterable (generator olabilir)
+            queue_size: Hesap başına kuyruk kapasitesi
+            
+        Yields:
+            tuple: (reminder, sonuç)
+        """
+        done = object()
+        inboxes = {account.email: queue.Queue(maxsize=queue_size) for account in self.pool.accounts}
+        outbox = queue.Queue(maxsize=queue_size)
+        producer_errors = []
+        
+        def produce():
+            try:
+                for reminder in reminders:
+                    account = self.pool.primary(reminder["yonetici_mail"])
+                    inboxes[account.email].put(reminder)
+            except Exception as e:
+                producer_errors.append(e)
+            finally:
+                for inbox in inboxes.values():
+                    inbox.put(done)
+        
+        def consume(inbox: queue.Queue):
+            try:
+                while True:
+                    reminder = inbox.get()
+                    if reminder is done:
+                        break
+                    logger.info(f"\n📧 İşleniyor: {reminder['ihale_adi']}")
+                    try:
+                        result = self._send_with_retry(reminder)
+                    except Exception as e:
+                        logger.error(f"❌ Gönderim hatası: {reminder['yonetici_mail']} - {str(e)}")
+                        result = self._failed_result(reminder, str(e))
+                    outbox.put((reminder, result))
+            finally:
+                # Tüketici beklenmedik şekilde dursa da ana döngü beklemede kalmasın
+                outbox.put(done)
+        
+        producer = threading.Thread(target=produce, name="reminder-producer", daemon=True)
+        workers = [
+            threading.Thread(target=consume, args=(inbox,), name=f"sender-{email}", daemon=True)
+            for email, inbox in inboxes.items()
+        ]
+        producer.start()
+        for worker in workers:
+            worker.start()
+        
+        try:
+            remaining = len(workers)
+            while remaining:
+                item = outbox.get()
+                if item is done:
+                    remaining -= 1
+                    continue
+                yield item
+            producer.join()
+        finally:
+            self._release_pool()
+        
+        if producer_errors:
+            raise producer_errors[0]
 
 
 if __name__ == "__main__":
     # Test
+    from log_config import setup_logging
+    setup_logging(log_file="")
     from dotenv import load_dotenv
     load_dotenv()
     
@@ -3,22 +3,39 @@ File Handler Module
 İhale takvim dosyasını okuma, validasyon ve güncelleme işlemlerini yapar.
 """
 
-import pandas as pd
 from datetime import datetime
 from pathlib import Path
 import logging
+import os
 import re
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def _is_missing(value) -> bool:
+    """None, NaN veya NaT mı (pandas gerektirmeden)"""
+    return value is None or value != value
+
+
 class FileHandler:
     """İhale dosyası yönetim sınıfı"""
     
-    def __init__(self, file_path: str = "data/Merkezi_Takvimi.xlsx"):
+    def __init__(self, file_path: str = "data/Merkezi_Takvimi.xlsx", write_mode: str = None):
+        """
+        Args:
+            file_path: İhale takvim dosyası
+            write_mode: Hatırlatma durumu yazım modu (None ise CALENDAR_WRITE_MODE veya "inplace")
+                - inplace: yalnızca değişen hücreler openpyxl ile güncellenir; biçim,
+                  formüller ve diğer sayfalar korunur
+                - pandas: sayfa DataFrame'den baştan yazılır (eski davranış)
+        """
         self.file_path = Path(file_path)
         self.df = None
+        self.write_mode = (write_mode or os.getenv("CALENDAR_WRITE_MODE", "inplace")).lower()
+        if self.write_mode not in ("inplace", "pandas"):
+            raise ValueError(f"Geçersiz yazım modu: {self.write_mode} (seçenekler: inplace, pandas)")
+        # İhale no -> Excel satır numaraları (okuma sırasında doldurulur)
+        self._row_map = None
         
     def validate_email(self, email: str) -> bool:
         """Email formatını kontrol et"""
@@ -45,11 +62,12 @@ class FileHandler:
                 }
             
             # Excel dosyasını oku
+            import pandas as pd
             logger.info(f"İhale dosyası okunuyor: {self.file_path}")
             self.df = pd.read_excel(self.file_path)
             
             # Sütun isimlerini temizle (gereksiz boşlukları ve newline karakterlerini kaldır)
-            self.df.columns = self.df.columns.str.strip().str.replace('\n', '').str.replace('  ', ' ')
+            self.df.columns = [self._clean_column_name(str(col)) for col in self.df.columns]
             
             # Hücrelerdeki boşlukları da temizle
             for col in self.df.select_dtypes(include=['object']).columns:
@@ -61,63 +79,12 @@ class FileHandler:
             warnings = []
             
             # Her satırı işle
+            self._row_map = {}
             for idx, row in self.df.iterrows():
-                try:
-                    # Boş satırları atla
-                    if pd.isna(row.get('S.no')):
-                        continue
-                    
-                    ihale_no = int(row['S.no'])
-                    ihale_adi = str(row['Toplantı Adı']).strip()
-                    yonetici = str(row['D.Serve İlgili Kişi']).strip()
-                    yonetici_mail = str(row['D.serve İlgili Kişi Mail']).strip()
-                    baslangic_tarihi = row['Toplantı Hazırlıkları Başlangıç Dönemi']
-                    hatirlatma_durumu = row.get('Hatırlatma Durumu')
-                    
-                    # Validasyonlar
-                    if not ihale_adi or ihale_adi == 'nan':
-                        errors.append(f"Satır {idx+2}: İhale adı boş")
-                        continue
-                    
-                    if not yonetici or yonetici == 'nan':
-                        errors.append(f"Satır {idx+2}: Yönetici boş")
-                        continue
-                    
-                    if not self.validate_email(yonetici_mail):
-                        errors.append(f"Satır {idx+2}: Geçersiz mail adresi: {yonetici_mail}")
-                        continue
-                    
-                    # Tarih kontrolü
-                    if pd.isna(baslangic_tarihi):
-                        errors.append(f"Satır {idx+2}: Başlangıç tarihi boş")
-                        continue
-                    
-                    # Tarihi datetime'a çevir
-                    if not isinstance(baslangic_tarihi, datetime):
-                        try:
-                            baslangic_tarihi = pd.to_datetime(baslangic_tarihi)
-                        except:
-                            errors.append(f"Satır {idx+2}: Geçersiz tarih formatı")
-                            continue
-                    
-                    # Geçmiş tarih kontrolü
-                    if baslangic_tarihi.date() < datetime.now().date():
-                        warnings.append(f"İhale {ihale_no} ({ihale_adi}): Başlangıç tarihi geçmişte ({baslangic_tarihi.date()})")
-                    
-                    # İhale dictionary'si oluştur
-                    ihale_dict = {
-                        "ihale_no": ihale_no,
-                        "ihale_adi": ihale_adi,
-                        "yonetici": yonetici,
-                        "yonetici_mail": yonetici_mail,
-                        "baslangic_tarihi": baslangic_tarihi,
-                        "hatirlatma_durumu": str(hatirlatma_durumu) if pd.notna(hatirlatma_durumu) else None
-                    }
-                    
+                ihale_dict = self._parse_row(row, idx + 2, errors, warnings)
+                if ihale_dict is not None:
                     ihale_list.append(ihale_dict)
-                    
-                except Exception as e:
-                    errors.append(f"Satır {idx+2}: İşlenirken hata: {str(e)}")
+                    self._row_map.setdefault(ihale_dict["ihale_no"], []).append(idx + 2)
             
             logger.info(f"✅ {len(ihale_list)} ihale başarıyla okundu")
             if errors:
@@ -145,6 +112,130 @@ class FileHandler:
                 "valid_count": 0
             }
     
+    def iter_ihale_rows(self, errors: list = None, warnings: list = None):
+        """
+        İhale dosyasını satır satır akış halinde oku
+        
+        read_ihale_file ile aynı validasyonları uygular ama tüm dosyayı
+        DataFrame'e yüklemez; geçerli her ihale okunur okunmaz döner.
+        
+        Args:
+            errors: Satır hatalarının ekleneceği liste (opsiyonel)
+            warnings: Uyarıların ekleneceği liste (opsiyonel)
+            
+        Yields:
+            dict: İhale bilgileri
+        """
+        from openpyxl import load_workbook
+        
+        errors = errors if errors is not None else []
+        warnings = warnings if warnings is not None else []
+        
+        if not self.file_path.exists():
+            errors.append(f"Dosya bulunamadı: {self.file_path}")
+            return
+        
+        logger.info(f"İhale dosyası akış halinde okunuyor: {self.file_path}")
+        workbook = load_workbook(self.file_path, read_only=True, data_only=True)
+        try:
+            sheet = workbook.worksheets[0]
+            # Boyut bilgisi için tüm sayfayı ayrıca taramasın (satırlar bitene kadar okunur)
+            sheet.reset_dimensions()
+            rows = sheet.iter_rows(values_only=True)
+            header = next(rows, None)
+            if header is None:
+                return
+            columns = [self._clean_column_name(str(name)) if name is not None else "" for name in header]
+            
+            self._row_map = {}
+            for line_no, values in enumerate(rows, start=2):
+                row = {}
+                for col, value in zip(columns, values):
+                    if isinstance(value, str) and col != 'Hatırlatma Durumu':
+                        value = value.strip()
+                    row[col] = value
+                
+                ihale_dict = self._parse_row(row, line_no, errors, warnings)
+                if ihale_dict is not None:
+                    self._row_map.setdefault(ihale_dict["ihale_no"], []).append(line_no)
+                    yield ihale_dict
+        finally:
+            workbook.close()
+    
+    @staticmethod
+    def _clean_column_name(name: str) -> str:
+        """Sütun ismindeki gereksiz boşlukları ve newline karakterlerini kaldır"""
+        return name.strip().replace('\n', '').replace('  ', ' ')
+    
+    def _parse_row(self, row, line_no: int, errors: list, warnings: list):
+        """
+        Tek satırı validasyondan geçirip ihale dictionary'sine çevir
+        
+        Args:
+            row: Satır (pandas Series veya dict)
+            line_no: Excel satır numarası (hata mesajları için)
+            
+        Returns:
+            dict: İhale bilgileri (geçersiz veya boş satırda None)
+        """
+        try:
+            # Boş satırları atla
+            if _is_missing(row.get('S.no')):
+                return None
+            
+            ihale_no = int(row['S.no'])
+            ihale_adi = str(row['Toplantı Adı']).strip()
+            yonetici = str(row['D.Serve İlgili Kişi']).strip()
+            yonetici_mail = str(row['D.serve İlgili Kişi Mail']).strip()
+            baslangic_tarihi = row['Toplantı Hazırlıkları Başlangıç Dönemi']
+            hatirlatma_durumu = row.get('Hatırlatma Durumu')
+            
+            # Validasyonlar
+            if not ihale_adi or ihale_adi in ('nan', 'None'):
+                errors.append(f"Satır {line_no}: İhale adı boş")
+                return None
+            
+            if not yonetici or yonetici in ('nan', 'None'):
+                errors.append(f"Satır {line_no}: Yönetici boş")
+                return None
+            
+            if not self.validate_email(yonetici_mail):
+                errors.append(f"Satır {line_no}: Geçersiz mail adresi: {yonetici_mail}")
+                return None
+            
+            # Tarih kontrolü
+            if _is_missing(baslangic_tarihi):
+                errors.append(f"Satır {line_no}: Başlangıç tarihi boş")
+                return None
+            
+            # Tarihi datetime'a çevir
+            if not isinstance(baslangic_tarihi, datetime):
+                try:
+                    # pd.to_datetime ile aynı ayrıştırıcı; pandas import etmeden
+                    from dateutil import parser as date_parser
+                    baslangic_tarihi = date_parser.parse(str(baslangic_tarihi))
+                except:
+                    errors.append(f"Satır {line_no}: Geçersiz tarih formatı")
+                    return None
+            
+            # Geçmiş tarih kontrolü
+            if baslangic_tarihi.date() < datetime.now().date():
+                warnings.append(f"İhale {ihale_no} ({ihale_adi}): Başlangıç tarihi geçmişte ({baslangic_tarihi.date()})")
+            
+            # İhale dictionary'si oluştur
+            return {
+                "ihale_no": ihale_no,
+                "ihale_adi": ihale_adi,
+                "yonetici": yonetici,
+                "yonetici_mail": yonetici_mail,
+                "baslangic_tarihi": baslangic_tarihi,
+                "hatirlatma_durumu": str(hatirlatma_durumu) if not _is_missing(hatirlatma_durumu) else None
+            }
+            
+        except Exception as e:
+            errors.append(f"Satır {line_no}: İşlenirken hata: {str(e)}")
+            return None
+    
     def update_hatirlatma_durumu(self, ihale_no: int, hatirlatma_tipi: str, tarih: datetime) -> bool:
         """
         İhalenin hatırlatma durumunu güncelle
@@ -157,6 +248,12 @@ class FileHandler:
         Returns:
             bool: Başarı durumu
         """
+        if self.write_mode == "inplace":
+            updated = self._patch_status_cells([(ihale_no, hatirlatma_tipi, tarih)])
+            if updated:
+                logger.info(f"✅ İhale {ihale_no} hatırlatma durumu güncellendi: {hatirlatma_tipi}")
+            return updated == 1
+        
         try:
             if self.df is None:
                 logger.error("Dosya okunmamış")
@@ -174,7 +271,7 @@ class FileHandler:
             # Yeni durum bilgisi
             new_entry = f"{hatirlatma_tipi}:{tarih.strftime('%Y-%m-%d')}"
             
-            if pd.isna(current_status):
+            if _is_missing(current_status):
                 new_status = new_entry
             else:
                 new_status = f"{current_status}, {new_entry}"
@@ -192,22 +289,165 @@ class FileHandler:
             logger.error(f"❌ Güncelleme hatası: {str(e)}")
             return False
     
-    def backup_file(self) -> bool:
-        """Dosyanın yedeğini al"""
+    def update_hatirlatma_durumu_batch(self, updates: list) -> int:
+        """
+        Birden fazla ihalenin hatırlatma durumunu tek dosya yazımıyla güncelle
+        
+        Args:
+            updates: (ihale_no, hatirlatma_tipi, tarih) üçlülerinin listesi
+            
+        Returns:
+            int: Güncellenen kayıt sayısı
+        """
+        if not updates:
+            return 0
+        
+        if self.write_mode == "inplace":
+            updated = self._patch_status_cells(updates)
+            if updated:
+                logger.info(f"✅ {updated} ihalenin hatırlatma durumu güncellendi")
+            return updated
+        
         try:
-            backup_dir = Path("data/backups")
-            backup_dir.mkdir(parents=True, exist_ok=True)
+            if self.df is None:
+                # Akış modunda dosya DataFrame olarak okunmamış olabilir
+                import pandas as pd
+                self.df = pd.read_excel(self.file_path)
+                self.df.columns = [self._clean_column_name(str(col)) for col in self.df.columns]
             
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            backup_path = backup_dir / f"Merkezi_Takvimi_backup_{timestamp}.xlsx"
+            if self.df['Hatırlatma Durumu'].dtype != object:
+                self.df['Hatırlatma Durumu'] = self.df['Hatırlatma Durumu'].astype(object)
             
-            if self.file_path.exists():
-                import shutil
-                shutil.copy2(self.file_path, backup_path)
-                logger.info(f"✅ Backup oluşturuldu: {backup_path}")
-                return True
+            updated = 0
+            for ihale_no, hatirlatma_tipi, tarih in updates:
+                mask = self.df['S.no'] == ihale_no
+                if not mask.any():
+                    logger.error(f"İhale {ihale_no} bulunamadı")
+                    continue
+                
+                current_status = self.df.loc[mask, 'Hatırlatma Durumu'].iloc[0]
+                new_entry = f"{hatirlatma_tipi}:{tarih.strftime('%Y-%m-%d')}"
+                
+                if _is_missing(current_status):
+                    new_status = new_entry
+                else:
+                    new_status = f"{current_status}, {new_entry}"
+                
+                self.df.loc[mask, 'Hatırlatma Durumu'] = new_status
+                updated += 1
             
-            return False
+            if updated:
+                self.df.to_excel(self.file_path, index=False)
+                logger.info(f"✅ {updated} ihalenin hatırlatma durumu güncellendi")
+            
+            return updated
+            
+        except Exception as e:
+            logger.error(f"❌ Toplu güncelleme hatası: {str(e)}")
+            return 0
+    
+    @staticmethod
+    def _as_ihale_no(value):
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return None
+    
+    def _locate_rows(self, sheet, sno_col: int, ihale_no: int) -> list:
+        """
+        İhalenin Excel satırlarını bul
+        
+        Okuma sırasında tutulan satır haritası kullanılır. Harita yoksa (dosya bu
+        nesneyle okunmadıysa) veya dosya o zamandan beri değiştiyse S.no sütunu
+        bir kez taranarak harita yeniden kurulur.
+        """
+        rows = (self._row_map or {}).get(ihale_no)
+        if rows and all(self._as_ihale_no(sheet.cell(row=r, column=sno_col).value) == ihale_no for r in rows):
+            return rows
+        
+        self._row_map = {}
+        for line_no, (value,) in enumerate(
+            sheet.iter_rows(min_row=2, min_col=sno_col, max_col=sno_col, values_only=True), start=2
+        ):
+            number = self._as_ihale_no(value)
+            if number is not None:
+                self._row_map.setdefault(number, []).append(line_no)
+        return self._row_map.get(ihale_no, [])
+    
+    def _patch_status_cells(self, updates: list) -> int:
+        """
+        Hatırlatma Durumu hücrelerini openpyxl ile yerinde güncelle ve dosyayı bir kez kaydet
+        
+        Yalnızca ilgili hücrelerin değeri değişir; hücre biçimleri, formüller ve
+        diğer sayfalar olduğu gibi kalır. Dosya geçici bir kopyaya yazılıp
+        değiştirildiği için yarıda kalan bir kayıt takvimi bozmaz.
+        
+        Args:
+            updates: (ihale_no, hatirlatma_tipi, tarih) üçlülerinin listesi
+            
+        Returns:
+            int: Güncellenen kayıt sayısı
+        """
+        try:
+            from openpyxl import load_workbook
+            
+            workbook = load_workbook(self.file_path)
+            sheet = workbook.worksheets[0]
+            header = {
+                self._clean_column_name(str(cell.value)): cell.column
+                for cell in sheet[1] if cell.value is not None
+            }
+            sno_col = header.get('S.no')
+            if sno_col is None:
+                logger.error("❌ Takvimde S.no sütunu bulunamadı")
+                return 0
+            
+            status_col = header.get('Hatırlatma Durumu')
+            if status_col is None:
+                status_col = sheet.max_column + 1
+                sheet.cell(row=1, column=status_col, value='Hatırlatma Durumu')
+            
+            updated = 0
+            for ihale_no, hatirlatma_tipi, tarih in updates:
+                rows = self._locate_rows(sheet, sno_col, int(ihale_no))
+                if not rows:
+                    logger.error(f"İhale {ihale_no} bulunamadı")
+                    continue
+                
+                new_entry = f"{hatirlatma_tipi}:{tarih.strftime('%Y-%m-%d')}"
+                for row in rows:
+                    cell = sheet.cell(row=row, column=status_col)
+                    current_status = cell.value
+                    if current_status is None or str(current_status).strip() == "":
+                        cell.value = new_entry
+                    else:
+                        cell.value = f"{current_status}, {new_entry}"
+                updated += 1
+            
+            if updated:
+                tmp_file = self.file_path.with_name(self.file_path.name + ".tmp")
+                workbook.save(tmp_file)
+                tmp_file.replace(self.file_path)
+            
+            return updated
+            
+        except Exception as e:
+            logger.error(f"❌ Hücre güncelleme hatası: {str(e)}")
+            return 0
+    
+    def backup_file(self) -> bool:
+        """Dosyanın yedeğini al (içerik değişmediyse yeni kopya oluşturulmaz, bkz. BackupStore)"""
+        try:
+            if not self.file_path.exists():
+                return False
+
+            from backup_store import BackupStore
+            result = BackupStore().snapshot(self.file_path.stem, {self.file_path.name: self.file_path})
+            if result["skipped"]:
+                logger.info(f"ℹ️  Takvim değişmemiş, backup atlandı ({result['snapshot_id']})")
+            else:
+                logger.info(f"✅ Backup oluşturuldu: {result['snapshot_id']}")
+            return True
             
         except Exception as e:
             logger.error(f"❌ Backup hatası: {str(e)}")
@@ -216,6 +456,8 @@ class FileHandler:
 
 if __name__ == "__main__":
     # Test
+    from log_config import setup_logging
+    setup_logging(log_file="")
     handler = FileHandler()
     result = handler.read_ihale_file()
     
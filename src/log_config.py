@@ -0,0 +1,139 @@
+"""
+Logging Configuration
+Tüm log ayarları buradadır. Modüller yalnızca logging.getLogger(__name__)
+kullanır. Log kayıtları QueueHandler ile kuyruğa atılır; dosya ve konsola
+yazma işini arka plandaki QueueListener thread'i yapar, böylece gönderim
+döngüsü disk I/O'su beklemez.
+
+Ayarlar (.env):
+    LOG_LEVEL          Log seviyesi (varsayılan INFO)
+    LOG_FILE           Metin log dosyası (varsayılan logs/system.log)
+    LOG_JSON_FILE      JSON-lines log dosyası (boşsa kapalı, ör. logs/system.jsonl)
+    LOG_MAX_BYTES      Dosya başına en büyük boyut (varsayılan 10 MB)
+    LOG_BACKUP_COUNT   Saklanacak eski dosya sayısı (varsayılan 5)
+"""
+
+import atexit
+import json
+import os
+import queue
+import sys
+from datetime import datetime
+from pathlib import Path
+import logging
+import logging.handlers
+
+TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# JSON satırlarına (varsa) eklenen mail alanları: logger.info(..., extra={...})
+MAIL_FIELDS = ("ihale_no", "recipient", "sender", "status", "latency", "attempt", "tenant")
+
+_listener = None
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Her kaydı tek satır JSON olarak biçimlendirir"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage().strip()
+        }
+        for field in MAIL_FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                payload[field] = value
+        if record.exc_info:
+            payload["exception"] = self.formatException(record.exc_info)
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+def _rotating_handler(path: str, max_bytes: int, backup_count: int) -> logging.Handler:
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    return logging.handlers.RotatingFileHandler(
+        path, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8"
+    )
+
+
+def setup_logging(log_file: str = None, json_file: str = None, level: str = None,
+                  max_bytes: int = None, backup_count: int = None, console: bool = True):
+    """
+    Root logger'ı kuyruk tabanlı olarak yapılandır (tekrar çağrılırsa önceki ayar kapatılır)
+
+    Args:
+        log_file: Metin log dosyası (None ise LOG_FILE, "" ise dosyaya yazılmaz)
+        json_file: JSON-lines log dosyası (None ise LOG_JSON_FILE)
+        level: Log seviyesi (None ise LOG_LEVEL)
+        max_bytes: Rotasyon boyutu (None ise LOG_MAX_BYTES)
+        backup_count: Eski dosya sayısı (None ise LOG_BACKUP_COUNT)
+        console: Konsola (stderr) yazılsın mı
+
+    Returns:
+        QueueListener: Arka plan yazıcısı
+    """
+    global _listener
+    shutdown_logging()
+
+    log_file = os.getenv("LOG_FILE", "logs/system.log") if log_file is None else log_file
+    json_file = os.getenv("LOG_JSON_FILE", "") if json_file is None else json_file
+    level = (level or os.getenv("LOG_LEVEL", "INFO")).upper()
+    max_bytes = max_bytes if max_bytes is not None else int(os.getenv("LOG_MAX_BYTES", str(10 * 1024 * 1024)))
+    backup_count = backup_count if backup_count is not None else int(os.getenv("LOG_BACKUP_COUNT", "5"))
+
+    text_formatter = logging.Formatter(TEXT_FORMAT)
+    handlers = []
+    if log_file:
+        handler = _rotating_handler(log_file, max_bytes, backup_count)
+        handler.setFormatter(text_formatter)
+        handlers.append(handler)
+    if json_file:
+        handler = _rotating_handler(json_file, max_bytes, backup_count)
+        handler.setFormatter(JsonLinesFormatter())
+        handlers.append(handler)
+    if console:
+        handler = logging.StreamHandler(sys.stderr)
+        handler.setFormatter(text_formatter)
+        handlers.append(handler)
+
+    log_queue = queue.SimpleQueue()
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+        handler.close()
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(level)
+
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    return _listener
+
+
+def shutdown_logging():
+    """Kuyrukta bekleyen kayıtları yaz ve arka plan yazıcısını durdur"""
+    global _listener
+    if _listener is None:
+        return
+    listener, _listener = _listener, None
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+def configure_worker_logging(level: str = None):
+    """
+    Alt süreçler (ProcessPoolExecutor) için doğrudan stderr'e yazan ayar
+
+    Fork ile kopyalanan QueueHandler'ın kuyruğunu alt süreçte okuyan bir
+    listener olmadığından kayıtlar kaybolurdu; log dosyasına tek süreç yazar.
+    """
+    logging.basicConfig(
+        level=(level or os.getenv("LOG_LEVEL", "INFO")).upper(),
+        format=TEXT_FORMAT,
+        stream=sys.stderr,
+        force=True
+    )
+
+
+atexit.register(shutdown_logging)
@@ -3,59 +3,604 @@ Main Orchestrator
 Tüm agentları koordine ederek ihale hatırlatma sistemini çalıştırır.
 """
 
+import os
 import sys
+import time
+import argparse
+from itertools import chain
+from contextlib import contextmanager
 from pathlib import Path
-from datetime import datetime
+from datetime import date, datetime, timedelta
 import logging
 from dotenv import load_dotenv
 
-# Modülleri import et
+# Modülleri import et (Email ve Report agentları pandas/openpyxl/smtplib gerektirdiği
+# için ilk kullanımda import edilir; hatırlatma olmayan gün bunları hiç yüklemez)
 from file_handler import FileHandler
 from scheduler import Scheduler
-from email_sender import EmailSender
-from report_manager import ReportManager
+from due_cache import DueCache
+from metrics import RunMetrics, StageMetrics, peak_rss_bytes
+from profiling import StageProfiler, NullProfiler
+from log_config import setup_logging
 
-# Logging ayarları
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('logs/system.log'),
-        logging.StreamHandler()
-    ]
-)
 logger = logging.getLogger(__name__)
 
 
 class IhaleHatirlatmaSistemi:
     """Ana sistem sınıfı - Tüm agentları yönetir"""
     
-    def __init__(self):
+    def __init__(self, profile: bool = False):
         logger.info("="*80)
         logger.info("🚀 İhale Hatırlatma Sistemi Başlatılıyor...")
         logger.info("="*80)
         
-        # Environment variables'ı yükle
-        load_dotenv()
-        
-        # Agentları başlat
+        # Agentları başlat (Email ve Report agentları ilk kullanımda oluşturulur)
         self.file_handler = FileHandler("data/Merkezi_Takvimi.xlsx")
         self.scheduler = Scheduler()
-        self.email_sender = EmailSender()
-        self.report_manager = ReportManager("data/mail_raporu.xlsx")
+        self.due_cache = DueCache()
+        self.metrics = RunMetrics()
+        self.profiler = StageProfiler() if profile else NullProfiler()
+        self._email_sender = None
+        self._report_manager = None
+        
+        logger.info("✅ Agentlar hazır\n")
+    
+    @property
+    def email_sender(self) -> "EmailSender":
+        if self._email_sender is None:
+            from email_sender import EmailSender
+            self._email_sender = EmailSender()
+        return self._email_sender
+    
+    @property
+    def report_manager(self) -> "ReportManager":
+        if self._report_manager is None:
+            from report_manager import ReportManager
+            self._report_manager = ReportManager("data/mail_raporu.xlsx")
+        return self._report_manager
+    
+    def _quiet_day_result(self, start_time: datetime, message: str, fast_path: bool) -> dict:
+        """Gönderilecek hatırlatma olmayan gün için sonuç"""
+        duration = (datetime.now() - start_time).total_seconds()
+        logger.info(f"ℹ️  {message} ({duration:.3f} saniye)\n")
+        return {
+            "success": True,
+            "reminders_sent": 0,
+            "message": message,
+            "fast_path": fast_path,
+            "duration_seconds": duration
+        }
+    
+    def _finish_run(self, start_time: datetime, sent_count: int, failed_count: int, next_due) -> dict:
+        """Excel raporunu üret, önbelleği kaydet ve özet istatistikleri logla"""
+        # Excel raporunu çalışma sonunda bir kez üret
+        with self._stage("report"):
+            self.report_manager.export_excel()
+        
+        # Sonraki hatırlatma tarihini önbelleğe al
+        self.due_cache.save(self.file_handler.file_path, next_due)
+        
+        logger.info("✅ Raporlar güncellendi\n")
+        
+        # Günlük istatistikleri göster
+        daily_stats = self.report_manager.get_daily_statistics()
+        logger.info("📈 Bugünkü Özet İstatistikler:")
+        logger.info("-" * 80)
+        logger.info(f"  • Toplam Gönderim: {daily_stats['toplam_gonderim']}")
+        logger.info(f"  • Başarılı: {daily_stats['basarili']}")
+        logger.info(f"  • Başarısız: {daily_stats['basarisiz']}")
+        if daily_stats.get('engellendi'):
+            logger.info(f"  • Engellendi: {daily_stats['engellendi']}")
+        logger.info(f"  • 60 Gün: {daily_stats['60_gun']}")
+        logger.info(f"  • 30 Gün: {daily_stats['30_gun']}")
+        logger.info(f"  • 1 Gün: {daily_stats['1_gun']}")
+        logger.info(f"  • Farklı Yönetici: {daily_stats['benzersiz_yonetici']}\n")
+        
+        # Bitiş zamanı
+        end_time = datetime.now()
+        duration = (end_time - start_time).total_seconds()
+        
+        logger.info("="*80)
+        logger.info(f"✅ İşlem Başarıyla Tamamlandı!")
+        logger.info(f"⏱️  Toplam Süre: {duration:.2f} saniye")
+        logger.info(f"🕐 Bitiş Zamanı: {end_time.strftime('%Y-%m-%d %H:%M:%S')}")
+        logger.info("="*80)
+        
+        return {
+            "success": True,
+            "reminders_sent": sent_count,
+            "reminders_failed": failed_count,
+            "duration_seconds": duration,
+            "statistics": daily_stats
+        }
+    
+    @contextmanager
+    def _stage(self, name: str):
+        """Aşamayı metrik ve (--profile açıksa) profiler ile ölç"""
+        with self.profiler.stage(name), self.metrics.stage(name) as stage:
+            yield stage
+    
+    def _export_metrics(self, result: dict) -> dict:
+        """Çalıştırma metriklerini textfile ve JSON özet olarak yaz"""
+        self.metrics.finish(result.get("success", False))
+        paths = self.metrics.export()
+        result["metrics_file"] = str(paths["summary"])
+        if self.profiler.enabled:
+            self.profiler.dump()
+        return result
+    
+    def _check_fast_path(self, start_time: datetime):
+        """Takvim değişmediyse ve sıradaki hatırlatma ileride ise sessiz gün sonucu döndür"""
+        quiet, next_due = self.due_cache.is_quiet_day(self.file_handler.file_path, self.scheduler.today)
+        if not quiet:
+            return None
+        next_info = f"sonraki hatırlatma: {next_due}" if next_due else "ileride hatırlatma yok"
+        return self._quiet_day_result(
+            start_time,
+            f"Bugün gönderilecek hatırlatma yok (takvim değişmedi, {next_info})",
+            fast_path=True
+        )
+    
+    def _test_smtp_connection(self):
+        logger.info("🔌 SMTP Bağlantısı Test Ediliyor...")
+        logger.info("-" * 80)
+        with self._stage("smtp_test") as stage:
+            connection_test = self.email_sender.test_connection()
+            stage.items = len(self.email_sender.pool.accounts)
+        
+        if not connection_test["success"]:
+            logger.error(f"❌ {connection_test['message']}")
+            logger.error("⚠️  Mailler gönderilemeyecek ama rapor oluşturulacak.\n")
+        else:
+            logger.info(f"✅ {connection_test['message']}\n")
+    
+    def _flush_report_batch(self, batch: list):
+        with self._stage("report") as stage:
+            stage.items += self.report_manager.add_results(batch)
+    
+    def _flush_status_batch(self, batch: list):
+        with self._stage("write_back") as stage:
+            stage.items += self.file_handler.update_hatirlatma_durumu_batch(batch)
+    
+    def run_pipelined(self, batch_size: int = None, queue_size: int = None) -> dict:
+        """
+        Sistemi akış (pipeline) modunda çalıştır
+        
+        Takvim satır satır okunur, her ihale okunur okunmaz zamanlayıcıdan geçer ve
+        gönderilecek hatırlatmalar sınırlı kuyruklar üzerinden hemen gönderilmeye başlar.
+        Rapor kayıtları ve takvim durum güncellemeleri göndericinin arkasından
+        batch_size'lık gruplar halinde yazılır. Hatırlatmalar öncelik yerine takvim
+        sırasıyla gönderilir.
         
-        logger.info("✅ Tüm agentlar başlatıldı\n")
+        Args:
+            batch_size: Rapor/takvim yazım grubu (varsayılan PIPELINE_BATCH_SIZE veya 50)
+            queue_size: Aşamalar arası kuyruk kapasitesi (varsayılan PIPELINE_QUEUE_SIZE veya 100)
+        """
+        self.metrics = RunMetrics("pipeline")
+        return self._export_metrics(self._run_pipelined(batch_size, queue_size))
+    
+    def _run_pipelined(self, batch_size: int = None, queue_size: int = None) -> dict:
+        try:
+            start_time = datetime.now()
+            batch_size = batch_size or int(os.getenv("PIPELINE_BATCH_SIZE", "50"))
+            queue_size = queue_size or int(os.getenv("PIPELINE_QUEUE_SIZE", "100"))
+            logger.info(f"⏰ Başlangıç Zamanı: {start_time.strftime('%Y-%m-%d %H:%M:%S')} (pipeline modu)\n")
+            
+            fast_result = self._check_fast_path(start_time)
+            if fast_result is not None:
+                return fast_result
+            
+            if not self.file_handler.file_path.exists():
+                logger.error("❌ İhale dosyası okunamadı. İşlem sonlandırılıyor.")
+                return {
+                    "success": False,
+                    "error": "İhale dosyası okunamadı",
+                    "details": {"errors": [f"Dosya bulunamadı: {self.file_handler.file_path}"]}
+                }
+            
+            errors = []
+            warnings = []
+            statistics = {}
+            state = {"next_due": None, "reader_done": False}
+            
+            def ihale_stream():
+                # Sonraki hatırlatma tarihi akış sırasında hesaplanır, liste tutulmaz
+                # Üretici thread'de çalışır; yalnızca metrik tutulur (cProfile thread başına).
+                # Okuma gönderimle örtüştüğü için süre akışın başından sonuna kadardır.
+                with self.metrics.stage("read") as stage:
+                    for ihale in self.file_handler.iter_ihale_rows(errors, warnings):
+                        stage.items += 1
+                        due = self.scheduler.next_due_date([ihale])
+                        if due is not None and (state["next_due"] is None or due < state["next_due"]):
+                            state["next_due"] = due
+                        yield ihale
+                state["reader_done"] = True
+            
+            reminder_iter = self.scheduler.iter_reminders(ihale_stream(), statistics, warnings)
+            
+            # İlk hatırlatma bulunana kadar oku; hiç yoksa gönderici ve rapor hiç oluşturulmaz
+            first_reminder = next(reminder_iter, None)
+            if first_reminder is None:
+                if errors:
+                    logger.warning(f"⚠️  {len(errors)} hata bulundu")
+                self.due_cache.save(self.file_handler.file_path, state["next_due"])
+                return self._quiet_day_result(start_time, "Bugün gönderilecek hatırlatma yok", fast_path=False)
+            
+            self._test_smtp_connection()
+            
+            logger.info("📧 Hatırlatmalar okundukça gönderiliyor...")
+            logger.info("-" * 80)
+            
+            sent_count = 0
+            failed_count = 0
+            suppressed_count = 0
+            first_mail_seconds = None
+            report_batch = []
+            status_batch = []
+            
+            stream = self.email_sender.send_stream(chain([first_reminder], reminder_iter), queue_size=queue_size)
+            send_started = time.perf_counter()
+            for reminder, result in stream:
+                self.metrics.record_mail(result)
+                if first_mail_seconds is None:
+                    first_mail_seconds = (datetime.now() - start_time).total_seconds()
+                    logger.info(f"⚡ İlk mail {first_mail_seconds:.2f} saniyede işlendi")
+                
+                report_batch.append((reminder, result))
+                if result["status"] == "sent":
+                    sent_count += 1
+                    status_batch.append((result["ihale_no"], reminder["hatirlatma_tipi"], result["timestamp"]))
+                elif result["status"] == "failed":
+                    failed_count += 1
+                else:
+                    suppressed_count += 1
+                
+                if len(report_batch) >= batch_size:
+                    self._flush_report_batch(report_batch)
+                    report_batch = []
+                
+                # Takvim okuması bitmeden aynı dosyaya yazılmaz
+                if state["reader_done"] and len(status_batch) >= batch_size:
+                    self._flush_status_batch(status_batch)
+                    status_batch = []
+            
+            self._flush_report_batch(report_batch)
+            self._flush_status_batch(status_batch)
+            
+            # Akış aşaması: okuma, zamanlama ve gönderim iç içe geçer
+            send_stage = self.metrics.stages.setdefault("send", StageMetrics("send"))
+            send_stage.duration_seconds = time.perf_counter() - send_started
+            send_stage.items = sent_count + failed_count + suppressed_count
+            send_stage.calls = 1
+            send_stage.peak_rss_bytes = peak_rss_bytes()
+            
+            logger.info(f"\n✅ Mail gönderimi tamamlandı")
+            logger.info(f"  • Okunan İhale: {statistics['toplam_ihale']}")
+            logger.info(f"  • Başarılı: {sent_count}")
+            logger.info(f"  • Başarısız: {failed_count}")
+            if suppressed_count:
+                logger.info(f"  • Engellendi: {suppressed_count}")
+            if errors:
+                logger.warning(f"  ⚠️  Geçersiz satır: {len(errors)}")
+            logger.info("")
+            
+            next_due = state["next_due"] if failed_count == 0 else self.scheduler.today
+            result = self._finish_run(start_time, sent_count, failed_count, next_due)
+            result["pipeline"] = True
+            result["first_mail_seconds"] = first_mail_seconds
+            return result
+            
+        except Exception as e:
+            logger.error(f"\n❌ HATA: {str(e)}")
+            logger.exception("Detaylı hata:")
+            return {
+                "success": False,
+                "error": str(e)
+            }
+    
+    def plan(self, output: str = None, fmt: str = "json") -> dict:
+        """
+        Bugünün gönderim planını çıkar (dry-run)
+        
+        Hatırlatmalar normal çalıştırmayla aynı sırada hesaplanır, her mesaj render
+        edilip hash'lenir ve tahmini gönderim zamanı hesapların rate limit'lerine göre
+        bulunur. SMTP'ye bağlanılmaz; rapor, takvim ve önbellek değiştirilmez.
+        
+        Args:
+            output: Plan dosyası ("-" ise stdout, varsayılan logs/gonderim_plani.<fmt>)
+            fmt: "json" veya "csv"
+            
+        Returns:
+            dict: Plan özeti
+        """
+        try:
+            start_time = datetime.now()
+            
+            if not self.file_handler.file_path.exists():
+                logger.error("❌ İhale dosyası okunamadı.")
+                return {
+                    "success": False,
+                    "error": "İhale dosyası okunamadı"
+                }
+            
+            errors = []
+            warnings = []
+            ihale_list = list(self.file_handler.iter_ihale_rows(errors, warnings))
+            
+            schedule_result = self.scheduler.calculate_reminders(ihale_list)
+            if not schedule_result["success"]:
+                return {
+                    "success": False,
+                    "error": "Hatırlatma hesaplama başarısız",
+                    "details": schedule_result
+                }
+            
+            items = self.email_sender.plan(schedule_result["reminders_to_send"], start=start_time)
+            
+            accounts = {}
+            for item in items:
+                if item["engellendi"]:
+                    continue
+                account = accounts.setdefault(item["gonderici"], {"adet": 0, "tahmini_bitis": None})
+                account["adet"] += 1
+                account["tahmini_bitis"] = item["tahmini_gonderim"]
+            
+            summary = {
+                "plan_tarihi": self.scheduler.today.isoformat(),
+                "olusturma_zamani": start_time.isoformat(timespec="seconds"),
+                "takvim": str(self.file_handler.file_path),
+                "gecerli_ihale": len(ihale_list),
+                "hatali_satir": len(errors),
+                "hatirlatma_sayisi": len(items),
+                "engellenen": sum(1 for item in items if item["engellendi"]),
+                "tahmini_sure_saniye": max(
+                    (item["tahmini_gecikme_saniye"] for item in items if not item["engellendi"]), default=0.0
+                ),
+                "gunluk_limit_asimi": sum(1 for item in items if item["gunluk_limit_asimi"]),
+                "hesaplar": accounts
+            }
+            
+            output = output or f"logs/gonderim_plani.{fmt}"
+            self._write_records(summary, items, output, fmt, "plan")
+            
+            duration = (datetime.now() - start_time).total_seconds()
+            logger.info(f"🗺️  Gönderim planı: {len(items)} hatırlatma ({summary['engellenen']} engelli alıcı), tahmini süre "
+                        f"{summary['tahmini_sure_saniye']:.0f} saniye ({duration:.3f} saniyede hesaplandı)")
+            if output != "-":
+                logger.info(f"✅ Plan yazıldı: {output}")
+            
+            return {
+                "success": True,
+                "reminders_planned": len(items),
+                "output": output,
+                "duration_seconds": duration,
+                "summary": summary
+            }
+            
+        except Exception as e:
+            logger.error(f"\n❌ HATA: {str(e)}")
+            logger.exception("Detaylı hata:")
+            return {
+                "success": False,
+                "error": str(e)
+            }
+    
+    def _write_records(self, summary: dict, items: list, output: str, fmt: str, key: str):
+        """Kayıtları JSON (özet + key altında kayıtlar) veya CSV (yalnızca kayıtlar) olarak yaz"""
+        import csv
+        import json
+        
+        stream = sys.stdout if output == "-" else None
+        if stream is None:
+            Path(output).parent.mkdir(parents=True, exist_ok=True)
+            stream = open(output, "w", encoding="utf-8", newline="")
+        
+        try:
+            if fmt == "csv":
+                fieldnames = list(items[0].keys()) if items else [key]
+                writer = csv.DictWriter(stream, fieldnames=fieldnames)
+                writer.writeheader()
+                writer.writerows(items)
+            else:
+                json.dump(dict(summary, **{key: items}), stream, ensure_ascii=False, indent=2)
+                stream.write("\n")
+        finally:
+            if stream is not sys.stdout:
+                stream.close()
+    
+    def reconcile(self, start: date = None, end: date = None, output: str = None, fmt: str = "json") -> dict:
+        """
+        Beklenen ve gerçekleşen hatırlatmaların mutabakatı
+        
+        Takvim ve rapor geçmişi birer kez okunur; kaçırılmış, gecikmeli ve çift
+        gönderilmiş hatırlatmalar listelenir. SMTP'ye bağlanılmaz, hiçbir dosya
+        değiştirilmez.
+        
+        Args:
+            start, end: Vade tarihi aralığı (varsayılan son 30 gün, bugün dahil)
+            output: Çıktı dosyası ("-" ise stdout, varsayılan logs/mutabakat.<fmt>)
+            fmt: "json" veya "csv"
+            
+        Returns:
+            dict: Mutabakat özeti
+        """
+        from reconcile import FINDING_TYPES, reconcile
+        
+        try:
+            start_time = datetime.now()
+            end = end or self.scheduler.today
+            start = start or end - timedelta(days=30)
+            
+            if not self.file_handler.file_path.exists():
+                logger.error("❌ İhale dosyası okunamadı.")
+                return {
+                    "success": False,
+                    "error": "İhale dosyası okunamadı"
+                }
+            
+            result = reconcile(
+                self.file_handler.iter_ihale_rows(), self.report_manager.store,
+                start, end, self.scheduler.today
+            )
+            
+            output = output or f"logs/mutabakat.{fmt}"
+            self._write_records(result["summary"], result["findings"], output, fmt, "bulgular")
+            
+            duration = (datetime.now() - start_time).total_seconds()
+            logger.info(f"⏱️  Mutabakat {duration:.3f} saniyede tamamlandı")
+            if output != "-":
+                logger.info(f"✅ Mutabakat yazıldı: {output}")
+            
+            summary = result["summary"]
+            return {
+                "success": True,
+                "findings": sum(summary[finding] for finding in FINDING_TYPES),
+                "output": output,
+                "duration_seconds": duration,
+                "summary": summary
+            }
+            
+        except Exception as e:
+            logger.error(f"\n❌ HATA: {str(e)}")
+            logger.exception("Detaylı hata:")
+            return {
+                "success": False,
+                "error": str(e)
+            }
+    
+    def enqueue(self) -> dict:
+        """
+        Bugünün hatırlatmalarını paylaşılan iş kuyruğuna ekle (worker modu)
+        
+        Gönderim worker'lar (--worker) tarafından yapılır; sonuçlar --collect ile
+        rapora ve takvime işlenir.
+        """
+        from work_queue import WorkQueue
+        
+        start_time = datetime.now()
+        fast_result = self._check_fast_path(start_time)
+        if fast_result is not None:
+            return fast_result
+        
+        if not self.file_handler.file_path.exists():
+            logger.error("❌ İhale dosyası okunamadı.")
+            return {"success": False, "error": "İhale dosyası okunamadı"}
+        
+        errors = []
+        warnings = []
+        with self._stage("read") as stage:
+            ihale_list = list(self.file_handler.iter_ihale_rows(errors, warnings))
+            stage.items = len(ihale_list)
+        
+        with self._stage("schedule") as stage:
+            schedule_result = self.scheduler.calculate_reminders(ihale_list)
+            stage.items = len(ihale_list)
+        if not schedule_result["success"]:
+            return {"success": False, "error": "Hatırlatma hesaplama başarısız", "details": schedule_result}
+        
+        reminders = schedule_result["reminders_to_send"]
+        next_due = self.scheduler.next_due_date(ihale_list)
+        
+        queue = WorkQueue()
+        try:
+            added = queue.enqueue(reminders, self.scheduler.today)
+            queue.set_meta("next_due", {
+                "gun": self.scheduler.today.isoformat(),
+                "next_due": next_due.isoformat() if next_due else None
+            })
+            counts = queue.counts(self.scheduler.today)
+        finally:
+            queue.close()
+        
+        logger.info(f"📥 {added} hatırlatma kuyruğa eklendi ({len(reminders)} bugün gönderilecek): {counts}")
+        return {"success": True, "enqueued": added, "reminders": len(reminders), "queue": counts}
+    
+    def run_worker(self, worker_id: str = None, batch_size: int = None) -> dict:
+        """
+        Kuyruktan lease ile iş sahiplenip gönder (birden fazla süreç/makinede çalışabilir)
+        
+        Args:
+            worker_id: Worker kimliği (varsayılan host:pid)
+            batch_size: Tek seferde sahiplenilecek iş (varsayılan WORK_CLAIM_BATCH veya 10)
+        """
+        from work_queue import WorkQueue, QueueWorker
+        
+        batch_size = batch_size or int(os.getenv("WORK_CLAIM_BATCH", "10"))
+        queue = WorkQueue()
+        try:
+            worker = QueueWorker(queue, self.email_sender, worker_id, batch_size, gun=self.scheduler.today)
+            stats = worker.run()
+        finally:
+            queue.close()
+        return dict(stats, success=True)
+    
+    def collect(self) -> dict:
+        """
+        Worker sonuçlarını rapora ve takvime işle
+        
+        Kuyrukta bugün için açık iş kalmadıysa ve başarısız gönderim yoksa
+        hızlı yol önbelleği enqueue sırasında hesaplanan sonraki tarihle
+        kaydedilir; aksi halde bugün tekrar çalıştırılabilir kalır.
+        """
+        from work_queue import WorkQueue, BEKLIYOR, GONDERILIYOR, BASARISIZ
+        
+        start_time = datetime.now()
+        queue = WorkQueue()
+        try:
+            finished = queue.finished()
+            pairs = [(reminder, result) for _, reminder, result in finished]
+            if pairs:
+                self._flush_report_batch(pairs)
+                self._flush_status_batch([
+                    (result["ihale_no"], reminder["hatirlatma_tipi"], result["timestamp"])
+                    for reminder, result in pairs if result["status"] == "sent"
+                ])
+                queue.mark_processed([job_id for job_id, _, _ in finished])
+            
+            counts = queue.counts(self.scheduler.today)
+            meta = queue.get_meta("next_due") or {}
+        finally:
+            queue.close()
+        
+        sent_count = sum(1 for _, result in pairs if result["status"] == "sent")
+        failed_count = sum(1 for _, result in pairs if result["status"] == "failed")
+        logger.info(f"📤 {len(pairs)} sonuç işlendi ({sent_count} başarılı, {failed_count} başarısız), kuyruk: {counts}")
+        
+        day_complete = (
+            meta.get("gun") == self.scheduler.today.isoformat()
+            and counts[BEKLIYOR] + counts[GONDERILIYOR] + counts[BASARISIZ] == 0
+        )
+        if day_complete:
+            next_due = date.fromisoformat(meta["next_due"]) if meta["next_due"] else None
+        else:
+            next_due = self.scheduler.today
+        
+        result = self._finish_run(start_time, sent_count, failed_count, next_due)
+        result["queue"] = counts
+        return result
     
     def run(self) -> dict:
         """Sistemi çalıştır"""
+        self.metrics = RunMetrics("classic")
+        return self._export_metrics(self._run())
+    
+    def _run(self) -> dict:
+        """Aşama aşama çalıştırma: oku, hesapla, gönder, raporla"""
         try:
             start_time = datetime.now()
             logger.info(f"⏰ Başlangıç Zamanı: {start_time.strftime('%Y-%m-%d %H:%M:%S')}\n")
             
+            # 0. Hızlı yol: takvim değişmediyse ve sıradaki hatırlatma ileride ise dosya okunmaz
+            fast_result = self._check_fast_path(start_time)
+            if fast_result is not None:
+                return fast_result
+            
             # 1. İhale dosyasını oku (File Agent)
             logger.info("📂 [1/5] İhale Dosyası Okunuyor...")
             logger.info("-" * 80)
-            file_result = self.file_handler.read_ihale_file()
+            with self._stage("read") as stage:
+                file_result = self.file_handler.read_ihale_file()
+                stage.items = file_result["valid_count"]
             
             if not file_result["success"]:
                 logger.error("❌ İhale dosyası okunamadı. İşlem sonlandırılıyor.")
@@ -70,7 +615,9 @@ class IhaleHatirlatmaSistemi:
             # 2. Hatırlatmaları hesapla (Scheduler Agent)
             logger.info("📅 [2/5] Hatırlatmalar Hesaplanıyor...")
             logger.info("-" * 80)
-            schedule_result = self.scheduler.calculate_reminders(file_result["data"])
+            with self._stage("schedule") as stage:
+                schedule_result = self.scheduler.calculate_reminders(file_result["data"])
+                stage.items = len(schedule_result["reminders_to_send"])
             
             if not schedule_result["success"]:
                 logger.error("❌ Hatırlatma hesaplama başarısız. İşlem sonlandırılıyor.")
@@ -83,19 +630,20 @@ class IhaleHatirlatmaSistemi:
             reminders_to_send = schedule_result["reminders_to_send"]
             
             if len(reminders_to_send) == 0:
-                logger.info("ℹ️  Bugün gönderilecek hatırlatma yok.\n")
-                return {
-                    "success": True,
-                    "reminders_sent": 0,
-                    "message": "Bugün gönderilecek hatırlatma yok"
-                }
+                self.due_cache.save(
+                    self.file_handler.file_path,
+                    self.scheduler.next_due_date(file_result["data"])
+                )
+                return self._quiet_day_result(start_time, "Bugün gönderilecek hatırlatma yok", fast_path=False)
             
             logger.info(f"✅ {len(reminders_to_send)} hatırlatma gönderilmeye hazır\n")
             
             # 3. SMTP Bağlantısını Test Et
             logger.info("🔌 [3/5] SMTP Bağlantısı Test Ediliyor...")
             logger.info("-" * 80)
-            connection_test = self.email_sender.test_connection()
+            with self._stage("smtp_test") as stage:
+                connection_test = self.email_sender.test_connection()
+                stage.items = len(self.email_sender.pool.accounts)
             
             if not connection_test["success"]:
                 logger.error(f"❌ {connection_test['message']}")
@@ -107,60 +655,45 @@ class IhaleHatirlatmaSistemi:
             # 4. Mailleri Gönder (Email Agent)
             logger.info("📧 [4/5] Mailler Gönderiliyor...")
             logger.info("-" * 80)
-            email_results = self.email_sender.send_reminders(reminders_to_send)
+            with self._stage("send") as stage:
+                email_results = self.email_sender.send_reminders(reminders_to_send)
+                stage.items = len(email_results["results"])
+            for result in email_results["results"]:
+                self.metrics.record_mail(result)
             
             logger.info(f"\n✅ Mail gönderimi tamamlandı")
             logger.info(f"  • Başarılı: {email_results['sent_count']}")
-            logger.info(f"  • Başarısız: {email_results['failed_count']}\n")
+            logger.info(f"  • Başarısız: {email_results['failed_count']}")
+            if email_results['suppressed_count']:
+                logger.info(f"  • Engellendi: {email_results['suppressed_count']}")
+            logger.info("")
             
             # 5. Raporları Güncelle (Report Agent)
             logger.info("📊 [5/5] Raporlar Güncelleniyor...")
             logger.info("-" * 80)
             
             # Her bir sonucu rapora ekle
-            for i, result in enumerate(email_results["results"]):
-                reminder = reminders_to_send[i]
-                self.report_manager.add_entry(result, reminder)
-                
-                # İhale dosyasındaki hatırlatma durumunu güncelle
-                if result["status"] == "sent":
-                    self.file_handler.update_hatirlatma_durumu(
-                        ihale_no=result["ihale_no"],
-                        hatirlatma_tipi=reminder["hatirlatma_tipi"],
-                        tarih=result["timestamp"]
-                    )
+            with self._stage("report") as stage:
+                for i, result in enumerate(email_results["results"]):
+                    if self.report_manager.add_entry(result, reminders_to_send[i]):
+                        stage.items += 1
             
-            logger.info("✅ Raporlar güncellendi\n")
+            # İhale dosyasındaki hatırlatma durumunu güncelle (tek kayıt)
+            with self._stage("write_back") as stage:
+                stage.items = self.file_handler.update_hatirlatma_durumu_batch([
+                    (result["ihale_no"], reminders_to_send[i]["hatirlatma_tipi"], result["timestamp"])
+                    for i, result in enumerate(email_results["results"]) if result["status"] == "sent"
+                ])
             
-            # Günlük istatistikleri göster
-            daily_stats = self.report_manager.get_daily_statistics()
-            logger.info("📈 Bugünkü Özet İstatistikler:")
-            logger.info("-" * 80)
-            logger.info(f"  • Toplam Gönderim: {daily_stats['toplam_gonderim']}")
-            logger.info(f"  • Başarılı: {daily_stats['basarili']}")
-            logger.info(f"  • Başarısız: {daily_stats['basarisiz']}")
-            logger.info(f"  • 60 Gün: {daily_stats['60_gun']}")
-            logger.info(f"  • 30 Gün: {daily_stats['30_gun']}")
-            logger.info(f"  • 1 Gün: {daily_stats['1_gun']}")
-            logger.info(f"  • Farklı Yönetici: {daily_stats['benzersiz_yonetici']}\n")
-            
-            # Bitiş zamanı
-            end_time = datetime.now()
-            duration = (end_time - start_time).total_seconds()
-            
-            logger.info("="*80)
-            logger.info(f"✅ İşlem Başarıyla Tamamlandı!")
-            logger.info(f"⏱️  Toplam Süre: {duration:.2f} saniye")
-            logger.info(f"🕐 Bitiş Zamanı: {end_time.strftime('%Y-%m-%d %H:%M:%S')}")
-            logger.info("="*80)
+            # Sonraki hatırlatma tarihi (başarısız gönderim varsa bugün tekrar denenebilsin)
+            if email_results['failed_count'] == 0:
+                next_due = self.scheduler.next_due_date(file_result["data"])
+            else:
+                next_due = self.scheduler.today
             
-            return {
-                "success": True,
-                "reminders_sent": email_results['sent_count'],
-                "reminders_failed": email_results['failed_count'],
-                "duration_seconds": duration,
-                "statistics": daily_stats
-            }
+            return self._finish_run(
+                start_time, email_results['sent_count'], email_results['failed_count'], next_due
+            )
             
         except Exception as e:
             logger.error(f"\n❌ HATA: {str(e)}")
@@ -171,15 +704,151 @@ class IhaleHatirlatmaSistemi:
             }
 
 
+def manage_suppression(args) -> bool:
+    """Engel listesi komutları (--suppressed, --unsuppress, --suppress-from-report)"""
+    from suppression import SuppressionList
+    suppression = SuppressionList()
+    
+    if args.suppress_from_report:
+        from report_manager import ReportManager
+        from report_store import REPORT_HEADINGS
+        report_manager = ReportManager()
+        rows = (dict(zip(REPORT_HEADINGS, row)) for row in report_manager.store.iter_query(durum="Başarısız"))
+        added = suppression.import_report_failures(rows)
+        report_manager.store.close()
+        logger.info(f"⛔ Rapordan {added} alıcı engel listesine eklendi")
+    
+    if args.unsuppress:
+        if not suppression.remove(args.unsuppress):
+            logger.warning(f"⚠️  Engel listesinde yok: {args.unsuppress}")
+            return False
+        logger.info(f"✅ Engel listesinden çıkarıldı: {args.unsuppress}")
+    
+    if args.suppressed:
+        entries = suppression.entries()
+        logger.info(f"⛔ {len(entries)} engelli alıcı")
+        for email, entry in sorted(entries.items()):
+            logger.info(f"  • {email}: {entry['kod']} {entry['neden']} "
+                        f"(eklenme {entry['eklenme']}, bitiş {entry['bitis'] or '-'})")
+    return True
+
+
 def main():
     """Ana fonksiyon"""
+    parser = argparse.ArgumentParser(description="İhale Hatırlatma Sistemi")
+    parser.add_argument(
+        "--pipeline", action="store_true",
+        help="Akış modu: hatırlatmalar takvim okunurken gönderilmeye başlar"
+    )
+    parser.add_argument(
+        "--profile", action="store_true",
+        help="Her aşamayı cProfile ve tracemalloc ile ölç, çıktıları logs/profile/ altına yaz"
+    )
+    parser.add_argument(
+        "--plan", action="store_true",
+        help="Dry-run: bugünün gönderim planını çıkar (SMTP, rapor ve takvime dokunmaz)"
+    )
+    parser.add_argument("--plan-format", choices=["json", "csv"], default="json", help="Plan formatı")
+    parser.add_argument("--plan-output", help="Plan dosyası ('-' ise stdout)")
+    parser.add_argument(
+        "--reconcile", action="store_true",
+        help="Mutabakat: beklenen hatırlatmaları rapor geçmişi ve takvimle karşılaştır"
+    )
+    parser.add_argument(
+        "--reconcile-from", type=date.fromisoformat, metavar="YYYY-MM-DD",
+        help="Mutabakat vade aralığı başlangıcı (varsayılan bitişten 30 gün önce)"
+    )
+    parser.add_argument(
+        "--reconcile-to", type=date.fromisoformat, metavar="YYYY-MM-DD",
+        help="Mutabakat vade aralığı bitişi (varsayılan bugün)"
+    )
+    parser.add_argument("--reconcile-format", choices=["json", "csv"], default="json", help="Mutabakat formatı")
+    parser.add_argument("--reconcile-output", help="Mutabakat dosyası ('-' ise stdout)")
+    parser.add_argument(
+        "--tenants", metavar="CONFIG",
+        help="Birden fazla tenant'ı ortak SMTP havuzuyla çalıştır (ör. config/tenants.example.json)"
+    )
+    parser.add_argument(
+        "--enqueue", action="store_true",
+        help="Worker modu: bugünün hatırlatmalarını paylaşılan iş kuyruğuna ekle"
+    )
+    parser.add_argument(
+        "--worker", action="store_true",
+        help="Worker modu: kuyruktan lease ile iş alıp gönder (birden fazla süreç çalıştırılabilir)"
+    )
+    parser.add_argument("--worker-id", help="Worker kimliği (varsayılan host:pid)")
+    parser.add_argument(
+        "--collect", action="store_true",
+        help="Worker modu: tamamlanan gönderimleri rapora ve takvime işle"
+    )
+    parser.add_argument(
+        "--export-parquet", nargs="?", const="data/analytics/mail_raporu", metavar="KLASOR",
+        help="Gönderim geçmişini Hive bölümlü Parquet veri setine yaz (yalnızca yeni/değişen aylar)"
+    )
+    parser.add_argument("--export-full", action="store_true", help="Parquet export'ta tüm ayları yeniden yaz")
+    parser.add_argument(
+        "--serve", action="store_true",
+        help="Plan, istatistik, başarısız gönderim ve tahminleri sunan salt okunur yerel HTTP servisini başlat"
+    )
+    parser.add_argument("--port", type=int, help="Sorgu servisi portu (varsayılan QUERY_SERVICE_PORT veya 8765)")
+    parser.add_argument(
+        "--suppressed", action="store_true",
+        help="Kalıcı hata nedeniyle engellenen alıcıları listele"
+    )
+    parser.add_argument(
+        "--unsuppress", metavar="MAIL",
+        help="Alıcıyı engel listesinden çıkar ('all' ise tüm listeyi temizle)"
+    )
+    parser.add_argument(
+        "--suppress-from-report", action="store_true",
+        help="Rapor geçmişindeki kalıcı alıcı hatalarını engel listesine ekle"
+    )
+    args = parser.parse_args()
+    
+    # Log ayarları da .env'den okunduğu için her şeyden önce yüklenir
+    load_dotenv()
+    
     try:
         # Log klasörünü oluştur
         Path("logs").mkdir(exist_ok=True)
+        setup_logging()
+        
+        if args.export_parquet:
+            from report_manager import ReportManager
+            result = ReportManager().export_parquet(args.export_parquet, incremental=not args.export_full)
+            sys.exit(0 if result["success"] else 1)
+        
+        if args.serve:
+            from query_service import serve
+            serve(port=args.port)
+            sys.exit(0)
+        
+        if args.suppressed or args.unsuppress or args.suppress_from_report:
+            sys.exit(0 if manage_suppression(args) else 1)
+        
+        if args.tenants:
+            from multi_tenant import MultiTenantRunner, load_tenants
+            result = MultiTenantRunner(load_tenants(args.tenants)).run()
+            sys.exit(0 if result["success"] else 1)
         
         # Sistemi başlat ve çalıştır
-        sistem = IhaleHatirlatmaSistemi()
-        result = sistem.run()
+        sistem = IhaleHatirlatmaSistemi(profile=args.profile)
+        if args.plan:
+            result = sistem.plan(args.plan_output, args.plan_format)
+        elif args.reconcile:
+            result = sistem.reconcile(
+                args.reconcile_from, args.reconcile_to, args.reconcile_output, args.reconcile_format
+            )
+        elif args.enqueue:
+            result = sistem.enqueue()
+        elif args.worker:
+            result = sistem.run_worker(args.worker_id)
+        elif args.collect:
+            result = sistem.collect()
+        elif args.pipeline:
+            result = sistem.run_pipelined()
+        else:
+            result = sistem.run()
         
         # Sonuç kodunu döndür
         sys.exit(0 if result["success"] else 1)
@@ -0,0 +1,212 @@
+"""
+Metrics Module
+Çalıştırma aşamalarının süre, kayıt sayısı, throughput ve bellek ölçümlerini,
+mail başına SMTP gecikme histogramını ve retry sayaçlarını toplar.
+Sonuçlar node_exporter textfile formatında ve JSON özet olarak yazılır.
+"""
+
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+import logging
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+
+METRIC_PREFIX = "ihale_hatirlatma"
+
+# SMTP gecikme histogramı sınırları (saniye)
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def peak_rss_bytes() -> int:
+    """Sürecin şimdiye kadarki en yüksek RSS değeri (byte)"""
+    if resource is None:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux KB, macOS byte döndürür
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class StageMetrics:
+    """Tek bir aşamanın ölçümleri (aynı aşama birden fazla kez ölçülürse toplanır)"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.duration_seconds = 0.0
+        self.items = 0
+        self.peak_rss_bytes = 0
+        self.calls = 0
+
+    @property
+    def throughput(self) -> float:
+        return self.items / self.duration_seconds if self.duration_seconds > 0 else 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "duration_seconds": round(self.duration_seconds, 6),
+            "items": self.items,
+            "throughput_per_second": round(self.throughput, 3),
+            "peak_rss_bytes": self.peak_rss_bytes,
+            "calls": self.calls
+        }
+
+
+class RunMetrics:
+    """Bir çalıştırmanın metrikleri"""
+
+    def __init__(self, mode: str = "classic", latency_buckets: tuple = LATENCY_BUCKETS):
+        self.mode = mode
+        self.started_at = time.time()
+        self._started = time.perf_counter()
+        self.stages = {}
+        self.latency_buckets = tuple(sorted(latency_buckets))
+        self.latency_counts = [0] * len(self.latency_buckets)
+        self.latency_sum = 0.0
+        self.latency_count = 0
+        self.mails = {"sent": 0, "failed": 0, "suppressed": 0}
+        self.retries = 0
+        self.duration_seconds = None
+        self.success = None
+
+    @contextmanager
+    def stage(self, name: str):
+        """
+        Bir aşamayı ölç
+
+        Kullanım:
+            with metrics.stage("read") as stage:
+                ...
+                stage.items = len(data)
+        """
+        stage = self.stages.get(name)
+        if stage is None:
+            stage = self.stages[name] = StageMetrics(name)
+        started = time.perf_counter()
+        try:
+            yield stage
+        finally:
+            stage.duration_seconds += time.perf_counter() - started
+            stage.calls += 1
+            stage.peak_rss_bytes = peak_rss_bytes()
+
+    def record_mail(self, result: dict):
+        """Tek bir gönderim sonucunu histogram ve sayaçlara ekle"""
+        status = result.get("status") if result.get("status") in self.mails else "failed"
+        self.mails[status] += 1
+        self.retries += result.get("retry_count", 0) or 0
+
+        latency = result.get("latency")
+        if latency is None:
+            return
+        self.latency_sum += latency
+        self.latency_count += 1
+        for i, bound in enumerate(self.latency_buckets):
+            if latency <= bound:
+                self.latency_counts[i] += 1
+
+    def finish(self, success: bool):
+        self.duration_seconds = time.perf_counter() - self._started
+        self.success = success
+
+    def summary(self) -> dict:
+        """JSON özet"""
+        return {
+            "mode": self.mode,
+            "started_at": datetime.fromtimestamp(self.started_at).isoformat(timespec="seconds"),
+            "success": self.success,
+            "duration_seconds": round(self.duration_seconds or 0.0, 6),
+            "peak_rss_bytes": peak_rss_bytes(),
+            "stages": {name: stage.as_dict() for name, stage in self.stages.items()},
+            "mails": dict(self.mails),
+            "retries": self.retries,
+            "smtp_latency": {
+                "count": self.latency_count,
+                "sum_seconds": round(self.latency_sum, 6),
+                "buckets": {str(bound): count for bound, count in zip(self.latency_buckets, self.latency_counts)}
+            }
+        }
+
+    def to_prometheus(self) -> str:
+        """node_exporter textfile collector formatı"""
+        p = METRIC_PREFIX
+        lines = []
+
+        def metric(name: str, kind: str, help_text: str, samples: list):
+            lines.append(f"# HELP {p}_{name} {help_text}")
+            lines.append(f"# TYPE {p}_{name} {kind}")
+            for labels, value in samples:
+                label_str = "{" + ",".join(f'{k}="{v}"' for k, v in labels.items()) + "}" if labels else ""
+                lines.append(f"{p}_{name}{label_str} {value}")
+
+        metric("last_run_timestamp_seconds", "gauge", "Son çalıştırmanın başlangıç zamanı",
+               [({}, f"{self.started_at:.3f}")])
+        metric("run_success", "gauge", "Son çalıştırma başarılı mı (1/0)",
+               [({"mode": self.mode}, 1 if self.success else 0)])
+        metric("run_duration_seconds", "gauge", "Son çalıştırmanın toplam süresi",
+               [({"mode": self.mode}, f"{self.duration_seconds or 0.0:.6f}")])
+        metric("peak_rss_bytes", "gauge", "Sürecin en yüksek RSS değeri",
+               [({}, peak_rss_bytes())])
+
+        stages = list(self.stages.values())
+        metric("stage_duration_seconds", "gauge", "Aşama süresi",
+               [({"stage": s.name}, f"{s.duration_seconds:.6f}") for s in stages])
+        metric("stage_items", "gauge", "Aşamada işlenen kayıt sayısı",
+               [({"stage": s.name}, s.items) for s in stages])
+        metric("stage_throughput_per_second", "gauge", "Aşama throughput'u (kayıt/saniye)",
+               [({"stage": s.name}, f"{s.throughput:.3f}") for s in stages])
+        metric("stage_peak_rss_bytes", "gauge", "Aşama sonundaki en yüksek RSS",
+               [({"stage": s.name}, s.peak_rss_bytes) for s in stages])
+
+        metric("mails", "gauge", "Son çalıştırmada gönderim sonuçları",
+               [({"status": status}, count) for status, count in self.mails.items()])
+        metric("smtp_retries", "gauge", "Son çalıştırmadaki toplam retry sayısı",
+               [({}, self.retries)])
+
+        buckets = [({"le": str(bound)}, count) for bound, count in zip(self.latency_buckets, self.latency_counts)]
+        buckets.append(({"le": "+Inf"}, self.latency_count))
+        lines.append(f"# HELP {p}_smtp_latency_seconds Mail başına SMTP gönderim süresi")
+        lines.append(f"# TYPE {p}_smtp_latency_seconds histogram")
+        for labels, count in buckets:
+            lines.append(f'{p}_smtp_latency_seconds_bucket{{le="{labels["le"]}"}} {count}')
+        lines.append(f"{p}_smtp_latency_seconds_sum {self.latency_sum:.6f}")
+        lines.append(f"{p}_smtp_latency_seconds_count {self.latency_count}")
+
+        return "\n".join(lines) + "\n"
+
+    def export(self, metrics_dir: str = None) -> dict:
+        """
+        Textfile ve JSON özetini yaz (dosyalar atomik olarak değiştirilir)
+
+        Returns:
+            dict: Yazılan dosya yolları
+        """
+        metrics_dir = Path(metrics_dir or os.getenv("METRICS_DIR", "logs"))
+        paths = {
+            "prometheus": metrics_dir / f"{METRIC_PREFIX}.prom",
+            "summary": metrics_dir / "run_summary.json"
+        }
+        try:
+            metrics_dir.mkdir(parents=True, exist_ok=True)
+            _atomic_write(paths["prometheus"], self.to_prometheus())
+            _atomic_write(paths["summary"], json.dumps(self.summary(), ensure_ascii=False, indent=2))
+        except OSError as e:
+            logger.warning(f"⚠️  Metrikler yazılamadı: {str(e)}")
+        return paths
+
+
+def _atomic_write(path: Path, content: str):
+    # node_exporter yarım yazılmış dosyayı okumasın
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(content)
+    tmp_path.replace(path)
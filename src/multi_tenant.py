@@ -0,0 +1,267 @@
+"""
+Multi-Tenant Runner
+Birden fazla iş biriminin (tenant) takvim, rapor ve şablon setini tek süreçte
+çalıştırır. Takvimler paralel süreçlerde okunur. Tüm tenant'lar tek bir
+gönderici havuzunu (SMTP bağlantıları ve rate limit) paylaşır; engel listesi,
+rapor ve durum dosyaları tenant başına ayrı tutulur.
+
+Örnek config (config/tenants.example.json):
+    {
+      "tenants": [
+        {"name": "dserve", "data_dir": "data/dserve"},
+        {"name": "lojistik", "data_dir": "data/lojistik", "template": "config/lojistik_template.html"}
+      ]
+    }
+"""
+
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+import logging
+
+from file_handler import FileHandler
+from scheduler import Scheduler
+from due_cache import DueCache
+from log_config import configure_worker_logging
+
+logger = logging.getLogger(__name__)
+
+
+def load_tenants(config_file: str) -> list:
+    """
+    Tenant config dosyasını oku ve eksik yolları varsayılanlarla doldur
+
+    Her tenant için yalnızca "name" zorunludur; diğer yollar data_dir
+    (varsayılan data/<name>) altından türetilir.
+    """
+    with open(config_file, "r", encoding="utf-8") as f:
+        config = json.load(f)
+
+    tenants = []
+    names = set()
+    for item in config.get("tenants", []):
+        name = item["name"]
+        if name in names:
+            raise ValueError(f"Tenant adı tekrar ediyor: {name}")
+        names.add(name)
+
+        data_dir = Path(item.get("data_dir", f"data/{name}"))
+        tenants.append({
+            "name": name,
+            "calendar": str(item.get("calendar", data_dir / "Merkezi_Takvimi.xlsx")),
+            "report": str(item.get("report", data_dir / "mail_raporu.xlsx")),
+            "due_cache": str(item.get("due_cache", data_dir / ".sonraki_hatirlatma.json")),
+            "suppression": str(item.get("suppression", data_dir / "engellenen_alicilar.json")),
+            "template": str(item.get("template", "config/email_template.html")),
+            "timezone": item.get("timezone", "Europe/Istanbul")
+        })
+
+    if not tenants:
+        raise ValueError(f"Config dosyasında tenant yok: {config_file}")
+    return tenants
+
+
+def _prepare_tenant(tenant: dict) -> dict:
+    """
+    Tenant takvimini oku ve bugünün hatırlatmalarını hesapla
+
+    Ayrı bir süreçte çalışır; sonuç pickle edilebilir olmalıdır.
+    """
+    try:
+        file_handler = FileHandler(tenant["calendar"])
+        if not file_handler.file_path.exists():
+            return {"success": False, "error": f"Dosya bulunamadı: {tenant['calendar']}"}
+
+        errors = []
+        warnings = []
+        ihale_list = list(file_handler.iter_ihale_rows(errors, warnings))
+
+        scheduler = Scheduler(tenant["timezone"])
+        schedule_result = scheduler.calculate_reminders(ihale_list)
+        if not schedule_result["success"]:
+            return {"success": False, "error": "Hatırlatma hesaplama başarısız"}
+
+        return {
+            "success": True,
+            "valid_count": len(ihale_list),
+            "error_count": len(errors),
+            "reminders": schedule_result["reminders_to_send"],
+            "next_due": scheduler.next_due_date(ihale_list),
+            "today": scheduler.today
+        }
+
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+
+class MultiTenantRunner:
+    """Tenant'ları ortak SMTP havuzu ile çalıştıran sınıf"""
+
+    def __init__(self, tenants: list, max_workers: int = None,
+                 summary_file: str = "logs/tenants_summary.json"):
+        self.tenants = tenants
+        self.max_workers = max_workers or min(len(tenants), os.cpu_count() or 1)
+        self.summary_file = Path(summary_file)
+        self._pool = None
+
+    @property
+    def pool(self):
+        """Tüm tenant'ların paylaştığı gönderici havuzu (ilk gönderimde oluşturulur)"""
+        if self._pool is None:
+            from sender_pool import SenderPool, load_sender_accounts
+            self._pool = SenderPool(load_sender_accounts())
+        return self._pool
+
+    def _parse_all(self, tenants: list) -> dict:
+        """Takvimleri paralel süreçlerde oku"""
+        if len(tenants) == 1 or self.max_workers <= 1:
+            return {t["name"]: _prepare_tenant(t) for t in tenants}
+
+        with ProcessPoolExecutor(max_workers=self.max_workers, initializer=configure_worker_logging) as executor:
+            futures = {t["name"]: executor.submit(_prepare_tenant, t) for t in tenants}
+            prepared = {}
+            for name, future in futures.items():
+                try:
+                    prepared[name] = future.result()
+                except Exception as e:
+                    prepared[name] = {"success": False, "error": str(e)}
+            return prepared
+
+    def _send_tenant(self, tenant: dict, reminders: list) -> dict:
+        from email_sender import EmailSender
+        from suppression import SuppressionList
+
+        # Havuz ortaktır ve run() sonunda kapatılır; engel listesi tenant'a aittir
+        sender = EmailSender(
+            pool=self.pool, template_path=tenant["template"],
+            suppression=SuppressionList(tenant["suppression"])
+        )
+        logger.info(f"📧 [{tenant['name']}] {len(reminders)} mail gönderiliyor...")
+        return sender.send_reminders(reminders)
+
+    def _finish_tenant(self, tenant: dict, prepared: dict, email_results: dict) -> dict:
+        """Tenant raporunu, takvim durumunu ve önbelleğini güncelle"""
+        from report_manager import ReportManager
+
+        reminders = prepared["reminders"]
+        pairs = list(zip(reminders, email_results["results"]))
+
+        report_manager = ReportManager(tenant["report"])
+        report_manager.add_results(pairs)
+        report_manager.export_excel()
+
+        file_handler = FileHandler(tenant["calendar"])
+        file_handler.update_hatirlatma_durumu_batch([
+            (result["ihale_no"], reminder["hatirlatma_tipi"], result["timestamp"])
+            for reminder, result in pairs if result["status"] == "sent"
+        ])
+
+        # Başarısız gönderim varsa bugün tekrar denenebilsin
+        next_due = prepared["next_due"] if email_results["failed_count"] == 0 else prepared["today"]
+        DueCache(tenant["due_cache"]).save(tenant["calendar"], next_due)
+        report_manager.store.close()
+
+        return {
+            "success": email_results["success"],
+            "reminders_sent": email_results["sent_count"],
+            "reminders_failed": email_results["failed_count"]
+        }
+
+    def run(self) -> dict:
+        """Tüm tenant'ları çalıştır ve birleşik özet döndür"""
+        start_time = datetime.now()
+        summary = {t["name"]: {"success": True, "reminders_sent": 0, "reminders_failed": 0} for t in self.tenants}
+
+        logger.info(f"🏢 {len(self.tenants)} tenant çalıştırılıyor...")
+
+        # 1. Takvimi değişmemiş ve hatırlatması ileride olan tenant'lar atlanır
+        active = []
+        for tenant in self.tenants:
+            scheduler_today = Scheduler(tenant["timezone"]).today
+            quiet, next_due = DueCache(tenant["due_cache"]).is_quiet_day(tenant["calendar"], scheduler_today)
+            if quiet:
+                summary[tenant["name"]].update({"fast_path": True, "next_due": str(next_due) if next_due else None})
+            else:
+                active.append(tenant)
+
+        # 2. Takvimleri paralel oku
+        prepared = self._parse_all(active) if active else {}
+
+        sending = []
+        for tenant in active:
+            result = prepared[tenant["name"]]
+            entry = summary[tenant["name"]]
+            if not result["success"]:
+                entry.update({"success": False, "error": result["error"]})
+                continue
+            entry.update({"valid_count": result["valid_count"], "error_count": result["error_count"]})
+            if not result["reminders"]:
+                DueCache(tenant["due_cache"]).save(tenant["calendar"], result["next_due"])
+                continue
+            sending.append(tenant)
+
+        # 3. Ortak havuzla gönder (tenant'lar paralel, rate limit hesap başına ortak)
+        if sending:
+            from email_sender import EmailSender
+            connection_test = EmailSender(pool=self.pool).test_connection()
+            if not connection_test["success"]:
+                logger.error(f"❌ {connection_test['message']}")
+
+            with ThreadPoolExecutor(max_workers=len(sending)) as executor:
+                futures = {
+                    t["name"]: executor.submit(self._send_tenant, t, prepared[t["name"]]["reminders"])
+                    for t in sending
+                }
+
+            for tenant in sending:
+                entry = summary[tenant["name"]]
+                try:
+                    email_results = futures[tenant["name"]].result()
+                    entry.update(self._finish_tenant(tenant, prepared[tenant["name"]], email_results))
+                except Exception as e:
+                    logger.error(f"❌ [{tenant['name']}] {str(e)}")
+                    entry.update({"success": False, "error": str(e)})
+
+            self.pool.close()
+
+        duration = (datetime.now() - start_time).total_seconds()
+        result = {
+            "success": all(entry["success"] for entry in summary.values()),
+            "reminders_sent": sum(entry["reminders_sent"] for entry in summary.values()),
+            "reminders_failed": sum(entry["reminders_failed"] for entry in summary.values()),
+            "duration_seconds": duration,
+            "tenants": summary
+        }
+        self._log_summary(result)
+        self._write_summary(result)
+        return result
+
+    def _log_summary(self, result: dict):
+        logger.info("=" * 80)
+        logger.info("🏢 Tenant Özeti")
+        logger.info("-" * 80)
+        for name, entry in result["tenants"].items():
+            if not entry["success"]:
+                status = f"❌ {entry.get('error', 'hata')}"
+            elif entry.get("fast_path"):
+                status = f"⚡ hatırlatma yok (sonraki: {entry.get('next_due') or '-'})"
+            else:
+                status = f"✅ {entry['reminders_sent']} başarılı, {entry['reminders_failed']} başarısız"
+            logger.info(f"  • {name}: {status}")
+        logger.info("-" * 80)
+        logger.info(f"  Toplam: {result['reminders_sent']} başarılı, {result['reminders_failed']} başarısız "
+                    f"({result['duration_seconds']:.2f} saniye)")
+        logger.info("=" * 80)
+
+    def _write_summary(self, result: dict):
+        try:
+            self.summary_file.parent.mkdir(parents=True, exist_ok=True)
+            payload = dict(result, created_at=datetime.now().isoformat(timespec="seconds"))
+            tmp_file = self.summary_file.with_name(self.summary_file.name + ".tmp")
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(payload, f, ensure_ascii=False, indent=2, default=str)
+            tmp_file.replace(self.summary_file)
+        except OSError as e:
+            logger.warning(f"⚠️  Tenant özeti yazılamadı: {str(e)}")
@@ -0,0 +1,138 @@
+"""
+Profiling Module
+--profile modunda her çalıştırma aşamasını cProfile ve tracemalloc ile ölçer.
+Aşama başına .prof dosyası, en pahalı fonksiyonlar ve en çok bellek ayıran
+satırlar logs/profile/<zaman>/ altına yazılır.
+"""
+
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from pathlib import Path
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class NullProfiler:
+    """Profil kapalıyken kullanılan profiler (ek maliyeti yok)"""
+
+    enabled = False
+    _context = nullcontext()
+
+    def stage(self, name: str):
+        return self._context
+
+    def dump(self) -> list:
+        return []
+
+
+class _StageProfile:
+    def __init__(self, index: int, name: str):
+        import cProfile
+        self.index = index
+        self.name = name
+        self.profile = cProfile.Profile()
+        self.before = None
+        self.after = None
+        self.peak_bytes = 0
+        self.calls = 0
+
+
+class StageProfiler:
+    """
+    Aşama bazlı cProfile + tracemalloc profiler
+
+    Aynı isimli aşama birden fazla kez ölçülürse profil birikir, bellek
+    karşılaştırması ilk girişle son çıkış arasında yapılır. cProfile yalnızca
+    aşamayı çalıştıran thread'i ölçer.
+
+    Args:
+        output_dir: Çıktı klasörü (varsayılan logs/profile/<zaman>)
+        top: Raporlardaki satır sayısı
+        frames: tracemalloc traceback derinliği
+    """
+
+    enabled = True
+
+    def __init__(self, output_dir: str = None, top: int = 25, frames: int = 1):
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.output_dir = Path(output_dir) if output_dir else Path("logs/profile") / timestamp
+        self.top = top
+        self.stages = {}
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(frames)
+
+    @contextmanager
+    def stage(self, name: str):
+        stage = self.stages.get(name)
+        if stage is None:
+            stage = self.stages[name] = _StageProfile(len(self.stages) + 1, name)
+            stage.before = tracemalloc.take_snapshot()
+
+        tracemalloc.reset_peak()
+        stage.profile.enable()
+        try:
+            yield
+        finally:
+            stage.profile.disable()
+            stage.peak_bytes = max(stage.peak_bytes, tracemalloc.get_traced_memory()[1])
+            stage.after = tracemalloc.take_snapshot()
+            stage.calls += 1
+
+    def _write_stage(self, stage: _StageProfile) -> list:
+        import io
+        import pstats
+
+        prefix = self.output_dir / f"{stage.index:02d}_{stage.name}"
+
+        prof_file = prefix.with_suffix(".prof")
+        stage.profile.dump_stats(prof_file)
+
+        # En pahalı fonksiyonlar (kümülatif süreye göre)
+        stream = io.StringIO()
+        stats = pstats.Stats(stage.profile, stream=stream)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self.top)
+        stats_file = prefix.with_name(prefix.name + "_stats.txt")
+        stats_file.write_text(stream.getvalue(), encoding="utf-8")
+
+        # En çok bellek ayıran satırlar
+        lines = [
+            f"Aşama: {stage.name} ({stage.calls} kez)",
+            f"Tepe bellek (tracemalloc): {stage.peak_bytes / 1024 / 1024:.2f} MB",
+            "",
+            f"En çok bellek ayıran {self.top} satır (aşama sonu - aşama başı):"
+        ]
+        snapshot_filter = [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+        ]
+        after = stage.after.filter_traces(snapshot_filter)
+        before = stage.before.filter_traces(snapshot_filter)
+        for diff in after.compare_to(before, "lineno")[:self.top]:
+            lines.append(f"  {diff}")
+        alloc_file = prefix.with_name(prefix.name + "_alloc.txt")
+        alloc_file.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+        return [prof_file, stats_file, alloc_file]
+
+    def dump(self) -> list:
+        """
+        Tüm aşamaların profil çıktılarını yaz ve tracemalloc'u durdur
+
+        Returns:
+            list: Yazılan dosyalar
+        """
+        written = []
+        try:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            for stage in self.stages.values():
+                if stage.after is not None:
+                    written.extend(self._write_stage(stage))
+            logger.info(f"🔬 Profil çıktıları yazıldı: {self.output_dir}")
+        except OSError as e:
+            logger.warning(f"⚠️  Profil çıktıları yazılamadı: {str(e)}")
+        finally:
+            tracemalloc.stop()
+        return written
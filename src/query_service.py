@@ -0,0 +1,351 @@
+"""
+Query Service Module
+Bugünün planını, günlük istatistikleri, başarısız gönderimleri ve ileriye
+dönük hatırlatma tahminini JSON olarak sunan salt okunur yerel HTTP servisi.
+Yalnızca standart kütüphane (http.server) kullanır.
+
+Takvim yalnızca dosya değiştiğinde (boyut/mtime) bir kez akış halinde okunur;
+plan ve tahmin bu okumadan bellekte hesaplanır. İstatistik ve başarısız
+kayıtlar rapor store'unun özet tablolarından okunur. Her uç noktanın JSON
+yanıtı takvim, rapor ve gün değişene kadar byte olarak önbellekte tutulur;
+bu yüzden önbellekteki bir yanıt için yalnızca birkaç stat çağrısı ve bir dict
+araması yapılır.
+
+Uç noktalar:
+    GET /health                     Servis ve veri sürümleri
+    GET /plan                       Bugün gönderilecek hatırlatmalar
+    GET /stats?date=YYYY-MM-DD      Günlük istatistikler (varsayılan bugün)
+    GET /failed?limit=10            Son başarısız gönderimler
+    GET /forecast?days=30           Önümüzdeki günlere düşen hatırlatma sayıları
+
+Kullanım:
+    python src/main.py --serve
+    curl http://127.0.0.1:8765/stats
+"""
+
+import json
+import os
+import threading
+from datetime import date, datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+import logging
+
+from file_handler import FileHandler
+from scheduler import Scheduler, REMINDER_OFFSETS
+
+logger = logging.getLogger(__name__)
+
+MAX_FAILED_LIMIT = 1000
+MAX_FORECAST_DAYS = 366
+# Farklı sorgu parametreleriyle önbelleğin sınırsız büyümesini engeller
+MAX_CACHED_RESPONSES = 1024
+
+
+class QueryError(Exception):
+    """İstemci hatası (HTTP durum koduyla)"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def _file_version(path: Path):
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+class QueryService:
+    """Takvim ve rapor değişene kadar önbellekte tutulan sorgu yanıtları"""
+
+    def __init__(self, calendar_file: str = "data/Merkezi_Takvimi.xlsx",
+                 report_file: str = "data/mail_raporu.xlsx", timezone: str = "Europe/Istanbul"):
+        self.file_handler = FileHandler(calendar_file)
+        self.report_file = report_file
+        self.timezone = timezone
+        self._report_manager = None
+        self._report_version = None
+        self._summary_db = Path(report_file).with_suffix("") / "ozet.db"
+
+        self._lock = threading.Lock()
+        self._version = None
+        self._responses = {}
+        self._calendar = None
+        self._calendar_version = None
+        self._routes = {
+            "/health": self._health,
+            "/plan": self._plan,
+            "/stats": self._stats,
+            "/failed": self._failed,
+            "/forecast": self._forecast,
+        }
+
+    def _report(self, version: tuple) -> "ReportManager":
+        """
+        Salt okunur rapor yöneticisi
+
+        Store mode=ro ile açılır; arşivleme, aktarım veya bölüm oluşturma
+        yapılmaz. Rapor değiştiğinde bağlantılar yeniden açılır, böylece başka
+        bir sürecin arşivlediği veya yeni oluşturduğu bölümler görülür.
+        """
+        report_version = version[2:]
+        if self._report_manager is not None and self._report_version != report_version:
+            self._report_manager.store.close()
+            self._report_manager = None
+        if self._report_manager is None:
+            from report_manager import ReportManager
+            try:
+                self._report_manager = ReportManager(self.report_file, read_only=True)
+            except FileNotFoundError:
+                raise QueryError(503, f"Rapor store'u henüz oluşturulmadı: {self._summary_db.parent}")
+            self._report_version = report_version
+        return self._report_manager
+
+    def _current_version(self) -> tuple:
+        # Özet veritabanı her rapor eklemesinde aynı transaction içinde güncellenir
+        return (
+            Scheduler(self.timezone).today,
+            _file_version(self.file_handler.file_path),
+            _file_version(self._summary_db),
+            _file_version(self._summary_db.with_name("ozet.db-wal")),
+        )
+
+    def get(self, path: str, query: str = "") -> bytes:
+        """
+        Uç noktanın JSON yanıtı (önbellekten veya yeniden hesaplanarak)
+
+        Raises:
+            QueryError: Bilinmeyen yol veya geçersiz parametre
+        """
+        version = self._current_version()
+        key = (path, query)
+        cached = self._responses.get(key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        handler = self._routes.get(path)
+        if handler is None:
+            raise QueryError(404, f"Bilinmeyen uç nokta: {path}")
+        params = {name: values[-1] for name, values in parse_qs(query).items()}
+
+        with self._lock:
+            if self._version != version:
+                self._responses = {}
+                self._version = version
+            cached = self._responses.get(key)
+            if cached is not None and cached[0] == version:
+                return cached[1]
+
+            body = json.dumps(handler(params, version), ensure_ascii=False, default=str).encode("utf-8")
+            if len(self._responses) >= MAX_CACHED_RESPONSES:
+                self._responses = {}
+            self._responses[key] = (version, body)
+            return body
+
+    # ------------------------------------------------------------------
+    # Takvim agregaları
+    # ------------------------------------------------------------------
+
+    def _calendar_aggregates(self, version: tuple) -> dict:
+        """Takvimi (gün veya dosya değiştiyse) bir kez okuyup plan ve tahmini hesapla"""
+        calendar_version = version[:2]
+        if self._calendar is not None and self._calendar_version == calendar_version:
+            return self._calendar
+
+        if not self.file_handler.file_path.exists():
+            raise QueryError(503, f"İhale dosyası bulunamadı: {self.file_handler.file_path}")
+
+        started = datetime.now()
+        errors = []
+        warnings = []
+        ihale_list = list(self.file_handler.iter_ihale_rows(errors, warnings))
+        scheduler = Scheduler(self.timezone)
+        schedule_result = scheduler.calculate_reminders(ihale_list)
+        if not schedule_result["success"]:
+            raise QueryError(500, "Hatırlatma hesaplama başarısız")
+
+        # Gönderilmemiş hatırlatmaların vade günlerine göre dağılımı
+        forecast = {}
+        for ihale in ihale_list:
+            baslangic_tarihi = ihale["baslangic_tarihi"].date()
+            sent_reminders = scheduler._parse_hatirlatma_durumu(ihale["hatirlatma_durumu"])
+            for gun, hatirlatma_tipi in REMINDER_OFFSETS:
+                due = baslangic_tarihi - timedelta(days=gun)
+                if due < scheduler.today or hatirlatma_tipi in sent_reminders:
+                    continue
+                day = forecast.setdefault(due, {"toplam": 0, "60_gun": 0, "30_gun": 0, "1_gun": 0})
+                day["toplam"] += 1
+                day[hatirlatma_tipi] += 1
+
+        self._calendar = {
+            "today": scheduler.today,
+            "okunma_zamani": started.isoformat(timespec="seconds"),
+            "gecerli_ihale": len(ihale_list),
+            "hatali_satir": len(errors),
+            "plan": [
+                {
+                    "ihale_no": reminder["ihale_no"],
+                    "ihale_adi": reminder["ihale_adi"],
+                    "yonetici": reminder["yonetici"],
+                    "yonetici_mail": reminder["yonetici_mail"],
+                    "hatirlatma_tipi": reminder["hatirlatma_tipi"],
+                    "kalan_gun": reminder["kalan_gun"],
+                    "oncelik": reminder["oncelik"],
+                    "baslangic_tarihi": reminder["baslangic_tarihi"].date().isoformat()
+                }
+                for reminder in schedule_result["reminders_to_send"]
+            ],
+            "forecast": forecast
+        }
+        self._calendar_version = calendar_version
+        duration = (datetime.now() - started).total_seconds()
+        logger.info(f"🔄 Takvim agregaları yenilendi: {len(ihale_list)} ihale, {duration:.3f} saniye")
+        return self._calendar
+
+    # ------------------------------------------------------------------
+    # Uç noktalar
+    # ------------------------------------------------------------------
+
+    def _health(self, params: dict, version: tuple) -> dict:
+        today, calendar, summary, _ = version
+        return {
+            "success": True,
+            "bugun": today.isoformat(),
+            "takvim": str(self.file_handler.file_path),
+            "takvim_degisiklik": datetime.fromtimestamp(calendar[1] / 1e9).isoformat(timespec="seconds") if calendar else None,
+            "rapor_degisiklik": datetime.fromtimestamp(summary[1] / 1e9).isoformat(timespec="seconds") if summary else None,
+            "uc_noktalar": sorted(self._routes)
+        }
+
+    def _plan(self, params: dict, version: tuple) -> dict:
+        calendar = self._calendar_aggregates(version)
+        return {
+            "success": True,
+            "plan_tarihi": calendar["today"].isoformat(),
+            "takvim_okunma_zamani": calendar["okunma_zamani"],
+            "gecerli_ihale": calendar["gecerli_ihale"],
+            "hatali_satir": calendar["hatali_satir"],
+            "hatirlatma_sayisi": len(calendar["plan"]),
+            "plan": calendar["plan"]
+        }
+
+    def _stats(self, params: dict, version: tuple) -> dict:
+        day = _parse_date(params.get("date")) if params.get("date") else version[0]
+        stats = self._report(version).get_daily_statistics(datetime.combine(day, datetime.min.time()))
+        if not stats:
+            raise QueryError(500, "İstatistik hesaplanamadı")
+        return dict(success=True, **stats)
+
+    def _failed(self, params: dict, version: tuple) -> dict:
+        limit = _parse_int(params.get("limit"), 10, 1, MAX_FAILED_LIMIT, "limit")
+        records = self._report(version).get_failed_reports(limit)
+        return {"success": True, "adet": len(records), "kayitlar": records}
+
+    def _forecast(self, params: dict, version: tuple) -> dict:
+        days = _parse_int(params.get("days"), 30, 1, MAX_FORECAST_DAYS, "days")
+        calendar = self._calendar_aggregates(version)
+        today = calendar["today"]
+        last_day = today + timedelta(days=days - 1)
+        daily = {
+            due.isoformat(): counts
+            for due, counts in sorted(calendar["forecast"].items())
+            if due <= last_day
+        }
+        return {
+            "success": True,
+            "baslangic": today.isoformat(),
+            "bitis": last_day.isoformat(),
+            "toplam": sum(counts["toplam"] for counts in daily.values()),
+            "gunluk": daily
+        }
+
+
+def _parse_date(value: str) -> date:
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise QueryError(400, f"Geçersiz tarih: {value} (YYYY-MM-DD bekleniyor)")
+
+
+def _parse_int(value: str, default: int, minimum: int, maximum: int, name: str) -> int:
+    if value is None:
+        return default
+    try:
+        number = int(value)
+    except ValueError:
+        raise QueryError(400, f"Geçersiz {name}: {value}")
+    return max(minimum, min(number, maximum))
+
+
+class _QueryHandler(BaseHTTPRequestHandler):
+    """GET isteklerini QueryService'e yönlendiren handler (keep-alive destekli)"""
+
+    protocol_version = "HTTP/1.1"
+    server_version = "IhaleHatirlatma/1.0"
+    # Başlık ve gövde ayrı yazılır; Nagle + delayed ACK keep-alive'da her yanıtı ~40 ms bekletir
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        path = url.path.rstrip("/") or "/health"
+        try:
+            body = self.server.service.get(path, url.query)
+            status = 200
+        except QueryError as e:
+            body = json.dumps({"success": False, "error": str(e)}, ensure_ascii=False).encode("utf-8")
+            status = e.status
+        except Exception as e:
+            logger.exception(f"❌ Sorgu hatası: {path}")
+            body = json.dumps({"success": False, "error": str(e)}, ensure_ascii=False).encode("utf-8")
+            status = 500
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Her istek için konsola yazmasın
+        logger.debug(f"{self.address_string()} - {format % args}")
+
+
+class QueryServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, service: QueryService, host: str, port: int):
+        super().__init__((host, port), _QueryHandler)
+        self.service = service
+
+
+def serve(host: str = None, port: int = None, service: QueryService = None):
+    """
+    Servisi başlat (Ctrl+C ile durur)
+
+    Args:
+        host: Dinlenecek adres (None ise QUERY_SERVICE_HOST veya 127.0.0.1)
+        port: Port (None ise QUERY_SERVICE_PORT veya 8765)
+    """
+    host = host or os.getenv("QUERY_SERVICE_HOST", "127.0.0.1")
+    port = port if port is not None else int(os.getenv("QUERY_SERVICE_PORT", "8765"))
+    server = QueryServer(service or QueryService(), host, port)
+    logger.info(f"🌐 Sorgu servisi dinleniyor: http://{host}:{server.server_port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.info("🛑 Sorgu servisi durduruldu")
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    from dotenv import load_dotenv
+    from log_config import setup_logging
+    load_dotenv()
+    setup_logging(log_file="")
+    serve()
@@ -0,0 +1,281 @@
+"""
+Reconciliation Module
+Takvimden beklenen hatırlatmaları gönderim geçmişi ve takvimdeki
+"Hatırlatma Durumu" ile karşılaştırır (mutabakat).
+
+Takvim bir kez akış halinde okunur ve tarih aralığındaki her beklenen
+hatırlatma, göndericinin rapora yazdığı (ihale no, hatırlatma tipi, yönetici
+mail) anahtarıyla bellekte bir hash tablosuna konur. Aynı ihale no farklı
+yöneticilerle tekrar ediyorsa her satır ayrı izlenir; anahtarın tamamı
+tekrar ediyorsa gönderimler ayırt edilemez ve satır bulgu olarak raporlanır.
+Rapor geçmişi de bir kez, yalnızca ilgili aylık bölümlerden okunur ve her
+kayıt tabloda anahtarıyla aranır; beklenmeyen kayıtlar saklanmaz. Bellek
+beklenen hatırlatma sayısıyla, süre okunan satır sayısıyla doğru orantılıdır.
+
+Bulgular:
+    kacirildi      Vadesi geçmiş, başarılı gönderimi ve takvim kaydı olmayan hatırlatma
+    gecikmeli      İlk başarılı gönderimi vade tarihinden sonra olan hatırlatma
+    cift_gonderim  Birden fazla başarılı gönderimi olan hatırlatma
+    takvim_tekrari Takvimde aynı ihale no, tip ve yönetici maili ile tekrarlanan satır
+"""
+
+from datetime import date, timedelta
+import logging
+
+from scheduler import REMINDER_OFFSETS
+from report_store import REPORT_HEADINGS, month_of
+
+logger = logging.getLogger(__name__)
+
+FINDING_TYPES = ("kacirildi", "gecikmeli", "cift_gonderim", "takvim_tekrari")
+
+_DAY = REPORT_HEADINGS.index("Gönderim Tarihi")
+_IHALE_NO = REPORT_HEADINGS.index("İhale No")
+_TIPI = REPORT_HEADINGS.index("Hatırlatma Tipi")
+_MAIL = REPORT_HEADINGS.index("Yönetici Mail")
+_DURUM = REPORT_HEADINGS.index("Durum")
+
+
+def _mail_key(mail) -> str:
+    return str(mail).strip().lower() if mail else ""
+
+
+def parse_status_dates(hatirlatma_durumu: str) -> dict:
+    """
+    Hatırlatma durumu hücresini tip → tarih eşlemesine çevir
+
+    Örnek: "60gün:2025-11-13, 30_gun:2025-12-13"
+    Returns: {"60_gun": "2025-11-13", "30_gun": "2025-12-13"}
+    """
+    if not hatirlatma_durumu or hatirlatma_durumu == "None":
+        return {}
+
+    dates = {}
+    for part in hatirlatma_durumu.split(","):
+        if ":" not in part:
+            continue
+        reminder_type, day = part.split(":", 1)
+        # Scheduler._parse_hatirlatma_durumu ile aynı normalizasyon
+        reminder_type = reminder_type.strip().replace("gün", "gun")
+        if "_gun" not in reminder_type:
+            reminder_type = reminder_type.replace("gun", "_gun")
+        day = day.strip()[:10]
+        if reminder_type not in dates or day < dates[reminder_type]:
+            dates[reminder_type] = day
+    return dates
+
+
+class Reconciler:
+    """Beklenen ve gerçekleşen hatırlatmaların hash join ile karşılaştırılması"""
+
+    def __init__(self, start: date, end: date, today: date):
+        """
+        Args:
+            start, end: Vade tarihi aralığı (ikisi de dahil)
+            today: Bugün (vadesi bugün veya sonra olanlar henüz kaçırılmış sayılmaz)
+        """
+        self.start = start
+        self.end = end
+        self.today = today
+        # (ihale_no, tip, yönetici mail) -> beklenen hatırlatma ve gönderim sayaçları
+        self._expected = {}
+        # Anahtarı önceki bir satırla çakışan beklenen hatırlatmalar
+        self._duplicates = []
+        self._latest_start = None
+        self.report_rows = 0
+
+    def add_calendar(self, ihale_iter) -> int:
+        """
+        Takvimdeki ihalelerden aralıktaki beklenen hatırlatmaları çıkar
+
+        Returns:
+            int: Okunan ihale sayısı
+        """
+        count = 0
+        for ihale in ihale_iter:
+            count += 1
+            baslangic_tarihi = ihale["baslangic_tarihi"].date()
+            status_dates = parse_status_dates(ihale["hatirlatma_durumu"])
+
+            for gun, hatirlatma_tipi in REMINDER_OFFSETS:
+                due = baslangic_tarihi - timedelta(days=gun)
+                if due < self.start or due > self.end:
+                    continue
+                key = (ihale["ihale_no"], hatirlatma_tipi, _mail_key(ihale["yonetici_mail"]))
+                entry = {
+                    "ihale_no": ihale["ihale_no"],
+                    "ihale_adi": ihale["ihale_adi"],
+                    "yonetici_mail": ihale["yonetici_mail"],
+                    "hatirlatma_tipi": hatirlatma_tipi,
+                    "vade_tarihi": due.isoformat(),
+                    "takvim_tarihi": status_dates.get(hatirlatma_tipi),
+                    "basarili": [],
+                    "basarisiz": 0,
+                    "engellendi": 0
+                }
+                if key in self._expected:
+                    # Rapor kayıtları iki satırdan hangisine ait ayırt edilemez: ilki izlenir
+                    self._duplicates.append(entry)
+                    continue
+                self._expected[key] = entry
+                if self._latest_start is None or baslangic_tarihi > self._latest_start:
+                    self._latest_start = baslangic_tarihi
+        return count
+
+    def report_range(self) -> tuple:
+        """
+        Okunması gereken gönderim tarihi aralığı
+
+        Hatırlatmalar vade gününden başlangıç tarihine kadar gönderilebilir
+        (kalan gün > 0); aralık dışındaki bölümler hiç açılmaz.
+
+        Returns:
+            tuple: ("YYYY-MM-DD", "YYYY-MM-DD") veya beklenen hatırlatma yoksa None
+        """
+        if not self._expected:
+            return None
+        return self.start.isoformat(), self._latest_start.isoformat()
+
+    def add_report(self, rows):
+        """Rapor kayıtlarını (REPORT_HEADINGS sırasında tuple) beklenen tabloda ara"""
+        day_range = self.report_range()
+        if day_range is None:
+            return
+        first_day, last_day = day_range
+
+        expected = self._expected
+        for row in rows:
+            day = row[_DAY]
+            if not day or day < first_day or day > last_day:
+                continue
+            self.report_rows += 1
+            entry = expected.get((row[_IHALE_NO], row[_TIPI], _mail_key(row[_MAIL])))
+            if entry is None:
+                continue
+            durum = row[_DURUM]
+            if durum == "Başarılı":
+                entry["basarili"].append(day)
+            elif durum == "Engellendi":
+                entry["engellendi"] += 1
+            else:
+                entry["basarisiz"] += 1
+
+    def findings(self) -> tuple:
+        """
+        Bulguları çıkar
+
+        Returns:
+            tuple: (özet, bulgular) - her bulgu tek bir (hatırlatma, bulgu tipi) satırıdır
+        """
+        today = self.today.isoformat()
+        counts = dict.fromkeys(FINDING_TYPES, 0)
+        summary = {
+            "beklenen": len(self._expected),
+            "bekliyor": 0,
+            "gonderildi": 0,
+            **counts
+        }
+        items = []
+
+        for entry in sorted(self._expected.values(), key=lambda e: (e["vade_tarihi"], e["ihale_no"])):
+            if entry["vade_tarihi"] >= today and not entry["basarili"] and not entry["takvim_tarihi"]:
+                summary["bekliyor"] += 1
+                continue
+
+            # Rapor kaydı yoksa (ör. eski geçmiş) takvimdeki tarih gönderim kanıtıdır
+            sent_dates = entry["basarili"] or ([entry["takvim_tarihi"]] if entry["takvim_tarihi"] else [])
+            first_sent = min(sent_dates) if sent_dates else None
+
+            found = []
+            if first_sent is None:
+                found.append(("kacirildi", self._missed_reason(entry)))
+            else:
+                summary["gonderildi"] += 1
+                if first_sent > entry["vade_tarihi"]:
+                    delay = (date.fromisoformat(first_sent) - date.fromisoformat(entry["vade_tarihi"])).days
+                    found.append(("gecikmeli", f"{delay} gün gecikme"))
+                if len(entry["basarili"]) > 1:
+                    found.append(("cift_gonderim", f"{len(entry['basarili'])} başarılı gönderim"))
+
+            for finding, detail in found:
+                summary[finding] += 1
+                items.append({
+                    "bulgu": finding,
+                    "ihale_no": entry["ihale_no"],
+                    "ihale_adi": entry["ihale_adi"],
+                    "yonetici_mail": entry["yonetici_mail"],
+                    "hatirlatma_tipi": entry["hatirlatma_tipi"],
+                    "vade_tarihi": entry["vade_tarihi"],
+                    "ilk_gonderim": first_sent,
+                    "basarili_gonderim": len(entry["basarili"]),
+                    "basarisiz_gonderim": entry["basarisiz"],
+                    "engellenen_gonderim": entry["engellendi"],
+                    "takvim_durumu": entry["takvim_tarihi"],
+                    "aciklama": detail
+                })
+
+        for entry in self._duplicates:
+            summary["takvim_tekrari"] += 1
+            items.append({
+                "bulgu": "takvim_tekrari",
+                "ihale_no": entry["ihale_no"],
+                "ihale_adi": entry["ihale_adi"],
+                "yonetici_mail": entry["yonetici_mail"],
+                "hatirlatma_tipi": entry["hatirlatma_tipi"],
+                "vade_tarihi": entry["vade_tarihi"],
+                "ilk_gonderim": None,
+                "basarili_gonderim": None,
+                "basarisiz_gonderim": None,
+                "engellenen_gonderim": None,
+                "takvim_durumu": entry["takvim_tarihi"],
+                "aciklama": "Takvimde aynı ihale no, tip ve yönetici ile tekrarlanan satır; gönderimleri ilk satıra sayıldı"
+            })
+
+        return summary, items
+
+    @staticmethod
+    def _missed_reason(entry: dict) -> str:
+        if entry["engellendi"]:
+            return "Alıcı engel listesinde"
+        if entry["basarisiz"]:
+            return f"{entry['basarisiz']} başarısız deneme"
+        return "Gönderim kaydı yok"
+
+
+def reconcile(ihale_iter, store, start: date, end: date, today: date) -> dict:
+    """
+    Takvimi ve rapor geçmişini birer kez okuyarak mutabakat yap
+
+    Args:
+        ihale_iter: İhale dictionary'leri üreten iterable (FileHandler.iter_ihale_rows)
+        store: ReportStore
+        start, end: Vade tarihi aralığı (ikisi de dahil)
+        today: Bugün
+
+    Returns:
+        dict: success, summary, findings
+    """
+    reconciler = Reconciler(start, end, today)
+    ihale_count = reconciler.add_calendar(ihale_iter)
+
+    day_range = reconciler.report_range()
+    if day_range is not None:
+        reconciler.add_report(store.iter_rows(month_of(day_range[0]), month_of(day_range[1])))
+
+    summary, items = reconciler.findings()
+    summary = {
+        "baslangic": start.isoformat(),
+        "bitis": end.isoformat(),
+        "bugun": today.isoformat(),
+        "okunan_ihale": ihale_count,
+        "okunan_rapor_kaydi": reconciler.report_rows,
+        **summary
+    }
+    logger.info(
+        f"🧾 Mutabakat {summary['baslangic']} - {summary['bitis']}: {summary['beklenen']} beklenen, "
+        f"{summary['kacirildi']} kaçırılmış, {summary['gecikmeli']} gecikmeli, "
+        f"{summary['cift_gonderim']} çift gönderim"
+    )
+    if summary["takvim_tekrari"]:
+        logger.warning(f"⚠️  Takvimde {summary['takvim_tekrari']} tekrarlanan hatırlatma satırı var")
+    return {"success": True, "summary": summary, "findings": items}
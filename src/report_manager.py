@@ -3,60 +3,196 @@ Report Manager Module
 Gönderilen maillerin Excel raporunu yönetir.
 """
 
-import pandas as pd
-from datetime import datetime
+from datetime import datetime, timedelta
+import calendar
+import json
+import os
+import shutil
 from pathlib import Path
 import logging
 
-logging.basicConfig(level=logging.INFO)
+from report_store import ReportStore, REPORT_COLUMNS, REPORT_HEADINGS, REPORT_DATE_COLUMNS
+
 logger = logging.getLogger(__name__)
 
 
+REPORT_COLUMN_WIDTHS = {
+    'A': 15,  # Gönderim Tarihi
+    'B': 12,  # Gönderim Saati
+    'C': 10,  # İhale No
+    'D': 40,  # İhale Adı
+    'E': 20,  # Yönetici
+    'F': 30,  # Yönetici Mail
+    'G': 15,  # Hatırlatma Tipi
+    'H': 12,  # Kalan Gün
+    'I': 15,  # Başlangıç Tarihi
+    'J': 12,  # Durum
+    'K': 40,  # Hata Mesajı
+    'L': 12   # Retry Sayısı
+}
+
+# Durum sütunu (başlık hariç tüm satırlar)
+DURUM_RANGE = "J2:J1048576"
+
+# Bir Excel sayfasına sığan kayıt sayısı (başlık satırı hariç)
+EXCEL_MAX_DATA_ROWS = 1048575
+
+# Gönderim sonucu (EmailSender status) -> rapordaki Durum
+DURUM_BY_STATUS = {"sent": "Başarılı", "failed": "Başarısız", "suppressed": "Engellendi"}
+
+_STYLE_TEMPLATE = None
+
+
+def _get_style_template() -> dict:
+    """Excel export stillerini bir kez oluşturup önbellekte tut"""
+    global _STYLE_TEMPLATE
+    if _STYLE_TEMPLATE is None:
+        from openpyxl.styles import Font, PatternFill
+        from openpyxl.formatting.rule import CellIsRule
+        
+        basarili_fill = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
+        basarisiz_fill = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
+        engellendi_fill = PatternFill(start_color="D9D9D9", end_color="D9D9D9", fill_type="solid")
+        
+        def durum_rules() -> list:
+            # Kurallar workbook'a eklenirken öncelik aldığı için her export'ta yeni örnek
+            return [
+                CellIsRule(operator="equal", formula=['"Başarılı"'], fill=basarili_fill),
+                CellIsRule(operator="equal", formula=['"Başarısız"'], fill=basarisiz_fill),
+                CellIsRule(operator="equal", formula=['"Engellendi"'], fill=engellendi_fill),
+            ]
+        
+        _STYLE_TEMPLATE = {
+            "header_font": Font(bold=True),
+            "durum_rules": durum_rules
+        }
+    return _STYLE_TEMPLATE
+
+
 class ReportManager:
     """Mail raporu yönetim sınıfı"""
     
-    def __init__(self, report_file: str = "data/mail_raporu.xlsx"):
+    def __init__(self, report_file: str = "data/mail_raporu.xlsx", store_dir: str = None,
+                 archive_after_months: int = None, dtype_backend: str = None, read_only: bool = False,
+                 excel_scope: str = None):
+        # Excel raporu türetilmiş bir çıktıdır, asıl kayıt aylık bölümlenmiş store'dadır
         self.report_file = Path(report_file)
-        self.df = None
+        self.store_dir = Path(store_dir) if store_dir else self.report_file.with_suffix("")
+        self.archive_after_months = archive_after_months if archive_after_months is not None \
+            else int(os.getenv("REPORT_ARCHIVE_AFTER_MONTHS", "3"))
+        # Geçmiş DataFrame'leri için dtype backend ("numpy" veya "pyarrow")
+        self.dtype_backend = dtype_backend or os.getenv("REPORT_DTYPE_BACKEND", "numpy")
+        # Salt okunur: store'a mode=ro bağlanılır, aktarım ve arşivleme yapılmaz
+        self.read_only = read_only
+        # Excel'e yazılan geçmiş: "live" yalnızca arşivlenmemiş bölümler, "full" arşiv dahil tümü
+        self.excel_scope = (excel_scope or os.getenv("REPORT_EXCEL_SCOPE", "live")).lower()
+        if self.excel_scope not in ("full", "live"):
+            logger.warning(f"⚠️  Geçersiz REPORT_EXCEL_SCOPE: {self.excel_scope}, 'live' kullanılıyor")
+            self.excel_scope = "live"
+        self.store = None
+        self._df = None
+        self._export_pending = False
         
-        # Rapor dosyasını yükle veya oluştur
+        # Rapor store'unu aç veya oluştur
         self._initialize_report()
     
     def _initialize_report(self):
-        """Rapor dosyasını başlat"""
+        """Rapor store'unu başlat (yalnızca içinde bulunulan ayın bölümü açılır)"""
+        if self.read_only:
+            self.store = ReportStore(self.store_dir, archive_after_months=self.archive_after_months, read_only=True)
+            return
+        
         try:
-            if self.report_file.exists():
-                # Mevcut raporu yükle
-                self.df = pd.read_excel(self.report_file)
-                logger.info(f"✅ Mevcut rapor yüklendi: {len(self.df)} kayıt")
+            is_new = not (self.store_dir / "ozet.db").exists()
+            self.store = ReportStore(self.store_dir, archive_after_months=self.archive_after_months)
+            
+            legacy_db = self.report_file.with_suffix(".db")
+            if is_new and legacy_db.exists():
+                # Tek dosyalık eski store'u aylık bölümlere aktar
+                imported = self.store.import_legacy_db(legacy_db)
+                legacy_db.rename(legacy_db.with_suffix(".db.migrated"))
+                logger.info(f"✅ Eski rapor store'u bölümlere aktarıldı: {imported} kayıt")
+            elif is_new and self.report_file.exists():
+                # Eski Excel raporunu bir kereliğine store'a aktar
+                import pandas as pd
+                legacy_df = pd.read_excel(self.report_file)
+                imported = self.store.append_many(legacy_df.to_dict('records'))
+                logger.info(f"✅ Mevcut Excel raporu store'a aktarıldı: {imported} kayıt")
+            elif is_new:
+                logger.info(f"✅ Yeni rapor store'u oluşturuldu: {self.store_dir}")
             else:
-                # Yeni rapor oluştur
-                self.df = pd.DataFrame(columns=[
-                    'Gönderim Tarihi',
-                    'Gönderim Saati',
-                    'İhale No',
-                    'İhale Adı',
-                    'Yönetici',
-                    'Yönetici Mail',
-                    'Hatırlatma Tipi',
-                    'Kalan Gün',
-                    'Başlangıç Tarihi',
-                    'Durum',
-                    'Hata Mesajı',
-                    'Retry Sayısı'
-                ])
-                
-                # Klasörü oluştur
-                self.report_file.parent.mkdir(parents=True, exist_ok=True)
-                
-                # İlk kez kaydet
-                self.df.to_excel(self.report_file, index=False)
-                logger.info(f"✅ Yeni rapor dosyası oluşturuldu: {self.report_file}")
+                logger.info(f"✅ Rapor store'u açıldı: {self.store_dir} (aktif bölüm: {self.store.current_month})")
+            
+            # Eski bölümleri sıkıştırıp arşive taşı
+            self.store.archive_old_partitions()
                 
         except Exception as e:
             logger.error(f"❌ Rapor başlatma hatası: {str(e)}")
             raise
     
+    @property
+    def df(self) -> "pd.DataFrame":
+        """İçinde bulunulan ayın kayıtları (store'dan ihtiyaç anında yüklenir)"""
+        if self._df is None:
+            self._df = self.store.to_dataframe(
+                self.store.current_month, self.store.current_month, self.dtype_backend
+            )
+        return self._df
+    
+    def load_history(self, start: datetime = None, end: datetime = None) -> "pd.DataFrame":
+        """
+        Tarih aralığındaki kayıtları yükle
+        
+        Yalnızca aralığa giren aylık bölümler okunur; arşivlenmiş bölümler
+        gerektiğinde açılır.
+        
+        Args:
+            start: Başlangıç tarihi (None ise en eski kayıt)
+            end: Bitiş tarihi (None ise en yeni kayıt)
+            
+        Returns:
+            DataFrame: Rapor başlıklarıyla tipli kayıtlar (bkz. report_store.build_report_frame)
+        """
+        import pandas as pd
+        
+        df = self.store.to_dataframe(
+            start.strftime("%Y-%m") if start else None,
+            end.strftime("%Y-%m") if end else None,
+            self.dtype_backend
+        )
+        if start is not None:
+            df = df[df['Gönderim Tarihi'] >= pd.Timestamp(start.strftime("%Y-%m-%d"))]
+        if end is not None:
+            df = df[df['Gönderim Tarihi'] <= pd.Timestamp(end.strftime("%Y-%m-%d"))]
+        return df.reset_index(drop=True)
+    
+    def _build_entry(self, email_result: dict, reminder: dict) -> dict:
+        """
+        Gönderim sonucundan rapor kaydı oluştur
+        
+        Değerler DataFrame şemasıyla aynı tiplere çevrilir (tam sayılar int,
+        tarih/saat ISO metin); numpy sayıları store'a ulaşmaz.
+        """
+        return {
+            'Gönderim Tarihi': email_result["timestamp"].strftime("%Y-%m-%d"),
+            'Gönderim Saati': email_result["timestamp"].strftime("%H:%M:%S"),
+            'İhale No': int(email_result["ihale_no"]),
+            'İhale Adı': str(email_result["ihale_adi"]),
+            'Yönetici': str(reminder["yonetici"]),
+            'Yönetici Mail': str(email_result["recipient"]),
+            'Hatırlatma Tipi': reminder["hatirlatma_tipi"],
+            'Kalan Gün': int(reminder["kalan_gun"]),
+            'Başlangıç Tarihi': reminder["baslangic_tarihi"].strftime("%Y-%m-%d"),
+            'Durum': DURUM_BY_STATUS.get(email_result["status"], "Başarısız"),
+            'Hata Mesajı': email_result.get("error_message") or None,
+            'Retry Sayısı': int(email_result.get("retry_count") or 0)
+        }
+    
+    def _on_entries_added(self):
+        """Yeni kayıt sonrası önbelleği geçersiz kıl"""
+        self._df = None
+        self._export_pending = True
+    
     def add_entries(self, email_results: list, reminder_info: dict = None) -> dict:
         """
         Birden fazla mail sonucunu rapora ekle
@@ -69,8 +205,8 @@ class ReportManager:
             dict: Ekleme sonucu
         """
         try:
-            added_count = 0
             errors = []
+            entries = []
             
             for result in email_results:
                 # Entry oluştur
@@ -84,24 +220,22 @@ class ReportManager:
                     'Hatırlatma Tipi': reminder_info.get("hatirlatma_tipi", "") if reminder_info else "",
                     'Kalan Gün': reminder_info.get("kalan_gun", 0) if reminder_info else 0,
                     'Başlangıç Tarihi': reminder_info.get("baslangic_tarihi", "") if reminder_info else "",
-                    'Durum': "Başarılı" if result["status"] == "sent" else "Başarısız",
+                    'Durum': DURUM_BY_STATUS.get(result["status"], "Başarısız"),
                     'Hata Mesajı': result.get("error_message", ""),
                     'Retry Sayısı': result.get("retry_count", 0)
                 }
-                
-                # DataFrame'e ekle
-                self.df = pd.concat([self.df, pd.DataFrame([entry])], ignore_index=True)
-                added_count += 1
+                entries.append(entry)
             
-            # Dosyaya kaydet
-            self._save_report()
+            # Store'a tek transaction ile ekle
+            added_count = self.store.append_many(entries)
+            self._on_entries_added()
             
             logger.info(f"✅ {added_count} kayıt rapora eklendi")
             
             return {
                 "success": True,
                 "entries_added": added_count,
-                "total_entries": len(self.df),
+                "total_entries": self.store.count(),
                 "errors": errors
             }
             
@@ -110,14 +244,38 @@ class ReportManager:
             return {
                 "success": False,
                 "entries_added": 0,
-                "total_entries": len(self.df),
+                "total_entries": self.store.count(),
                 "errors": [str(e)]
             }
     
+    def add_results(self, pairs: list) -> int:
+        """
+        (reminder, email_result) çiftlerini tek transaction ile rapora ekle
+
+        Returns:
+            int: Eklenen kayıt sayısı
+        """
+        if not pairs:
+            return 0
+
+        try:
+            added_count = self.store.append_many(
+                [self._build_entry(result, reminder) for reminder, result in pairs]
+            )
+            self._on_entries_added()
+            return added_count
+
+        except Exception as e:
+            logger.error(f"❌ Rapor ekleme hatası: {str(e)}")
+            return 0
+
     def add_entry(self, email_result: dict, reminder: dict) -> bool:
         """
         Tek bir mail sonucunu rapora ekle
         
+        Kayıt append-only store'a eklenir; Excel raporu export_excel ile
+        çalışma sonunda bir kez yeniden üretilir.
+        
         Args:
             email_result: Email gönderim sonucu
             reminder: Hatırlatma bilgileri
@@ -126,76 +284,93 @@ class ReportManager:
             bool: Başarı durumu
         """
         try:
-            # Entry oluştur
-            entry = {
-                'Gönderim Tarihi': email_result["timestamp"].strftime("%Y-%m-%d"),
-                'Gönderim Saati': email_result["timestamp"].strftime("%H:%M:%S"),
-                'İhale No': email_result["ihale_no"],
-                'İhale Adı': email_result["ihale_adi"],
-                'Yönetici': reminder["yonetici"],
-                'Yönetici Mail': email_result["recipient"],
-                'Hatırlatma Tipi': reminder["hatirlatma_tipi"],
-                'Kalan Gün': reminder["kalan_gun"],
-                'Başlangıç Tarihi': reminder["baslangic_tarihi"].strftime("%Y-%m-%d"),
-                'Durum': "Başarılı" if email_result["status"] == "sent" else "Başarısız",
-                'Hata Mesajı': email_result.get("error_message", ""),
-                'Retry Sayısı': email_result.get("retry_count", 0)
-            }
-            
-            # DataFrame'e ekle
-            self.df = pd.concat([self.df, pd.DataFrame([entry])], ignore_index=True)
-            
-            # Dosyaya kaydet
-            self._save_report()
-            
+            self.store.append(self._build_entry(email_result, reminder))
+            self._on_entries_added()
             return True
             
         except Exception as e:
             logger.error(f"❌ Entry ekleme hatası: {str(e)}")
             return False
     
-    def _save_report(self):
-        """Raporu Excel dosyasına kaydet"""
+    def export_excel(self, force: bool = False, styled: bool = True) -> bool:
+        """
+        Excel raporunu store'dan yeniden üret
+        
+        Args:
+            force: Yeni kayıt olmasa da dosyayı yeniden yaz
+            styled: False ise biçimlendirmesiz hızlı export yapılır
+            
+        Returns:
+            bool: Başarı durumu
+        """
+        if not force and not self._export_pending and self.report_file.exists():
+            return True
+        
         try:
-            # Excel writer ile formatting yap
-            with pd.ExcelWriter(self.report_file, engine='openpyxl') as writer:
-                self.df.to_excel(writer, index=False, sheet_name='Mail Raporu')
-                
-                # Worksheet'i al
-                worksheet = writer.sheets['Mail Raporu']
-                
-                # Column widths ayarla
-                column_widths = {
-                    'A': 15,  # Gönderim Tarihi
-                    'B': 12,  # Gönderim Saati
-                    'C': 10,  # İhale No
-                    'D': 40,  # İhale Adı
-                    'E': 20,  # Yönetici
-                    'F': 30,  # Yönetici Mail
-                    'G': 15,  # Hatırlatma Tipi
-                    'H': 12,  # Kalan Gün
-                    'I': 15,  # Başlangıç Tarihi
-                    'J': 12,  # Durum
-                    'K': 40,  # Hata Mesajı
-                    'L': 12   # Retry Sayısı
-                }
+            self.report_file.parent.mkdir(parents=True, exist_ok=True)
+            self._save_report(styled=styled)
+            self._export_pending = False
+            return True
+        except Exception as e:
+            logger.error(f"❌ Excel export hatası: {str(e)}")
+            return False
+    
+    def _save_report(self, styled: bool = True):
+        """
+        Raporu store'dan Excel dosyasına yaz
+        
+        Varsayılan olarak yalnızca arşivlenmemiş bölümler yazılır; çalıştırma
+        maliyeti geçmişin uzunluğuyla büyümez. excel_scope "full" ise arşivlenmiş
+        bölümler de .cache altına açılarak okunur, arşivden çıkarılmaz.
+        
+        Satırlar write-only workbook'a akış halinde yazılır. Biçimlendirme
+        satır sayısından bağımsızdır: sütun genişlikleri, kalın başlık ve
+        Durum sütunu için workbook seviyesinde koşullu biçimlendirme.
+        """
+        try:
+            from openpyxl import Workbook
+            from openpyxl.cell import WriteOnlyCell
+            
+            workbook = Workbook(write_only=True)
+            worksheet = workbook.create_sheet('Mail Raporu')
+            
+            if styled:
+                template = _get_style_template()
                 
-                for col, width in column_widths.items():
+                for col, width in REPORT_COLUMN_WIDTHS.items():
                     worksheet.column_dimensions[col].width = width
                 
-                # Header'ı bold yap
-                from openpyxl.styles import Font, PatternFill
-                
-                for cell in worksheet[1]:
-                    cell.font = Font(bold=True)
+                # Başarılı/Başarısız/Engellendi durumları renklendir (tüm sütun için tek kural)
+                for rule in template["durum_rules"]():
+                    worksheet.conditional_formatting.add(DURUM_RANGE, rule)
                 
-                # Başarılı/Başarısız durumları renklendir
-                for row in range(2, len(self.df) + 2):
-                    durum_cell = worksheet[f'J{row}']
-                    if durum_cell.value == "Başarılı":
-                        durum_cell.fill = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
-                    elif durum_cell.value == "Başarısız":
-                        durum_cell.fill = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
+                header = []
+                for heading in REPORT_HEADINGS:
+                    cell = WriteOnlyCell(worksheet, value=heading)
+                    cell.font = template["header_font"]
+                    header.append(cell)
+            else:
+                header = REPORT_HEADINGS
+            
+            worksheet.append(header)
+            
+            months = self.store.live_months() if self.excel_scope == "live" else self.store.months()
+            written = 0
+            if months:
+                for row in self.store.iter_rows(months[0], months[-1]):
+                    if written == EXCEL_MAX_DATA_ROWS:
+                        logger.warning(
+                            f"⚠️  Excel satır sınırı aşıldı, ilk {EXCEL_MAX_DATA_ROWS} kayıt yazıldı; "
+                            f"tüm geçmiş için --export-parquet veya REPORT_EXCEL_SCOPE=live kullanın"
+                        )
+                        break
+                    worksheet.append(row)
+                    written += 1
+            
+            # Yarım kalmış dosya bırakmamak için önce geçici dosyaya yaz
+            tmp_file = self.report_file.with_name(self.report_file.name + ".tmp")
+            workbook.save(tmp_file)
+            tmp_file.replace(self.report_file)
             
             logger.info(f"✅ Rapor kaydedildi: {self.report_file}")
             
@@ -203,12 +378,143 @@ class ReportManager:
             logger.error(f"❌ Rapor kaydetme hatası: {str(e)}")
             raise
     
+    def export_parquet(self, output_dir: str = "data/analytics/mail_raporu", incremental: bool = True) -> dict:
+        """
+        Gönderim geçmişini Hive bölümlü Parquet veri setine yaz (pyarrow gerekir)
+        
+        Her ay ayrı bir bölüme yazılır: <output_dir>/year=YYYY/month=MM/part-0.parquet.
+        Sütun adları SQLite sütun adlarıdır (gonderim_tarihi, durum, ...). Düşük
+        kardinaliteli sütunlar dictionary kodlanır; tarih sütunları date32,
+        gönderim saati time64 tipindedir.
+        
+        Artımlı modda ay başına kayıt sayısı (özet tablosundan, bölüm açmadan)
+        son export ile karşılaştırılır; yalnızca yeni veya değişmiş aylar yazılır.
+        Durum <output_dir>/_export_state.json dosyasında tutulur (Parquet
+        okuyucuları _ ile başlayan dosyaları yok sayar).
+        
+        Args:
+            output_dir: Veri seti klasörü
+            incremental: False ise tüm aylar yeniden yazılır
+            
+        Returns:
+            dict: Yazılan ve atlanan aylar
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            logger.error("❌ Parquet export için pyarrow gerekli: pip install -r requirements-analytics.txt")
+            return {"success": False, "written": [], "skipped": [], "error": "pyarrow yüklü değil"}
+        
+        try:
+            import pandas as pd
+            
+            output_dir = Path(output_dir)
+            output_dir.mkdir(parents=True, exist_ok=True)
+            state_file = output_dir / "_export_state.json"
+            state = {}
+            if incremental and state_file.exists():
+                state = json.loads(state_file.read_text(encoding="utf-8"))
+            
+            month_counts = self.store.month_counts()
+            written, skipped = [], []
+            for month in self.store.months():
+                count = month_counts.get(month, 0)
+                partition_dir = output_dir / f"year={month[:4]}" / f"month={month[5:7]}"
+                if state.get(month, {}).get("rows") == count and partition_dir.exists():
+                    skipped.append(month)
+                    continue
+                
+                df = self.store.to_dataframe(month, month, "pyarrow")
+                # Gün içi süre -> saat (Parquet TIME); tarihler aşağıda date32'ye çevrilir
+                times = pd.Timestamp("1900-01-01") + df["Gönderim Saati"]
+                df["Gönderim Saati"] = times.dt.time.where(times.notna(), None)
+                table = pa.Table.from_pandas(df, preserve_index=False)
+                for heading in REPORT_DATE_COLUMNS:
+                    index = table.schema.get_field_index(heading)
+                    table = table.set_column(index, heading, table.column(index).cast(pa.date32()))
+                table = table.rename_columns([name for name, _ in REPORT_COLUMNS])
+                
+                # Bölüm önce geçici klasöre yazılır, sonra eskisinin yerine konur
+                tmp_dir = partition_dir.with_name(partition_dir.name + ".tmp")
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+                tmp_dir.mkdir(parents=True)
+                pq.write_table(table, tmp_dir / "part-0.parquet", use_dictionary=True, compression="snappy")
+                shutil.rmtree(partition_dir, ignore_errors=True)
+                tmp_dir.replace(partition_dir)
+                
+                state[month] = {"rows": count, "exported_at": datetime.now().isoformat(timespec="seconds")}
+                written.append(month)
+            
+            tmp_state = state_file.with_name(state_file.name + ".tmp")
+            tmp_state.write_text(json.dumps(state, indent=2, sort_keys=True), encoding="utf-8")
+            tmp_state.replace(state_file)
+            
+            logger.info(f"✅ Parquet export: {len(written)} ay yazıldı, {len(skipped)} ay değişmemiş ({output_dir})")
+            return {"success": True, "written": written, "skipped": skipped, "output_dir": str(output_dir)}
+            
+        except Exception as e:
+            logger.error(f"❌ Parquet export hatası: {str(e)}")
+            return {"success": False, "written": [], "skipped": [], "error": str(e)}
+    
     def _extract_manager_name(self, email: str) -> str:
         """Email adresinden yönetici ismini çıkar (varsa)"""
         # Bu basit bir implementasyon
         # Gerçek uygulamada daha sofistike bir yöntem kullanılabilir
         return ""
     
+    def get_statistics(self, start: datetime, end: datetime) -> dict:
+        """
+        Tarih aralığının istatistiklerini özet tablolarından hesapla
+        
+        Maliyet geçmişin büyüklüğüne değil, aralıktaki gün sayısına bağlıdır.
+        
+        Args:
+            start: Başlangıç tarihi (dahil)
+            end: Bitiş tarihi (dahil)
+            
+        Returns:
+            dict: Aralık istatistikleri
+        """
+        try:
+            start_str = start.strftime("%Y-%m-%d")
+            end_str = end.strftime("%Y-%m-%d")
+            
+            stats = {
+                "baslangic": start_str,
+                "bitis": end_str,
+                "toplam_gonderim": 0,
+                "basarili": 0,
+                "basarisiz": 0,
+                "engellendi": 0,
+                "60_gun": 0,
+                "30_gun": 0,
+                "1_gun": 0,
+                "benzersiz_yonetici": 0,
+                "gunluk": {}
+            }
+            
+            for gun, hatirlatma_tipi, durum, adet in self.store.rollup_range(start_str, end_str):
+                stats["toplam_gonderim"] += adet
+                stats["gunluk"][gun] = stats["gunluk"].get(gun, 0) + adet
+                if durum == "Başarılı":
+                    stats["basarili"] += adet
+                elif durum == "Başarısız":
+                    stats["basarisiz"] += adet
+                elif durum == "Engellendi":
+                    stats["engellendi"] += adet
+                if hatirlatma_tipi in ("60_gun", "30_gun", "1_gun"):
+                    stats[hatirlatma_tipi] += adet
+            
+            if stats["toplam_gonderim"]:
+                stats["benzersiz_yonetici"] = self.store.unique_recipients(start_str, end_str)
+            
+            return stats
+            
+        except Exception as e:
+            logger.error(f"❌ İstatistik hesaplama hatası: {str(e)}")
+            return {}
+    
     def get_daily_statistics(self, date: datetime = None) -> dict:
         """
         Belirli bir günün istatistiklerini al
@@ -219,41 +525,112 @@ class ReportManager:
         Returns:
             dict: Günlük istatistikler
         """
-        try:
-            if date is None:
-                date = datetime.now()
-            
-            date_str = date.strftime("%Y-%m-%d")
-            
-            # Günlük filtreleme
-            daily_df = self.df[self.df['Gönderim Tarihi'] == date_str]
-            
-            if len(daily_df) == 0:
-                return {
-                    "tarih": date_str,
-                    "toplam_gonderim": 0,
-                    "basarili": 0,
-                    "basarisiz": 0,
-                    "60_gun": 0,
-                    "30_gun": 0,
-                    "1_gun": 0,
-                    "benzersiz_yonetici": 0
-                }
+        if date is None:
+            date = datetime.now()
+        
+        stats = self.get_statistics(date, date)
+        if not stats:
+            return {}
+        
+        daily = {"tarih": stats["baslangic"]}
+        daily.update({k: v for k, v in stats.items() if k not in ("baslangic", "bitis", "gunluk")})
+        return daily
+    
+    def get_weekly_statistics(self, date: datetime = None) -> dict:
+        """
+        Tarihin içinde bulunduğu haftanın (Pazartesi-Pazar) istatistiklerini al
+        
+        Args:
+            date: Haftadaki herhangi bir gün (None ise bugün)
             
+        Returns:
+            dict: Haftalık istatistikler (gün bazında kırılım dahil)
+        """
+        if date is None:
+            date = datetime.now()
+        
+        week_start = date - timedelta(days=date.weekday())
+        week_end = week_start + timedelta(days=6)
+        return self.get_statistics(week_start, week_end)
+    
+    def get_monthly_statistics(self, date: datetime = None) -> dict:
+        """
+        Tarihin içinde bulunduğu ayın istatistiklerini al
+        
+        Args:
+            date: Aydaki herhangi bir gün (None ise bugün)
+            
+        Returns:
+            dict: Aylık istatistikler (gün bazında kırılım dahil)
+        """
+        if date is None:
+            date = datetime.now()
+        
+        month_start = date.replace(day=1)
+        month_end = month_start.replace(day=calendar.monthrange(date.year, date.month)[1])
+        stats = self.get_statistics(month_start, month_end)
+        if stats:
+            stats["ay"] = month_start.strftime("%Y-%m")
+        return stats
+    
+    def query_history(self, ihale_no: int = None, yonetici_mail: str = None, durum: str = None,
+                      hatirlatma_tipi: str = None, start: datetime = None, end: datetime = None,
+                      limit: int = 100, cursor: str = None) -> dict:
+        """
+        Gönderim geçmişinde indeksli sorgu (sayfalı)
+        
+        Örnek: ihale 42'nin tüm geçmişi veya bir yöneticinin Q3 hataları
+            query_history(ihale_no=42)
+            query_history(yonetici_mail="a@firma.com", durum="Başarısız",
+                          start=datetime(2026, 7, 1), end=datetime(2026, 9, 30))
+        
+        Args:
+            ihale_no, yonetici_mail, durum, hatirlatma_tipi: Eşitlik filtreleri
+            start, end: Gönderim tarihi aralığı (ikisi de dahil)
+            limit: Sayfa boyutu
+            cursor: Önceki sayfanın next_cursor değeri
+            
+        Returns:
+            dict: Kayıtlar ve sonraki sayfa cursor'ı
+        """
+        try:
+            rows, next_cursor = self.store.query(
+                ihale_no=ihale_no, yonetici_mail=yonetici_mail, durum=durum,
+                hatirlatma_tipi=hatirlatma_tipi,
+                start_day=start.strftime("%Y-%m-%d") if start else None,
+                end_day=end.strftime("%Y-%m-%d") if end else None,
+                limit=limit, cursor=cursor
+            )
             return {
-                "tarih": date_str,
-                "toplam_gonderim": len(daily_df),
-                "basarili": len(daily_df[daily_df['Durum'] == 'Başarılı']),
-                "basarisiz": len(daily_df[daily_df['Durum'] == 'Başarısız']),
-                "60_gun": len(daily_df[daily_df['Hatırlatma Tipi'] == '60_gun']),
-                "30_gun": len(daily_df[daily_df['Hatırlatma Tipi'] == '30_gun']),
-                "1_gun": len(daily_df[daily_df['Hatırlatma Tipi'] == '1_gun']),
-                "benzersiz_yonetici": daily_df['Yönetici Mail'].nunique()
+                "success": True,
+                "records": [dict(zip(REPORT_HEADINGS, row)) for row in rows],
+                "next_cursor": next_cursor
             }
             
         except Exception as e:
-            logger.error(f"❌ İstatistik hesaplama hatası: {str(e)}")
-            return {}
+            logger.error(f"❌ Geçmiş sorgu hatası: {str(e)}")
+            return {
+                "success": False,
+                "records": [],
+                "next_cursor": None,
+                "error": str(e)
+            }
+    
+    def iter_history(self, start: datetime = None, end: datetime = None, batch_size: int = 1000, **filters):
+        """
+        query_history ile aynı filtrelerle tüm sonuçları akış halinde döndür
+        
+        Yields:
+            dict: Rapor başlıklarıyla tek kayıt
+        """
+        rows = self.store.iter_query(
+            batch_size=batch_size,
+            start_day=start.strftime("%Y-%m-%d") if start else None,
+            end_day=end.strftime("%Y-%m-%d") if end else None,
+            **filters
+        )
+        for row in rows:
+            yield dict(zip(REPORT_HEADINGS, row))
     
     def get_failed_reports(self, limit: int = 10) -> list:
         """
@@ -266,29 +643,40 @@ class ReportManager:
             list: Başarısız kayıtlar
         """
         try:
-            failed_df = self.df[self.df['Durum'] == 'Başarısız'].tail(limit)
-            return failed_df.to_dict('records')
+            rows = self.store.latest_rows('Başarısız', limit)
+            return [dict(zip(REPORT_HEADINGS, row)) for row in rows]
             
         except Exception as e:
             logger.error(f"❌ Başarısız rapor listeleme hatası: {str(e)}")
             return []
     
     def backup_report(self) -> bool:
-        """Rapor dosyasının yedeğini al"""
+        """
+        Rapor store'unun yedeğini al
+        
+        Aktif bölümler ve özet veritabanı tutarlı bir kopyaya alınıp arşiv
+        dosyalarıyla birlikte BackupStore'a eklenir; değişmemiş dosyalar
+        tekrar saklanmaz.
+        """
         try:
-            backup_dir = Path("data/backups")
-            backup_dir.mkdir(parents=True, exist_ok=True)
-            
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            backup_path = backup_dir / f"mail_raporu_backup_{timestamp}.xlsx"
-            
-            if self.report_file.exists():
-                import shutil
-                shutil.copy2(self.report_file, backup_path)
-                logger.info(f"✅ Rapor backup oluşturuldu: {backup_path}")
-                return True
-            
-            return False
+            import tempfile
+            from backup_store import BackupStore
+
+            backup_store = BackupStore()
+            backup_store.root.mkdir(parents=True, exist_ok=True)
+            with tempfile.TemporaryDirectory(dir=backup_store.root) as tmp_dir:
+                files = {path.name: path for path in self.store.backup_to(tmp_dir)}
+                if self.store.archive_dir.exists():
+                    for path in self.store.archive_dir.glob("*.db.gz"):
+                        files[f"arsiv/{path.name}"] = path
+                result = backup_store.snapshot("mail_raporu", files)
+
+            if result["skipped"]:
+                logger.info(f"ℹ️  Rapor değişmemiş, backup atlandı ({result['snapshot_id']})")
+            else:
+                logger.info(f"✅ Rapor backup oluşturuldu: {result['snapshot_id']} "
+                            f"({result['new_objects']} yeni dosya, {result['new_bytes'] / 1024:.1f} KB)")
+            return True
             
         except Exception as e:
             logger.error(f"❌ Rapor backup hatası: {str(e)}")
@@ -297,6 +685,8 @@ class ReportManager:
 
 if __name__ == "__main__":
     # Test
+    from log_config import setup_logging
+    setup_logging(log_file="")
     report_manager = ReportManager()
     
     # Test entry
@@ -321,9 +711,15 @@ if __name__ == "__main__":
     result = report_manager.add_entry(test_result, test_reminder)
     print(f"\n{'✅' if result else '❌'} Test entry eklendi")
     
+    # Excel raporunu üret
+    report_manager.export_excel()
+    
     # İstatistikleri göster
     stats = report_manager.get_daily_statistics()
     print(f"\n📊 Bugünkü İstatistikler:")
     print(f"  Toplam: {stats.get('toplam_gonderim', 0)}")
     print(f"  Başarılı: {stats.get('basarili', 0)}")
     print(f"  Başarısız: {stats.get('basarisiz', 0)}")
+    
+    monthly = report_manager.get_monthly_statistics()
+    print(f"\n📅 Bu Ay ({monthly.get('ay')}): {monthly.get('toplam_gonderim', 0)} gönderim")
@@ -0,0 +1,643 @@
+"""
+Report Store Module
+Gönderim geçmişini aylık bölümlenmiş (partition) append-only SQLite dosyalarında tutar.
+Excel raporu bu kayıtlardan türetilen bir çıktıdır.
+
+Dizin yapısı:
+    data/mail_raporu/
+    ├── ozet.db              # Günlük özet tabloları (her zaman açık, küçük)
+    ├── 2026-10.db           # Aktif aylık bölümler
+    ├── arsiv/2026-05.db.gz  # Sıkıştırılmış eski bölümler
+    └── .cache/              # Sorgu için açılmış arşiv bölümleri
+
+Her eklemede (gün, hatırlatma tipi, durum) anahtarlı özet tablosu aynı
+transaction içinde güncellenir; istatistik sorguları yalnızca özetleri okur.
+Başlangıçta yalnızca içinde bulunulan ayın bölümü açılır, eski bölümler
+bir sorgu onları kapsadığında açılır.
+
+Her bölümde ihale no, yönetici mail, gönderim tarihi ve durum indeksleri
+bulunur; query() tarih aralığına göre bölümleri eler ve sonuçları
+sayfalı (keyset cursor) döndürür.
+
+read_only=True ile açılan store (ör. sorgu servisi) dosyalara yalnızca
+SQLite'ın mode=ro URI'si ile bağlanır; şema ve bölüm oluşturmaz, arşivlemez.
+"""
+
+import sqlite3
+import threading
+import gzip
+import shutil
+from datetime import datetime, date, time
+from pathlib import Path
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+# (SQLite sütunu, rapor başlığı)
+REPORT_COLUMNS = [
+    ("gonderim_tarihi", "Gönderim Tarihi"),
+    ("gonderim_saati", "Gönderim Saati"),
+    ("ihale_no", "İhale No"),
+    ("ihale_adi", "İhale Adı"),
+    ("yonetici", "Yönetici"),
+    ("yonetici_mail", "Yönetici Mail"),
+    ("hatirlatma_tipi", "Hatırlatma Tipi"),
+    ("kalan_gun", "Kalan Gün"),
+    ("baslangic_tarihi", "Başlangıç Tarihi"),
+    ("durum", "Durum"),
+    ("hata_mesaji", "Hata Mesajı"),
+    ("retry_sayisi", "Retry Sayısı"),
+]
+
+REPORT_HEADINGS = [heading for _, heading in REPORT_COLUMNS]
+
+# DataFrame şeması: düşük kardinaliteli sütunlar kategorik, tarih ve saat
+# sütunları gerçek tarih tipinde, sayılar 32 bit
+REPORT_CATEGORICAL_COLUMNS = ["Yönetici", "Yönetici Mail", "Hatırlatma Tipi", "Durum"]
+REPORT_DATE_COLUMNS = ["Gönderim Tarihi", "Başlangıç Tarihi"]
+REPORT_TIME_COLUMNS = ["Gönderim Saati"]
+REPORT_INT_COLUMNS = ["İhale No", "Kalan Gün", "Retry Sayısı"]
+
+DTYPE_BACKENDS = ("numpy", "pyarrow")
+
+_COLUMN_INDEX = {name: i for i, (name, _) in enumerate(REPORT_COLUMNS)}
+
+_COLUMN_TYPES = {
+    "ihale_no": "INTEGER",
+    "kalan_gun": "INTEGER",
+    "retry_sayisi": "INTEGER",
+}
+
+_COLUMN_NAMES = ", ".join(name for name, _ in REPORT_COLUMNS)
+
+_INDEXES = {
+    "rapor_ihale_no": "ihale_no",
+    "rapor_mail_tarih": "yonetici_mail, gonderim_tarihi",
+    "rapor_tarih": "gonderim_tarihi",
+    "rapor_durum_tarih": "durum, gonderim_tarihi",
+}
+
+# query() eşitlik filtreleri: parametre adı -> sütun
+_EQUALITY_FILTERS = {
+    "ihale_no": "ihale_no",
+    "yonetici_mail": "yonetici_mail",
+    "durum": "durum",
+    "hatirlatma_tipi": "hatirlatma_tipi",
+}
+
+
+def month_of(day: str) -> str:
+    """'YYYY-MM-DD' -> 'YYYY-MM'"""
+    return day[:7]
+
+
+def _months_between(older: str, newer: str) -> int:
+    return (int(newer[:4]) - int(older[:4])) * 12 + int(newer[5:7]) - int(older[5:7])
+
+
+class ReportStore:
+    """Aylık bölümlenmiş append-only gönderim kaydı (SQLite)"""
+
+    def __init__(self, store_dir: str = "data/mail_raporu", archive_after_months: int = 3,
+                 read_only: bool = False):
+        """
+        Args:
+            store_dir: Store klasörü
+            archive_after_months: Bu kadar aydan eski bölümler arşivlenir
+            read_only: Yalnızca okuma (store yoksa FileNotFoundError)
+        """
+        self.store_dir = Path(store_dir)
+        self.archive_dir = self.store_dir / "arsiv"
+        self.cache_dir = self.store_dir / ".cache"
+        self.archive_after_months = archive_after_months
+        self.read_only = read_only
+        self.current_month = datetime.now().strftime("%Y-%m")
+
+        self._lock = threading.RLock()
+        self._partitions = {}
+
+        if read_only:
+            summary_path = self.store_dir / "ozet.db"
+            if not summary_path.exists():
+                raise FileNotFoundError(f"Rapor store'u bulunamadı: {self.store_dir}")
+            self._summary = _connect_read_only(summary_path)
+            return
+
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        self._summary = sqlite3.connect(
+            str(self.store_dir / "ozet.db"), check_same_thread=False, timeout=30
+        )
+        self._create_summary_schema()
+
+        # Yalnızca içinde bulunulan ayın bölümünü aç
+        self._partition(self.current_month, writable=True)
+
+    # ------------------------------------------------------------------
+    # Şema ve bölüm yönetimi
+    # ------------------------------------------------------------------
+
+    def _create_summary_schema(self):
+        with self._lock, self._summary:
+            self._summary.execute("""
+                CREATE TABLE IF NOT EXISTS gunluk_ozet (
+                    gun TEXT NOT NULL,
+                    hatirlatma_tipi TEXT NOT NULL,
+                    durum TEXT NOT NULL,
+                    adet INTEGER NOT NULL,
+                    PRIMARY KEY (gun, hatirlatma_tipi, durum)
+                ) WITHOUT ROWID
+            """)
+            self._summary.execute("""
+                CREATE TABLE IF NOT EXISTS gunluk_alici (
+                    gun TEXT NOT NULL,
+                    yonetici_mail TEXT NOT NULL,
+                    PRIMARY KEY (gun, yonetici_mail)
+                ) WITHOUT ROWID
+            """)
+
+    @staticmethod
+    def _create_partition_schema(conn: sqlite3.Connection):
+        columns = ",\n                ".join(
+            f"{name} {_COLUMN_TYPES.get(name, 'TEXT')}" for name, _ in REPORT_COLUMNS
+        )
+        with conn:
+            conn.execute(f"""
+                CREATE TABLE IF NOT EXISTS rapor (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    {columns}
+                )
+            """)
+            for index_name, index_columns in _INDEXES.items():
+                conn.execute(f"CREATE INDEX IF NOT EXISTS {index_name} ON rapor ({index_columns})")
+
+    def _live_path(self, month: str) -> Path:
+        return self.store_dir / f"{month}.db"
+
+    def _archive_path(self, month: str) -> Path:
+        return self.archive_dir / f"{month}.db.gz"
+
+    def months(self) -> list:
+        """Tüm bölümlerin ayları (aktif + arşiv), eskiden yeniye"""
+        months = {p.stem for p in self.store_dir.glob("????-??.db")}
+        if self.archive_dir.exists():
+            months.update(p.name[:7] for p in self.archive_dir.glob("????-??.db.gz"))
+        return sorted(months)
+
+    def live_months(self) -> list:
+        """Arşivlenmemiş bölümlerin ayları"""
+        return sorted(p.stem for p in self.store_dir.glob("????-??.db"))
+
+    def _partition(self, month: str, writable: bool = False) -> sqlite3.Connection:
+        """
+        Bölüm bağlantısını aç (gerekirse arşivden çıkar)
+
+        Yazma için arşivlenmiş bölüm tekrar aktif hale getirilir; okuma için
+        .cache altına açılır ve yazılmaz.
+        """
+        with self._lock:
+            conn = self._partitions.get(month)
+            if conn is not None and (not writable or not getattr(conn, "_read_only", False)):
+                return conn
+
+            live_path = self._live_path(month)
+            archive_path = self._archive_path(month)
+
+            if self.read_only:
+                if writable:
+                    raise sqlite3.OperationalError("Rapor store'u salt okunur açıldı")
+                if not live_path.exists() and archive_path.exists():
+                    live_path = self._extract_archive(month, archive_path)
+                conn = _connect_read_only(live_path, factory=_ReportConnection)
+                conn._read_only = True
+                self._partitions[month] = conn
+                return conn
+
+            if conn is not None:
+                # Salt okunur önbellek bağlantısını yazılabilir bölümle değiştir
+                conn.close()
+                del self._partitions[month]
+
+            if not live_path.exists() and archive_path.exists():
+                target = live_path if writable else self.cache_dir / f"{month}.db"
+                if not target.exists():
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    with gzip.open(archive_path, "rb") as src, open(target, "wb") as dst:
+                        shutil.copyfileobj(src, dst)
+                if writable:
+                    archive_path.unlink()
+                    (self.cache_dir / f"{month}.db").unlink(missing_ok=True)
+                    logger.info(f"📦 Arşiv bölümü tekrar aktif edildi: {month}")
+                else:
+                    # Önbellek kopyası bize ait, eksik indeksler burada oluşturulabilir
+                    conn = sqlite3.connect(
+                        str(target), check_same_thread=False, timeout=30, factory=_ReportConnection
+                    )
+                    self._create_partition_schema(conn)
+                    conn._read_only = True
+                    self._partitions[month] = conn
+                    return conn
+
+            conn = sqlite3.connect(
+                str(live_path), check_same_thread=False, timeout=30, factory=_ReportConnection
+            )
+            self._create_partition_schema(conn)
+            conn.execute("ATTACH DATABASE ? AS ozet", (str(self.store_dir / "ozet.db"),))
+            self._partitions[month] = conn
+            return conn
+
+    def _extract_archive(self, month: str, archive_path: Path) -> Path:
+        """Arşiv bölümünü .cache altına aç (salt okunur okuma için; canlı dosyalara dokunmaz)"""
+        target = self.cache_dir / f"{month}.db"
+        if not target.exists():
+            target.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = target.with_name(f"{target.name}.{threading.get_ident()}.tmp")
+            with gzip.open(archive_path, "rb") as src, open(tmp_file, "wb") as dst:
+                shutil.copyfileobj(src, dst)
+            tmp_file.replace(target)
+        return target
+
+    def archive_old_partitions(self, reference_month: str = None) -> list:
+        """
+        archive_after_months'tan eski bölümleri sıkıştırıp arşive taşı
+
+        Returns:
+            list: Arşivlenen aylar
+        """
+        if self.read_only:
+            return []
+        reference_month = reference_month or self.current_month
+        archived = []
+
+        for month in self.live_months():
+            if month == self.current_month:
+                continue
+            if _months_between(month, reference_month) < self.archive_after_months:
+                continue
+
+            with self._lock:
+                conn = self._partitions.pop(month, None)
+                if conn is not None:
+                    conn.close()
+
+                live_path = self._live_path(month)
+                compact = sqlite3.connect(str(live_path))
+                compact.execute("VACUUM")
+                compact.close()
+
+                self.archive_dir.mkdir(parents=True, exist_ok=True)
+                tmp_path = self._archive_path(month).with_suffix(".tmp")
+                with open(live_path, "rb") as src, gzip.open(tmp_path, "wb", compresslevel=9) as dst:
+                    shutil.copyfileobj(src, dst)
+                tmp_path.replace(self._archive_path(month))
+                live_path.unlink()
+                archived.append(month)
+
+        if archived:
+            logger.info(f"📦 {len(archived)} rapor bölümü arşivlendi: {', '.join(archived)}")
+        return archived
+
+    # ------------------------------------------------------------------
+    # Yazma
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _to_row(entry: dict) -> tuple:
+        """Rapor başlıklarıyla gelen kaydı tablo satırına çevir"""
+        row = []
+        for _, heading in REPORT_COLUMNS:
+            value = entry.get(heading)
+            # pandas NaN değerlerini NULL olarak sakla
+            if isinstance(value, float) and value != value:
+                value = None
+            elif isinstance(value, time):
+                value = value.strftime("%H:%M:%S")
+            elif isinstance(value, date):
+                value = value.strftime("%Y-%m-%d")
+            row.append(value)
+        return tuple(row)
+
+    def append(self, entry: dict):
+        """Tek kayıt ekle"""
+        self.append_many([entry])
+
+    def append_many(self, entries: list) -> int:
+        """Kayıtları ait oldukları aylık bölümlere ekle (her bölüm için tek transaction)"""
+        by_month = {}
+        day_idx = _COLUMN_INDEX["gonderim_tarihi"]
+        for entry in entries:
+            row = self._to_row(entry)
+            month = month_of(row[day_idx]) if row[day_idx] else self.current_month
+            by_month.setdefault(month, []).append(row)
+
+        for month, rows in by_month.items():
+            self._append_to_partition(month, rows)
+
+        return sum(len(rows) for rows in by_month.values())
+
+    def _append_to_partition(self, month: str, rows: list):
+        # Özet artışlarını hesapla
+        rollup_deltas = {}
+        recipients = set()
+        day_idx, tipi_idx, durum_idx, mail_idx = (
+            _COLUMN_INDEX["gonderim_tarihi"], _COLUMN_INDEX["hatirlatma_tipi"],
+            _COLUMN_INDEX["durum"], _COLUMN_INDEX["yonetici_mail"]
+        )
+        for row in rows:
+            if row[day_idx] is None:
+                continue
+            key = (row[day_idx], row[tipi_idx] or "", row[durum_idx] or "")
+            rollup_deltas[key] = rollup_deltas.get(key, 0) + 1
+            if row[mail_idx] is not None:
+                recipients.add((row[day_idx], row[mail_idx]))
+
+        placeholders = ", ".join("?" for _ in REPORT_COLUMNS)
+        with self._lock:
+            conn = self._partition(month, writable=True)
+            # Bölüm ve özet (ATTACH) aynı transaction içinde güncellenir
+            with conn:
+                conn.executemany(f"INSERT INTO rapor ({_COLUMN_NAMES}) VALUES ({placeholders})", rows)
+                conn.executemany(
+                    """
+                    INSERT INTO ozet.gunluk_ozet (gun, hatirlatma_tipi, durum, adet) VALUES (?, ?, ?, ?)
+                    ON CONFLICT (gun, hatirlatma_tipi, durum) DO UPDATE SET adet = adet + excluded.adet
+                    """,
+                    [key + (count,) for key, count in rollup_deltas.items()]
+                )
+                conn.executemany(
+                    "INSERT OR IGNORE INTO ozet.gunluk_alici (gun, yonetici_mail) VALUES (?, ?)",
+                    list(recipients)
+                )
+
+    def import_legacy_db(self, db_file) -> int:
+        """Tek dosyalık eski rapor veritabanındaki kayıtları bölümlere aktar"""
+        legacy = sqlite3.connect(str(db_file))
+        try:
+            imported = 0
+            cursor = legacy.execute(f"SELECT {_COLUMN_NAMES} FROM rapor ORDER BY id")
+            while True:
+                batch = cursor.fetchmany(5000)
+                if not batch:
+                    break
+                imported += self.append_many([dict(zip(REPORT_HEADINGS, row)) for row in batch])
+            return imported
+        finally:
+            legacy.close()
+
+    # ------------------------------------------------------------------
+    # Okuma
+    # ------------------------------------------------------------------
+
+    def rollup_range(self, start_day: str, end_day: str) -> list:
+        """
+        Tarih aralığındaki özet satırlarını döndür
+
+        Args:
+            start_day, end_day: "YYYY-MM-DD" (ikisi de dahil)
+
+        Returns:
+            list: (gun, hatirlatma_tipi, durum, adet) satırları
+        """
+        with self._lock:
+            return self._summary.execute(
+                """
+                SELECT gun, hatirlatma_tipi, durum, adet FROM gunluk_ozet
+                WHERE gun BETWEEN ? AND ? ORDER BY gun
+                """,
+                (start_day, end_day)
+            ).fetchall()
+
+    def month_counts(self) -> dict:
+        """Özet tablosundan ay başına kayıt sayısı ("YYYY-MM" -> adet), bölüm açmadan"""
+        with self._lock:
+            return dict(self._summary.execute(
+                "SELECT substr(gun, 1, 7), SUM(adet) FROM gunluk_ozet GROUP BY substr(gun, 1, 7)"
+            ).fetchall())
+
+    def unique_recipients(self, start_day: str, end_day: str) -> int:
+        """Tarih aralığında mail alan farklı yönetici sayısı"""
+        with self._lock:
+            return self._summary.execute(
+                """
+                SELECT COUNT(DISTINCT yonetici_mail) FROM gunluk_alici
+                WHERE gun BETWEEN ? AND ?
+                """,
+                (start_day, end_day)
+            ).fetchone()[0]
+
+    def count(self) -> int:
+        """Toplam kayıt sayısı (özet tablosundan, bölümler açılmadan)"""
+        with self._lock:
+            return self._summary.execute("SELECT COALESCE(SUM(adet), 0) FROM gunluk_ozet").fetchone()[0]
+
+    def iter_rows(self, start_month: str = None, end_month: str = None, batch_size: int = 5000):
+        """
+        Kayıtları ay ve eklenme sırasıyla (rapor sütun sırasında) döndür
+
+        Args:
+            start_month, end_month: "YYYY-MM" aralığı (None ise sınırsız)
+        """
+        for month in self.months():
+            if start_month and month < start_month:
+                continue
+            if end_month and month > end_month:
+                continue
+
+            last_id = 0
+            while True:
+                with self._lock:
+                    batch = self._partition(month).execute(
+                        f"SELECT id, {_COLUMN_NAMES} FROM rapor WHERE id > ? ORDER BY id LIMIT ?",
+                        (last_id, batch_size)
+                    ).fetchall()
+                if not batch:
+                    break
+                last_id = batch[-1][0]
+                for row in batch:
+                    yield row[1:]
+
+    def latest_rows(self, durum: str, limit: int) -> list:
+        """Verilen durumdaki en son kayıtlar (yeniden eskiye bölüm bölüm, eskiden yeniye döner)"""
+        collected = []
+        for month in reversed(self.months()):
+            remaining = limit - len(collected)
+            if remaining <= 0:
+                break
+            with self._lock:
+                rows = self._partition(month).execute(
+                    f"SELECT {_COLUMN_NAMES} FROM rapor WHERE durum = ? ORDER BY id DESC LIMIT ?",
+                    (durum, remaining)
+                ).fetchall()
+            collected.extend(rows)
+        return list(reversed(collected))
+
+    def query(self, ihale_no: int = None, yonetici_mail: str = None, durum: str = None,
+              hatirlatma_tipi: str = None, start_day: str = None, end_day: str = None,
+              limit: int = 100, cursor: str = None) -> tuple:
+        """
+        İndeksli geçmiş sorgusu (eşitlik + tarih aralığı filtreleri)
+
+        Sonuçlar ay ve eklenme sırasıyla döner. Tarih aralığı verilirse yalnızca
+        aralığa giren bölümler açılır.
+
+        Args:
+            ihale_no, yonetici_mail, durum, hatirlatma_tipi: Eşitlik filtreleri
+            start_day, end_day: "YYYY-MM-DD" aralığı (ikisi de dahil)
+            limit: Sayfa boyutu
+            cursor: Önceki sayfanın next_cursor değeri
+
+        Returns:
+            tuple: (satırlar, next_cursor) - son sayfada next_cursor None olur
+        """
+        filters = {
+            "ihale_no": ihale_no, "yonetici_mail": yonetici_mail,
+            "durum": durum, "hatirlatma_tipi": hatirlatma_tipi
+        }
+        where = []
+        params = []
+        for key, value in filters.items():
+            if value is not None:
+                where.append(f"{_EQUALITY_FILTERS[key]} = ?")
+                params.append(value)
+        if start_day:
+            where.append("gonderim_tarihi >= ?")
+            params.append(start_day)
+        if end_day:
+            where.append("gonderim_tarihi <= ?")
+            params.append(end_day)
+
+        cursor_month, cursor_id = None, 0
+        if cursor:
+            cursor_month, cursor_id = cursor.split(":")
+            cursor_id = int(cursor_id)
+
+        start_month = month_of(start_day) if start_day else None
+        end_month = month_of(end_day) if end_day else None
+
+        rows = []
+        last_position = None
+        for month in self.months():
+            if start_month and month < start_month or end_month and month > end_month:
+                continue
+            if cursor_month and month < cursor_month:
+                continue
+
+            after_id = cursor_id if month == cursor_month else 0
+            clauses = where + ["id > ?"]
+            sql = (
+                f"SELECT id, {_COLUMN_NAMES} FROM rapor WHERE {' AND '.join(clauses)} "
+                f"ORDER BY id LIMIT ?"
+            )
+            with self._lock:
+                batch = self._partition(month).execute(
+                    sql, params + [after_id, limit - len(rows)]
+                ).fetchall()
+
+            rows.extend(row[1:] for row in batch)
+            if batch:
+                last_position = f"{month}:{batch[-1][0]}"
+            if len(rows) >= limit:
+                return rows, last_position
+
+        return rows, None
+
+    def iter_query(self, batch_size: int = 1000, **filters):
+        """query() sonuçlarını sayfa sayfa okuyarak akış halinde döndür"""
+        cursor = None
+        while True:
+            rows, cursor = self.query(limit=batch_size, cursor=cursor, **filters)
+            yield from rows
+            if cursor is None:
+                return
+
+    def to_dataframe(self, start_month: str = None, end_month: str = None, dtype_backend: str = "numpy"):
+        """Kayıtları rapor başlıklarıyla tipli DataFrame olarak döndür (bkz. build_report_frame)"""
+        return build_report_frame(self.iter_rows(start_month, end_month), dtype_backend)
+
+    def backup_to(self, target_dir) -> list:
+        """Aktif bölümleri ve özet veritabanını tutarlı şekilde yedekle (arşiv dosyaları değişmez)"""
+        target_dir = Path(target_dir)
+        target_dir.mkdir(parents=True, exist_ok=True)
+        copied = []
+        with self._lock:
+            sources = [("ozet", self._summary)]
+            sources += [(month, self._partition(month)) for month in self.live_months()]
+            for name, conn in sources:
+                dest = sqlite3.connect(str(target_dir / f"{name}.db"))
+                conn.backup(dest)
+                dest.close()
+                copied.append(target_dir / f"{name}.db")
+        return copied
+
+    def close(self):
+        with self._lock:
+            for conn in self._partitions.values():
+                conn.close()
+            self._partitions.clear()
+            self._summary.close()
+
+
+def resolve_dtype_backend(dtype_backend: str) -> str:
+    """İstenen dtype backend'i kullanılabilir olana indir (pyarrow yoksa numpy)"""
+    if dtype_backend not in DTYPE_BACKENDS:
+        raise ValueError(f"Geçersiz dtype backend: {dtype_backend} (seçenekler: {', '.join(DTYPE_BACKENDS)})")
+    if dtype_backend == "pyarrow":
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            logger.warning("⚠️  pyarrow yüklü değil, numpy dtype'ları kullanılıyor")
+            return "numpy"
+    return dtype_backend
+
+
+def build_report_frame(rows, dtype_backend: str = "numpy"):
+    """
+    Rapor satırlarından tipli DataFrame oluştur
+
+    Sütunlar satır listesi yerine tek tek tipine çevrilerek kurulur, böylece
+    object tipli ara DataFrame oluşmaz:
+        - Yönetici, Yönetici Mail, Hatırlatma Tipi, Durum: category
+        - Gönderim Tarihi, Başlangıç Tarihi: datetime64 (gün)
+        - Gönderim Saati: timedelta64 (gün içi süre)
+        - İhale No, Kalan Gün, Retry Sayısı: Int32 (pyarrow'da int32[pyarrow])
+        - İhale Adı, Hata Mesajı: object (pyarrow'da string[pyarrow])
+
+    Args:
+        rows: REPORT_HEADINGS sırasında satırlar
+        dtype_backend: "numpy" veya "pyarrow" (pyarrow yüklü değilse numpy)
+    """
+    import pandas as pd
+
+    dtype_backend = resolve_dtype_backend(dtype_backend)
+    int_dtype = "int32[pyarrow]" if dtype_backend == "pyarrow" else "Int32"
+    text_dtype = "string[pyarrow]" if dtype_backend == "pyarrow" else object
+
+    columns = list(zip(*rows)) or [()] * len(REPORT_HEADINGS)
+    data = {}
+    for heading, values in zip(REPORT_HEADINGS, columns):
+        if heading in REPORT_CATEGORICAL_COLUMNS:
+            data[heading] = pd.Categorical(values)
+        elif heading in REPORT_DATE_COLUMNS:
+            data[heading] = pd.to_datetime(pd.Series(values, dtype=object), format="%Y-%m-%d", errors="coerce")
+        elif heading in REPORT_TIME_COLUMNS:
+            # to_timedelta metin ayrıştırmada çok yavaş; sabit formatla gün başına göre fark alınır
+            times = pd.to_datetime(pd.Series(values, dtype=object), format="%H:%M:%S", errors="coerce")
+            data[heading] = times - pd.Timestamp("1900-01-01")
+        elif heading in REPORT_INT_COLUMNS:
+            data[heading] = pd.to_numeric(pd.Series(values, dtype=object), errors="coerce").astype(int_dtype)
+        else:
+            data[heading] = pd.Series(values, dtype=text_dtype)
+    return pd.DataFrame(data)
+
+
+def _connect_read_only(path: Path, factory=sqlite3.Connection) -> sqlite3.Connection:
+    """Dosyaya salt okunur bağlan (dosya yoksa oluşturulmaz)"""
+    return sqlite3.connect(
+        f"{Path(path).resolve().as_uri()}?mode=ro", uri=True,
+        check_same_thread=False, timeout=30, factory=factory
+    )
+
+
+class _ReportConnection(sqlite3.Connection):
+    """Salt okunur işaretlenebilen bölüm bağlantısı"""
+    _read_only = False
@@ -7,10 +7,13 @@ from datetime import datetime, timedelta
 import pytz
 import logging
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+# (kalan gün, hatırlatma tipi)
+REMINDER_OFFSETS = [(60, "60_gun"), (30, "30_gun"), (1, "1_gun")]
+
+
 class Scheduler:
     """Hatırlatma zamanlama sınıfı"""
     
@@ -45,45 +48,7 @@ class Scheduler:
             logger.info(f"🔍 {len(ihale_list)} ihale kontrol ediliyor...")
             
             for ihale in ihale_list:
-                ihale_no = ihale["ihale_no"]
-                ihale_adi = ihale["ihale_adi"]
-                baslangic_tarihi = ihale["baslangic_tarihi"].date()
-                hatirlatma_durumu = ihale["hatirlatma_durumu"]
-                
-                # Kalan gün hesapla
-                kalan_gun = (baslangic_tarihi - self.today).days
-                
-                # Geçmiş tarih kontrolü
-                if kalan_gun < 0:
-                    statistics["gecmis_tarihli_ihale"] += 1
-                    warnings.append(f"İhale {ihale_no} ({ihale_adi}): Başlangıç tarihi geçmişte ({baslangic_tarihi})")
-                    continue
-                
-                # Bugün başlangıç tarihi ise acil hatırlatma
-                if kalan_gun == 0:
-                    warnings.append(f"İhale {ihale_no} ({ihale_adi}): Bugün başlangıç tarihi!")
-                    continue
-                
-                # Hatırlatma kontrollerini yap
-                reminders = self._check_reminder_dates(
-                    ihale, 
-                    baslangic_tarihi, 
-                    kalan_gun, 
-                    hatirlatma_durumu
-                )
-                
-                # Her bir hatırlatmayı ekle
-                for reminder in reminders:
-                    reminders_to_send.append(reminder)
-                    
-                    # İstatistikleri güncelle
-                    reminder_type = reminder["hatirlatma_tipi"]
-                    if reminder_type == "60_gun":
-                        statistics["60_gun_hatirlatma"] += 1
-                    elif reminder_type == "30_gun":
-                        statistics["30_gun_hatirlatma"] += 1
-                    elif reminder_type == "1_gun":
-                        statistics["1_gun_hatirlatma"] += 1
+                reminders_to_send.extend(self._reminders_for_ihale(ihale, statistics, warnings))
             
             # Hatırlatmaları önceliklere göre sırala (1 gün en yüksek öncelik)
             reminders_to_send = self._prioritize_reminders(reminders_to_send)
@@ -120,6 +85,76 @@ class Scheduler:
                 "errors": [f"Zamanlama hatası: {str(e)}"]
             }
     
+    def iter_reminders(self, ihale_iter, statistics: dict = None, warnings: list = None):
+        """
+        İhaleler geldikçe bugün gönderilecek hatırlatmaları üret (akış modu)
+        
+        calculate_reminders ile aynı kuralları uygular, ancak tüm listeyi
+        beklemez ve öncelik sıralaması yapmaz; hatırlatmalar takvim sırasıyla döner.
+        
+        Args:
+            ihale_iter: İhale dictionary'leri üreten iterable
+            statistics: Sayaçların güncelleneceği dict (opsiyonel)
+            warnings: Uyarıların ekleneceği liste (opsiyonel)
+            
+        Yields:
+            dict: Hatırlatma
+        """
+        if statistics is None:
+            statistics = {}
+        for key in ("toplam_ihale", "gonderilecek_hatirlatma", "60_gun_hatirlatma",
+                    "30_gun_hatirlatma", "1_gun_hatirlatma", "gecmis_tarihli_ihale"):
+            statistics.setdefault(key, 0)
+        statistics.setdefault("bugun_tarihi", self.today)
+        warnings = warnings if warnings is not None else []
+        
+        for ihale in ihale_iter:
+            statistics["toplam_ihale"] += 1
+            for reminder in self._reminders_for_ihale(ihale, statistics, warnings):
+                statistics["gonderilecek_hatirlatma"] += 1
+                yield reminder
+    
+    def _reminders_for_ihale(self, ihale: dict, statistics: dict, warnings: list) -> list:
+        """Tek bir ihale için bugünün hatırlatmalarını hesapla ve sayaçları güncelle"""
+        ihale_no = ihale["ihale_no"]
+        ihale_adi = ihale["ihale_adi"]
+        baslangic_tarihi = ihale["baslangic_tarihi"].date()
+        hatirlatma_durumu = ihale["hatirlatma_durumu"]
+        
+        # Kalan gün hesapla
+        kalan_gun = (baslangic_tarihi - self.today).days
+        
+        # Geçmiş tarih kontrolü
+        if kalan_gun < 0:
+            statistics["gecmis_tarihli_ihale"] += 1
+            warnings.append(f"İhale {ihale_no} ({ihale_adi}): Başlangıç tarihi geçmişte ({baslangic_tarihi})")
+            return []
+        
+        # Bugün başlangıç tarihi ise acil hatırlatma
+        if kalan_gun == 0:
+            warnings.append(f"İhale {ihale_no} ({ihale_adi}): Bugün başlangıç tarihi!")
+            return []
+        
+        # Hatırlatma kontrollerini yap
+        reminders = self._check_reminder_dates(
+            ihale, 
+            baslangic_tarihi, 
+            kalan_gun, 
+            hatirlatma_durumu
+        )
+        
+        # İstatistikleri güncelle
+        for reminder in reminders:
+            reminder_type = reminder["hatirlatma_tipi"]
+            if reminder_type == "60_gun":
+                statistics["60_gun_hatirlatma"] += 1
+            elif reminder_type == "30_gun":
+                statistics["30_gun_hatirlatma"] += 1
+            elif reminder_type == "1_gun":
+                statistics["1_gun_hatirlatma"] += 1
+        
+        return reminders
+    
     def _check_reminder_dates(self, ihale: dict, baslangic_tarihi, kalan_gun: int, hatirlatma_durumu: str) -> list:
         """
         Bir ihale için hangi hatırlatmaların gönderilmesi gerektiğini kontrol et
@@ -165,15 +200,39 @@ class Scheduler:
             for part in parts:
                 if ":" in part:
                     reminder_type = part.split(":")[0].strip()
-                    # "60gün" -> "60_gun" formatına çevir
-                    if "gün" in reminder_type or "gun" in reminder_type:
-                        reminder_type = reminder_type.replace("gün", "_gun").replace("gun", "_gun")
+                    # "60gün" -> "60_gun" formatına çevir ("60_gun" olduğu gibi kalır)
+                    reminder_type = reminder_type.replace("gün", "gun")
+                    if "_gun" not in reminder_type:
+                        reminder_type = reminder_type.replace("gun", "_gun")
                     sent_types.append(reminder_type)
         except:
             pass
         
         return sent_types
     
+    def next_due_date(self, ihale_list: list):
+        """
+        Bugünden sonraki ilk hatırlatma tarihini bul
+        
+        Daha önce gönderilmiş hatırlatma tipleri hariç tutulur.
+        
+        Returns:
+            date: Sonraki hatırlatma tarihi (yoksa None)
+        """
+        next_due = None
+        for ihale in ihale_list:
+            baslangic_tarihi = ihale["baslangic_tarihi"].date()
+            sent_reminders = self._parse_hatirlatma_durumu(ihale["hatirlatma_durumu"])
+            
+            for gun, hatirlatma_tipi in REMINDER_OFFSETS:
+                due = baslangic_tarihi - timedelta(days=gun)
+                if due <= self.today or hatirlatma_tipi in sent_reminders:
+                    continue
+                if next_due is None or due < next_due:
+                    next_due = due
+        
+        return next_due
+    
     def _create_reminder(self, ihale: dict, kalan_gun: int, hatirlatma_tipi: str, oncelik: str) -> dict:
         """Hatırlatma dictionary'si oluştur"""
         return {
@@ -199,6 +258,8 @@ class Scheduler:
 
 if __name__ == "__main__":
     # Test
+    from log_config import setup_logging
+    setup_logging(log_file="")
     from file_handler import FileHandler
     
     # Dosyayı oku
@@ -0,0 +1,351 @@
+"""
+Sender Pool Module
+Birden fazla gönderici hesabını yönetir: hesap başına bağlantı havuzu,
+rate limit ve alıcıya göre consistent hashing ile hesap seçimi.
+"""
+
+import hashlib
+import bisect
+import threading
+import time
+import json
+import os
+from datetime import date
+from pathlib import Path
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class SenderAccount:
+    """Tek bir SMTP gönderici hesabı (bağlantı havuzu + rate limit + sağlık durumu)"""
+
+    def __init__(self, email: str, password: str,
+                 server: str = "smtp.office365.com", port: int = 587,
+                 per_minute_limit: int = 30, daily_limit: int = 10000,
+                 pool_size: int = 1, failure_threshold: int = 3,
+                 cooldown_seconds: int = 300, timeout: float = 30.0):
+        self.email = email
+        self.password = password
+        self.server = server
+        self.port = port
+        self.per_minute_limit = per_minute_limit
+        self.daily_limit = daily_limit
+        self.pool_size = max(1, pool_size)
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        # SMTP soket zaman aşımı; havuzda boş bağlantı beklerken de üst sınır
+        self.timeout = timeout
+
+        # Rate limit durumu
+        self._min_interval = 60.0 / per_minute_limit if per_minute_limit > 0 else 0.0
+        self._next_slot = 0.0
+        self._sent_today = 0
+        self._day = date.today()
+        self._rate_lock = threading.Lock()
+
+        # Bağlantı havuzu (boştaki bağlantılar LIFO; bozulan bağlantılar da bekleyenleri uyandırır)
+        self._idle = []
+        self._open_count = 0
+        self._pool_cond = threading.Condition()
+
+        # Sağlık durumu (failover için)
+        self.consecutive_failures = 0
+        self.disabled_until = 0.0
+
+        # Sunucu 8BITMIME destekliyor mu (ilk bağlantıda öğrenilir, o zamana kadar None)
+        self.supports_8bitmime = None
+
+    def __repr__(self) -> str:
+        return f"SenderAccount({self.email})"
+
+    @property
+    def has_credentials(self) -> bool:
+        return bool(self.email and self.password)
+
+    @property
+    def send_interval(self) -> float:
+        """Rate limit'e göre iki gönderim arasındaki en kısa süre (saniye)"""
+        return self._min_interval
+
+    def _open_connection(self) -> "smtplib.SMTP":
+        """Yeni bir SMTP bağlantısı aç ve oturum aç"""
+        import smtplib
+        server = smtplib.SMTP(self.server, self.port, timeout=self.timeout)
+        try:
+            server.starttls()
+            server.login(self.email, self.password)
+        except Exception:
+            server.close()
+            raise
+        self.supports_8bitmime = server.has_extn("8bitmime")
+        return server
+
+    def acquire(self) -> "smtplib.SMTP":
+        """
+        Havuzdan bir bağlantı al (gerekirse yenisini aç)
+
+        Havuz doluysa boşa çıkan bağlantı veya kapanan bir bağlantının yeri
+        en fazla timeout saniye beklenir.
+
+        Raises:
+            TimeoutError: Süre içinde bağlantı alınamadı
+        """
+        deadline = time.monotonic() + self.timeout
+        with self._pool_cond:
+            while True:
+                if self._idle:
+                    return self._idle.pop()
+                if self._open_count < self.pool_size:
+                    self._open_count += 1
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(f"{self.email} bağlantı havuzunda {self.timeout:g} saniye boş bağlantı beklendi")
+                self._pool_cond.wait(remaining)
+
+        try:
+            return self._open_connection()
+        except Exception:
+            self._discard_slot()
+            raise
+
+    def _discard_slot(self):
+        """Açık bağlantı sayısını azalt ve bekleyen bir thread'i uyandır"""
+        with self._pool_cond:
+            self._open_count -= 1
+            self._pool_cond.notify()
+
+    def release(self, server: "smtplib.SMTP", broken: bool = False):
+        """Bağlantıyı havuza geri bırak (bozuksa kapat)"""
+        if not broken:
+            with self._pool_cond:
+                self._idle.append(server)
+                self._pool_cond.notify()
+            return
+
+        try:
+            server.close()
+        except Exception:
+            pass
+        self._discard_slot()
+
+    def send_message(self, msg, mail_options: tuple = ()) -> None:
+        """Mesajı havuzdaki bir bağlantı üzerinden gönder (ör. mail_options=("BODY=8BITMIME",))"""
+        server = self.acquire()
+        try:
+            server.send_message(msg, mail_options=mail_options)
+        except Exception as e:
+            if not _is_connection_error(e):
+                self.release(server)
+                raise
+            # Bağlantı kopmuş olabilir, bir kez yeni bağlantı ile dene
+            self.release(server, broken=True)
+            server = self.acquire()
+            try:
+                server.send_message(msg, mail_options=mail_options)
+            except Exception as e:
+                self.release(server, broken=_is_connection_error(e))
+                raise
+        self.release(server)
+
+    def test(self) -> None:
+        """Hesap bilgileriyle bağlantıyı test et (hata varsa exception fırlatır)"""
+        server = self._open_connection()
+        try:
+            server.quit()
+        except Exception:
+            server.close()
+
+    def wait_for_slot(self) -> bool:
+        """
+        Rate limit'e göre sıradaki gönderim zamanını bekle
+
+        Günlük limit kontrolü ve sayaç artışı aynı kilit altında yapılır;
+        eşzamanlı gönderimler limiti aşamaz.
+
+        Returns:
+            bool: False ise günlük limit dolmuştur, gönderim yapılmamalıdır
+        """
+        with self._rate_lock:
+            today = date.today()
+            if today != self._day:
+                self._day = today
+                self._sent_today = 0
+            if self._sent_today >= self.daily_limit:
+                return False
+            self._sent_today += 1
+
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self._min_interval
+
+        if slot > now:
+            time.sleep(slot - now)
+        return True
+
+    def daily_limit_reached(self) -> bool:
+        return date.today() == self._day and self._sent_today >= self.daily_limit
+
+    def is_available(self) -> bool:
+        """Hesap şu anda gönderim yapabilir mi (cooldown ve günlük limit)"""
+        if time.monotonic() < self.disabled_until:
+            return False
+        if self.daily_limit_reached():
+            return False
+        return True
+
+    def record_success(self):
+        self.consecutive_failures = 0
+
+    def record_failure(self):
+        """Hesap kaynaklı hatayı kaydet, eşik aşılırsa hesabı geçici olarak devre dışı bırak"""
+        self.consecutive_failures += 1
+        if self.consecutive_failures >= self.failure_threshold:
+            self.disabled_until = time.monotonic() + self.cooldown_seconds
+            logger.warning(
+                f"⚠️  {self.email} art arda {self.consecutive_failures} kez başarısız oldu, "
+                f"{self.cooldown_seconds} saniye devre dışı"
+            )
+
+    def close(self):
+        """Boştaki tüm bağlantıları kapat"""
+        with self._pool_cond:
+            idle, self._idle = self._idle, []
+        for server in idle:
+            try:
+                server.quit()
+            except Exception:
+                server.close()
+            self._discard_slot()
+
+
+class SenderPool:
+    """Gönderici hesaplarını alıcıya göre consistent hashing ile seçen havuz"""
+
+    def __init__(self, accounts: list, virtual_nodes: int = 100):
+        if not accounts:
+            raise ValueError("En az bir gönderici hesabı gerekli")
+
+        self.accounts = accounts
+        self._ring = []
+        for account_index, account in enumerate(accounts):
+            for i in range(virtual_nodes):
+                self._ring.append((_hash_key(f"{account.email}#{i}"), account_index))
+        self._ring.sort()
+        self._ring_keys = [key for key, _ in self._ring]
+
+    def candidates(self, recipient: str) -> list:
+        """Alıcı için hesapları ring sırasına göre döndür (ilki birincil hesap)"""
+        if len(self.accounts) == 1:
+            return list(self.accounts)
+
+        start = bisect.bisect(self._ring_keys, _hash_key(recipient.strip().lower()))
+        ordered = []
+        seen = set()
+        for offset in range(len(self._ring)):
+            _, account_index = self._ring[(start + offset) % len(self._ring)]
+            if account_index not in seen:
+                seen.add(account_index)
+                ordered.append(self.accounts[account_index])
+                if len(ordered) == len(self.accounts):
+                    break
+        return ordered
+
+    def primary(self, recipient: str) -> SenderAccount:
+        """Alıcının birincil gönderici hesabı"""
+        return self.candidates(recipient)[0]
+
+    def pick(self, recipient: str, exclude: set = None) -> SenderAccount:
+        """
+        Alıcı için kullanılabilir ilk hesabı seç
+
+        Birincil hesap devre dışıysa ring üzerindeki sıradaki hesaba geçilir (failover).
+        Günlük limiti dolan hesaplar hiç seçilmez; hepsi dolduysa None döner.
+        Kalan hesapların hiçbiri kullanılabilir değilse (cooldown) dışlanmamış ilk hesap döner.
+        """
+        exclude = exclude or set()
+        candidates = [acc for acc in self.candidates(recipient) if not acc.daily_limit_reached()]
+        if not candidates:
+            return None
+        remaining = [acc for acc in candidates if acc.email not in exclude]
+        if not remaining:
+            return candidates[0]
+
+        for account in remaining:
+            if account.is_available():
+                return account
+        return remaining[0]
+
+    def close(self):
+        for account in self.accounts:
+            account.close()
+
+
+def _hash_key(value: str) -> int:
+    return int.from_bytes(hashlib.md5(value.encode("utf-8")).digest()[:8], "big")
+
+
+def _is_connection_error(error: Exception) -> bool:
+    """Bağlantının yeniden kurulmasını gerektiren hata mı (SMTPException da OSError'dır)"""
+    import smtplib
+    if isinstance(error, smtplib.SMTPServerDisconnected):
+        return True
+    return isinstance(error, OSError) and not isinstance(error, smtplib.SMTPException)
+
+
+def is_account_error(error: Exception) -> bool:
+    """Hata gönderici hesabından mı kaynaklanıyor (alıcı hatası değil)"""
+    import smtplib
+    return not isinstance(error, smtplib.SMTPRecipientsRefused)
+
+
+def load_sender_accounts() -> list:
+    """
+    Gönderici hesaplarını environment variables'dan yükle
+
+    SMTP_ACCOUNTS (JSON liste) veya SMTP_ACCOUNTS_FILE (JSON dosya yolu) tanımlıysa
+    birden fazla hesap kullanılır, değilse SMTP_EMAIL/SMTP_PASSWORD tek hesap olarak alınır.
+
+    Örnek: [{"email": "a@firma.com", "password": "...", "per_minute_limit": 30}]
+    """
+    default_server = os.getenv("SMTP_SERVER", "smtp.office365.com")
+    default_port = int(os.getenv("SMTP_PORT", "587"))
+    defaults = {
+        "per_minute_limit": int(os.getenv("SMTP_RATE_PER_MINUTE", "30")),
+        "daily_limit": int(os.getenv("SMTP_DAILY_LIMIT", "10000")),
+        "pool_size": int(os.getenv("SMTP_POOL_SIZE", "1")),
+        "timeout": float(os.getenv("SMTP_TIMEOUT", "30")),
+    }
+
+    raw_accounts = None
+    if os.getenv("SMTP_ACCOUNTS"):
+        raw_accounts = json.loads(os.getenv("SMTP_ACCOUNTS"))
+    elif os.getenv("SMTP_ACCOUNTS_FILE"):
+        with open(Path(os.getenv("SMTP_ACCOUNTS_FILE")), "r", encoding="utf-8") as f:
+            raw_accounts = json.load(f)
+
+    if not raw_accounts:
+        return [SenderAccount(
+            email=os.getenv("SMTP_EMAIL", ""),
+            password=os.getenv("SMTP_PASSWORD", ""),
+            server=default_server,
+            port=default_port,
+            **defaults
+        )]
+
+    accounts = []
+    for item in raw_accounts:
+        accounts.append(SenderAccount(
+            email=item["email"],
+            password=item["password"],
+            server=item.get("server", default_server),
+            port=int(item.get("port", default_port)),
+            per_minute_limit=int(item.get("per_minute_limit", defaults["per_minute_limit"])),
+            daily_limit=int(item.get("daily_limit", defaults["daily_limit"])),
+            pool_size=int(item.get("pool_size", defaults["pool_size"])),
+            timeout=float(item.get("timeout", defaults["timeout"]))
+        ))
+
+    logger.info(f"📮 {len(accounts)} gönderici hesabı yüklendi")
+    return accounts
@@ -0,0 +1,188 @@
+"""
+Suppression List Module
+Kalıcı olarak mail alamayan alıcıların (silinmiş posta kutusu, geçersiz adres)
+listesi. SMTP sunucusu alıcıyı 5xx ile kalıcı olarak reddettiğinde adres
+listeye eklenir; sonraki gönderimler SMTP'ye bağlanmadan "Engellendi"
+durumuyla raporlanır.
+
+Liste data/engellenen_alicilar.json dosyasında tutulur ve bellekte dict
+olarak aranır. Kayıtlar SUPPRESSION_TTL_DAYS gün sonra (0 ise hiçbir zaman)
+düşer; manuel silmek için:
+    python src/main.py --unsuppress yonetici@firma.com
+"""
+
+import json
+import os
+import re
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Alıcı adresiyle ilgili kalıcı hatalar (RFC 3463 X.1.X: hatalı hedef adres)
+_ADDRESS_STATUS_PATTERN = re.compile(r"\b5\.1\.\d+\b")
+
+# Rapordaki Hata Mesajı sütunu: str(SMTPRecipientsRefused) -> "{'a@b.com': (550, b'5.1.1 ...')}"
+_REFUSED_MESSAGE_PATTERN = re.compile(r"""^\{'([^']+)': \((5\d\d), b?['"](.*)['"]\)\}$""", re.DOTALL)
+
+
+def permanent_failure(error: Exception):
+    """
+    Hata alıcının kalıcı olarak reddedildiğini mi gösteriyor
+
+    RCPT TO aşamasındaki her 5xx yanıtı ve DATA aşamasında adres hatası
+    (5.1.x) bildiren 5xx yanıtları kalıcı sayılır. Hesap/kimlik hataları
+    (535 gibi) alıcıyla ilgili olmadığından sayılmaz.
+
+    Returns:
+        tuple: (kod, mesaj) veya kalıcı değilse None
+    """
+    import smtplib
+
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        for code, message in error.recipients.values():
+            if 500 <= code < 600:
+                return code, _decode(message)
+        return None
+    if isinstance(error, smtplib.SMTPDataError) and 500 <= error.smtp_code < 600:
+        message = _decode(error.smtp_error)
+        if _ADDRESS_STATUS_PATTERN.search(message):
+            return error.smtp_code, message
+    return None
+
+
+def _decode(message) -> str:
+    return message.decode("utf-8", "replace") if isinstance(message, bytes) else str(message)
+
+
+class SuppressionList:
+    """Kalıcı hata alan alıcıların listesi"""
+
+    def __init__(self, path: str = None, ttl_days: int = None):
+        """
+        Args:
+            path: Liste dosyası (None ise SUPPRESSION_FILE veya data/engellenen_alicilar.json)
+            ttl_days: Kaydın geçerlilik süresi (None ise SUPPRESSION_TTL_DAYS veya 30; 0 ise süresiz)
+        """
+        self.path = Path(path or os.getenv("SUPPRESSION_FILE", "data/engellenen_alicilar.json"))
+        self.ttl_days = ttl_days if ttl_days is not None else int(os.getenv("SUPPRESSION_TTL_DAYS", "30"))
+        self._lock = threading.Lock()
+        self._entries = self._load()
+        self._removed = set()
+
+    def _load(self) -> dict:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f).get("alicilar", {})
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"⚠️  Engel listesi okunamadı: {str(e)}")
+            return {}
+
+    def _save(self):
+        # Aynı dosyayı kullanan başka süreçlerin eklediği kayıtlar kaybolmasın
+        entries = self._load()
+        entries.update(self._entries)
+        for email in self._removed:
+            entries.pop(email, None)
+        now = datetime.now().isoformat(timespec="seconds")
+        entries = {email: entry for email, entry in entries.items() if not entry["bitis"] or entry["bitis"] > now}
+        self._entries = entries
+        self._removed = set()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump({"alicilar": entries}, f, ensure_ascii=False, indent=2)
+        tmp_file.replace(self.path)
+
+    def get(self, email: str):
+        """Alıcı engelliyse kaydını, değilse None döndür"""
+        entry = self._entries.get(email.strip().lower())
+        if entry is None:
+            return None
+        if entry["bitis"] and entry["bitis"] <= datetime.now().isoformat(timespec="seconds"):
+            return None
+        return entry
+
+    def is_suppressed(self, email: str) -> bool:
+        return self.get(email) is not None
+
+    def _put(self, email: str, code: int, reason: str, added_at: datetime) -> bool:
+        expires_at = added_at + timedelta(days=self.ttl_days) if self.ttl_days > 0 else None
+        if expires_at is not None and expires_at <= datetime.now():
+            return False
+        email = email.strip().lower()
+        if self.get(email) is not None:
+            return False
+        self._entries[email] = {
+            "kod": code,
+            "neden": reason,
+            "eklenme": added_at.isoformat(timespec="seconds"),
+            "bitis": expires_at.isoformat(timespec="seconds") if expires_at else None
+        }
+        self._removed.discard(email)
+        return True
+
+    def add(self, email: str, code: int, reason: str) -> bool:
+        """
+        Alıcıyı listeye ekle ve dosyaya yaz
+
+        Returns:
+            bool: Yeni eklendiyse True (zaten engelliyse False)
+        """
+        with self._lock:
+            if not self._put(email, code, reason, datetime.now()):
+                return False
+            try:
+                self._save()
+            except OSError as e:
+                logger.warning(f"⚠️  Engel listesi yazılamadı: {str(e)}")
+        logger.warning(f"⛔ Alıcı engel listesine eklendi: {email} ({code} {reason})")
+        return True
+
+    def remove(self, email: str) -> bool:
+        """Alıcıyı listeden çıkar ("all" ise tüm listeyi temizle)"""
+        with self._lock:
+            if email == "all":
+                removed = bool(self._entries)
+                self._removed = set(self._entries) | set(self._load())
+                self._entries = {}
+            else:
+                email = email.strip().lower()
+                removed = self._entries.pop(email, None) is not None
+                self._removed = self._removed | {email}
+            self._save()
+        return removed
+
+    def entries(self) -> dict:
+        """Süresi dolmamış kayıtlar"""
+        return {email: entry for email, entry in self._entries.items() if self.get(email) is not None}
+
+    def import_report_failures(self, rows) -> int:
+        """
+        Rapordaki kalıcı alıcı hatalarını listeye ekle (ör. mevcut geçmişten ilk kurulum)
+
+        Args:
+            rows: Rapor kayıtları (REPORT_HEADINGS anahtarlı dict'ler)
+
+        Returns:
+            int: Eklenen alıcı sayısı
+        """
+        latest = {}
+        for row in rows:
+            match = _REFUSED_MESSAGE_PATTERN.match(row.get("Hata Mesajı") or "")
+            if match:
+                added_at = datetime.fromisoformat(f"{row['Gönderim Tarihi']}T{row['Gönderim Saati']}")
+                email = match.group(1).strip().lower()
+                if email not in latest or latest[email][2] < added_at:
+                    latest[email] = (int(match.group(2)), match.group(3), added_at)
+
+        with self._lock:
+            added = sum(self._put(email, *failure) for email, failure in latest.items())
+            if added:
+                self._save()
+        return added
@@ -0,0 +1,445 @@
+"""
+Work Queue Module
+Gönderilecek hatırlatmaları SQLite tabanlı, lease'li bir iş kuyruğunda tutar.
+Birden fazla worker süreci (aynı makinede veya kuyruk dosyasını paylaşan
+makinelerde) işleri süreli lease ile sahiplenir, gönderir ve sonucu yazar.
+
+Durumlar:
+    bekliyor -> gonderiliyor (lease) -> gonderildi / basarisiz / engellendi
+
+Çift gönderimi önleme:
+    - Sahiplenme BEGIN IMMEDIATE transaction'ı içinde yapılır; bir iş aynı anda
+      yalnızca bir worker'a verilir.
+    - Her sahiplenmede yeni bir lease token üretilir. Worker her gönderimden
+      önce lease'inin yarısından fazlasının kaldığını kontrol eder, kalmadıysa
+      lease'ini yeniler; lease'i düşmüşse (başka worker almışsa) göndermez.
+      Sonuç yalnızca token hâlâ geçerliyse yazılır (fencing). Makineler arası
+      saat farkı lease süresinin yarısından küçük olmalıdır.
+    - Lease'i dolan iş tekrar sahiplenilebilir. Worker SMTP kabulünden sonra,
+      sonucu yazamadan çökerse iş tekrar gönderilebilir (en az bir kez). Bu
+      durumda aynı Message-ID kullanıldığı için alıcı tarafı tekrarı ayırt edebilir.
+    - Retry beklemeleri dahil tek bir gönderim uzun sürebilir; worker her
+      yeniden denemeden önce de lease'i kontrol edip gerekirse yeniler.
+
+Günlük işler:
+    Worker'lar yalnızca kendi günlerinin işlerini sahiplenir. enqueue, önceki
+    günlerden kalan açık işleri başarısız olarak kapatır; bayat hatırlatma
+    günler sonra gönderilmez, --collect ile rapora başarısız olarak işlenir.
+"""
+
+import json
+import os
+import socket
+import sqlite3
+import time
+import uuid
+from datetime import date, datetime
+from pathlib import Path
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+BEKLIYOR = "bekliyor"
+GONDERILIYOR = "gonderiliyor"
+GONDERILDI = "gonderildi"
+BASARISIZ = "basarisiz"
+ENGELLENDI = "engellendi"
+
+# EmailSender sonucu -> kuyruk durumu
+_DURUM_BY_STATUS = {"sent": GONDERILDI, "suppressed": ENGELLENDI}
+
+
+def _encode(value: dict) -> str:
+    return json.dumps(
+        value, ensure_ascii=False,
+        default=lambda v: v.isoformat() if isinstance(v, (datetime, date)) else str(v)
+    )
+
+
+def _decode_reminder(payload: str) -> dict:
+    reminder = json.loads(payload)
+    reminder["baslangic_tarihi"] = datetime.fromisoformat(reminder["baslangic_tarihi"])
+    return reminder
+
+
+def default_worker_id() -> str:
+    """host:pid biçiminde worker kimliği"""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class WorkQueue:
+    """
+    Lease tabanlı gönderim kuyruğu
+
+    Args:
+        db_path: Kuyruk dosyası (worker'lar arasında paylaşılır)
+        lease_seconds: Sahiplenilen işin başka worker'a verilmeden önce bekleyeceği süre
+        max_claims: Lease'i dolan bir işin en fazla kaç kez sahiplenilebileceği
+        journal_mode: SQLite journal modu. WAL yalnızca aynı makinedeki süreçler
+            için uygundur; paylaşılan ağ klasöründe DELETE kullanılmalıdır.
+    """
+
+    def __init__(self, db_path: str = None, lease_seconds: float = None, max_claims: int = 3,
+                 journal_mode: str = None):
+        self.db_path = Path(db_path or os.getenv("WORK_QUEUE_DB", "data/gonderim_kuyrugu.db"))
+        self.lease_seconds = lease_seconds if lease_seconds is not None \
+            else float(os.getenv("WORK_LEASE_SECONDS", "300"))
+        self.max_claims = max_claims
+        journal_mode = (journal_mode or os.getenv("WORK_QUEUE_JOURNAL_MODE", "WAL")).upper()
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # isolation_level=None: transaction'lar açıkça BEGIN IMMEDIATE ile yönetilir
+        self._conn = sqlite3.connect(str(self.db_path), timeout=60, isolation_level=None)
+        self._conn.execute(f"PRAGMA journal_mode={journal_mode}")
+        if journal_mode == "WAL":
+            # Commit başına fsync yok; elektrik kesintisinde son sonuçlar kaybolursa
+            # işler tekrar sahiplenilir (en az bir kez gönderim zaten garanti)
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA busy_timeout=60000")
+        self._create_schema()
+
+    def _create_schema(self):
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS is_kuyrugu (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                gun TEXT NOT NULL,
+                ihale_no INTEGER NOT NULL,
+                hatirlatma_tipi TEXT NOT NULL,
+                hatirlatma TEXT NOT NULL,
+                durum TEXT NOT NULL DEFAULT 'bekliyor',
+                worker TEXT,
+                lease_token TEXT,
+                lease_until REAL,
+                sahiplenme INTEGER NOT NULL DEFAULT 0,
+                sonuc TEXT,
+                islendi INTEGER NOT NULL DEFAULT 0,
+                UNIQUE (gun, ihale_no, hatirlatma_tipi)
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS kuyruk_durum ON is_kuyrugu (durum, lease_until)")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS kuyruk_meta (
+                anahtar TEXT PRIMARY KEY,
+                deger TEXT
+            )
+        """)
+
+    def _transaction(self):
+        return _ImmediateTransaction(self._conn)
+
+    def enqueue(self, reminders: list, gun: date) -> int:
+        """
+        Günün hatırlatmalarını kuyruğa ekle
+
+        Aynı gün aynı hatırlatma tekrar eklenmez; daha önce başarısız olmuş
+        kayıt tekrar beklemeye alınır.
+
+        Returns:
+            int: Eklenen veya tekrar beklemeye alınan kayıt sayısı
+        """
+        gun = gun.isoformat()
+        changed = 0
+        with self._transaction():
+            expired = self._conn.execute(
+                """
+                UPDATE is_kuyrugu SET durum = 'basarisiz', lease_token = NULL, lease_until = NULL,
+                    sonuc = ?
+                WHERE gun < ? AND (durum = 'bekliyor' OR (durum = 'gonderiliyor' AND lease_until < ?))
+                """,
+                (json.dumps({"error_message": "Gününde gönderilmedi, süresi geçti"}), gun, time.time())
+            ).rowcount
+            if expired:
+                logger.warning(f"⚠️  Önceki günlerden kalan {expired} iş gönderilmeden kapatıldı")
+            for reminder in reminders:
+                payload = dict(reminder)
+                payload["message_id"] = (
+                    f"<{gun}.{reminder['ihale_no']}.{reminder['hatirlatma_tipi']}@ihale-hatirlatma>"
+                )
+                cursor = self._conn.execute(
+                    """
+                    INSERT INTO is_kuyrugu (gun, ihale_no, hatirlatma_tipi, hatirlatma)
+                    VALUES (?, ?, ?, ?)
+                    ON CONFLICT (gun, ihale_no, hatirlatma_tipi) DO UPDATE SET
+                        durum = 'bekliyor', hatirlatma = excluded.hatirlatma,
+                        sahiplenme = 0, sonuc = NULL, islendi = 0,
+                        worker = NULL, lease_token = NULL, lease_until = NULL
+                    WHERE durum = 'basarisiz' AND islendi = 1
+                    """,
+                    (gun, int(reminder["ihale_no"]), reminder["hatirlatma_tipi"], _encode(payload))
+                )
+                changed += cursor.rowcount
+        return changed
+
+    def set_meta(self, key: str, value):
+        self._conn.execute(
+            "INSERT OR REPLACE INTO kuyruk_meta (anahtar, deger) VALUES (?, ?)", (key, json.dumps(value))
+        )
+
+    def get_meta(self, key: str, default=None):
+        row = self._conn.execute("SELECT deger FROM kuyruk_meta WHERE anahtar = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else default
+
+    def claim(self, worker_id: str, gun: date, limit: int = 10) -> tuple:
+        """
+        Günün bekleyen veya lease'i dolmuş işlerini sahiplen
+
+        Returns:
+            tuple: (lease_token, [(id, hatirlatma), ...])
+        """
+        token = uuid.uuid4().hex
+        now = time.time()
+        with self._transaction():
+            # Çok kez sahiplenilip tamamlanamayan işler başarısız sayılır
+            self._conn.execute(
+                """
+                UPDATE is_kuyrugu SET durum = 'basarisiz', lease_token = NULL, lease_until = NULL,
+                    sonuc = ?
+                WHERE durum = 'gonderiliyor' AND lease_until < ? AND sahiplenme >= ?
+                """,
+                (json.dumps({"error_message": "Lease süresi tekrar tekrar doldu"}), now, self.max_claims)
+            )
+            rows = self._conn.execute(
+                """
+                SELECT id, hatirlatma FROM is_kuyrugu
+                WHERE gun = ? AND (durum = 'bekliyor' OR (durum = 'gonderiliyor' AND lease_until < ?))
+                ORDER BY id LIMIT ?
+                """,
+                (gun.isoformat(), now, limit)
+            ).fetchall()
+            if rows:
+                self._conn.executemany(
+                    """
+                    UPDATE is_kuyrugu SET durum = 'gonderiliyor', worker = ?, lease_token = ?,
+                        lease_until = ?, sahiplenme = sahiplenme + 1
+                    WHERE id = ?
+                    """,
+                    [(worker_id, token, now + self.lease_seconds, row[0]) for row in rows]
+                )
+        return token, [(row[0], _decode_reminder(row[1])) for row in rows]
+
+    def renew(self, token: str) -> set:
+        """
+        Token'ın elindeki işlerin lease'ini uzat
+
+        Returns:
+            set: Lease'i hâlâ geçerli olan iş id'leri
+        """
+        now = time.time()
+        with self._transaction():
+            self._conn.execute(
+                """
+                UPDATE is_kuyrugu SET lease_until = ?
+                WHERE lease_token = ? AND durum = 'gonderiliyor' AND lease_until >= ?
+                """,
+                (now + self.lease_seconds, token, now)
+            )
+            rows = self._conn.execute(
+                "SELECT id FROM is_kuyrugu WHERE lease_token = ? AND durum = 'gonderiliyor' AND lease_until >= ?",
+                (token, now)
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def complete(self, job_id: int, token: str, result: dict) -> bool:
+        """
+        Gönderim sonucunu yaz (yalnızca lease hâlâ bu token'daysa)
+
+        Returns:
+            bool: Sonuç yazıldı mı
+        """
+        durum = _DURUM_BY_STATUS.get(result["status"], BASARISIZ)
+        with self._transaction():
+            cursor = self._conn.execute(
+                """
+                UPDATE is_kuyrugu SET durum = ?, sonuc = ?, lease_token = NULL, lease_until = NULL
+                WHERE id = ? AND lease_token = ? AND durum = 'gonderiliyor'
+                """,
+                (durum, _encode(result), job_id, token)
+            )
+        return cursor.rowcount == 1
+
+    def release(self, token: str):
+        """Gönderilmemiş işleri bırak (worker kapanırken)"""
+        with self._transaction():
+            self._conn.execute(
+                """
+                UPDATE is_kuyrugu SET durum = 'bekliyor', worker = NULL, lease_token = NULL,
+                    lease_until = NULL, sahiplenme = MAX(sahiplenme - 1, 0)
+                WHERE lease_token = ? AND durum = 'gonderiliyor'
+                """,
+                (token,)
+            )
+
+    def next_lease_expiry(self, gun: date):
+        """Günün bekleyen işi yoksa en yakın lease bitiş zamanı (iş de lease de yoksa None)"""
+        row = self._conn.execute(
+            """
+            SELECT SUM(durum = 'bekliyor'), MIN(CASE WHEN durum = 'gonderiliyor' THEN lease_until END)
+            FROM is_kuyrugu WHERE gun = ?
+            """,
+            (gun.isoformat(),)
+        ).fetchone()
+        if row[0]:
+            return time.time()
+        return row[1]
+
+    def finished(self) -> list:
+        """
+        Sonucu yazılmış ama rapora/takvime işlenmemiş kayıtlar
+
+        Returns:
+            list: (id, hatirlatma, sonuc) listesi
+        """
+        rows = self._conn.execute(
+            """
+            SELECT id, hatirlatma, sonuc FROM is_kuyrugu
+            WHERE durum IN ('gonderildi', 'basarisiz', 'engellendi') AND islendi = 0
+            ORDER BY id
+            """
+        ).fetchall()
+        finished = []
+        for job_id, reminder, result in rows:
+            reminder = _decode_reminder(reminder)
+            result = json.loads(result) if result else {}
+            if "timestamp" in result:
+                result["timestamp"] = datetime.fromisoformat(result["timestamp"])
+            else:
+                # Lease'i tekrar tekrar dolan iş: sonuç worker'dan gelmedi
+                result = {
+                    "ihale_no": reminder["ihale_no"], "ihale_adi": reminder["ihale_adi"],
+                    "recipient": reminder["yonetici_mail"], "sender": None, "status": "failed",
+                    "timestamp": datetime.now(), "error_message": result.get("error_message"),
+                    "retry_count": 0, "latency": None
+                }
+            finished.append((job_id, reminder, result))
+        return finished
+
+    def mark_processed(self, job_ids: list):
+        with self._transaction():
+            self._conn.executemany("UPDATE is_kuyrugu SET islendi = 1 WHERE id = ?", [(i,) for i in job_ids])
+
+    def counts(self, gun: date = None) -> dict:
+        """Durum başına iş sayısı"""
+        query = "SELECT durum, COUNT(*) FROM is_kuyrugu"
+        params = ()
+        if gun is not None:
+            query += " WHERE gun = ?"
+            params = (gun.isoformat(),)
+        counts = {BEKLIYOR: 0, GONDERILIYOR: 0, GONDERILDI: 0, BASARISIZ: 0, ENGELLENDI: 0}
+        counts.update(dict(self._conn.execute(query + " GROUP BY durum", params).fetchall()))
+        return counts
+
+    def close(self):
+        self._conn.close()
+
+
+class _ImmediateTransaction:
+    """Yazma kilidini baştan alan transaction (iki worker aynı işi seçemez)"""
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+
+    def __enter__(self):
+        self.conn.execute("BEGIN IMMEDIATE")
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb):
+        self.conn.execute("ROLLBACK" if exc_type else "COMMIT")
+        return False
+
+
+class QueueWorker:
+    """
+    Kuyruktan iş sahiplenip gönderen worker
+
+    Args:
+        queue: WorkQueue
+        sender: EmailSender (retry ve failover send_one ile yapılır)
+        gun: Sahiplenilecek işlerin günü (varsayılan bugün)
+        worker_id: Worker kimliği (varsayılan host:pid)
+        batch_size: Tek seferde sahiplenilecek iş sayısı
+        poll_interval: Başka worker'ların lease'leri beklenirken en uzun bekleme (saniye)
+    """
+
+    def __init__(self, queue: WorkQueue, sender, worker_id: str = None, batch_size: int = 10,
+                 poll_interval: float = 0.5, gun: date = None):
+        self.queue = queue
+        self.sender = sender
+        self.gun = gun or date.today()
+        self.worker_id = worker_id or default_worker_id()
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+
+    def run(self) -> dict:
+        """Kuyruk boşalana kadar çalış (başka worker'ların lease'leri de bitene kadar bekler)"""
+        stats = {"sent": 0, "failed": 0, "suppressed": 0, "lost_lease": 0}
+        logger.info(f"👷 Worker başladı: {self.worker_id} ({self.gun})")
+        self._check_lease_budget()
+
+        try:
+            while True:
+                claimed_at = time.time()
+                token, jobs = self.queue.claim(self.worker_id, self.gun, self.batch_size)
+                if not jobs:
+                    expiry = self.queue.next_lease_expiry(self.gun)
+                    if expiry is None:
+                        break
+                    time.sleep(min(self.poll_interval, max(expiry - time.time(), 0.05)))
+                    continue
+
+                try:
+                    self._process(token, jobs, claimed_at, stats)
+                except BaseException:
+                    # Gönderilmemiş işleri lease süresini beklemeden başka worker'lara bırak
+                    self.queue.release(token)
+                    raise
+        finally:
+            self.sender.close()
+
+        logger.info(
+            f"👷 Worker bitti: {self.worker_id} - {stats['sent']} başarılı, {stats['failed']} başarısız, "
+            f"{stats['suppressed']} engellendi, "
+            f"{stats['lost_lease']} lease kaybı"
+        )
+        return stats
+
+    def _check_lease_budget(self):
+        """Tek bir deneme ve retry beklemesi lease'in yarısına sığmıyorsa uyar"""
+        timeouts = [getattr(account, "timeout", 0) for account in getattr(self.sender.pool, "accounts", [])]
+        budget = max(self.sender.retry_delays, default=0) + max(timeouts, default=0)
+        if budget > self.queue.lease_seconds / 2:
+            logger.warning(
+                f"⚠️  WORK_LEASE_SECONDS ({self.queue.lease_seconds:g}) en uzun retry beklemesi ve SMTP "
+                f"zaman aşımının ({budget:g} saniye) iki katından kısa; lease gönderim sırasında dolabilir"
+            )
+
+    def _holds_lease(self, token: str, job_id: int) -> bool:
+        """
+        İşin lease'i hâlâ bu worker'da mı
+
+        Lease'in yarısından fazlası kaldıysa iş başka worker'a verilemez;
+        süre azaldıysa veritabanından yenilenir.
+        """
+        lease = self.queue.lease_seconds
+        if time.time() > self._lease_deadline - lease / 2:
+            renewed_at = time.time()
+            self._held = self.queue.renew(token)
+            self._lease_deadline = renewed_at + lease
+        return job_id in self._held
+
+    def _process(self, token: str, jobs: list, claimed_at: float, stats: dict):
+        self._lease_deadline = claimed_at + self.queue.lease_seconds
+        self._held = {job_id for job_id, _ in jobs}
+        for job_id, reminder in jobs:
+            if not self._holds_lease(token, job_id):
+                stats["lost_lease"] += 1
+                logger.warning(f"⚠️  Lease kaybedildi, gönderilmiyor: iş {job_id} (ihale {reminder['ihale_no']})")
+                continue
+
+            # Retry beklemeleri lease'i aşabilir: her yeniden denemeden önce kontrol et
+            result = self.sender.send_one(reminder, before_retry=lambda: self._holds_lease(token, job_id))
+            if self.queue.complete(job_id, token, result):
+                stats[result["status"] if result["status"] in stats else "failed"] += 1
+            else:
+                stats["lost_lease"] += 1
+                logger.warning(f"⚠️  Sonuç yazılamadı, lease süresi gönderim sırasında doldu: iş {job_id}")